@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+#  Run from a checkout, with the unit-tests' synthetic NITF builder
+REPO_ROOT = os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' )
+sys.path.insert( 0, REPO_ROOT )
+sys.path.insert( 0, os.path.join( REPO_ROOT, 'test' ) )
+
+#  Terminus Libraries
+from tmns.nitf.core import ( load_nitf,
+                             load_nitfs )
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           build_tre,
+                           write_nitf )
+
+
+def parse_command_line():
+
+    parser = argparse.ArgumentParser( description = 'Benchmark loading a corpus of NITF files serially and with load_nitfs' )
+
+    parser.add_argument( '-n', '--number',
+                         dest = 'number',
+                         type = int,
+                         default = 2000,
+                         help = 'Number of files in the corpus.' )
+
+    parser.add_argument( '-j', '--workers',
+                         dest = 'workers',
+                         type = int,
+                         default = os.cpu_count(),
+                         help = 'Number of workers.' )
+
+    return parser.parse_args()
+
+
+def run( name, paths, loader ):
+
+    start = time.perf_counter()
+    count = 0
+    for _ in loader( paths ):
+        count += 1
+    elapsed = time.perf_counter() - start
+    print( f'{name:<24} {count / elapsed:10.1f} files/s' )
+
+
+def main():
+
+    cmd_args = parse_command_line()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+
+        subheader = build_image_subheader( 64, 64, nbands = 3, imode = 'P',
+                                           ixshd = build_tre( 'BLOCKA', b'0' * 123 ) )
+        paths = []
+        for idx in range( cmd_args.number ):
+            pathname = os.path.join( temp_dir, f'bench_{idx}.ntf' )
+            write_nitf( pathname, images = [ ( subheader, bytes( 64 * 64 * 3 ) ) ] * 4 )
+            paths.append( pathname )
+
+        run( 'serial', paths,
+             lambda paths: ( load_nitf( path, metadata_only = True ) for path in paths ) )
+        run( f'threads ({cmd_args.workers})', paths,
+             lambda paths: load_nitfs( paths, workers = cmd_args.workers, metadata_only = True ) )
+        run( f'processes ({cmd_args.workers})', paths,
+             lambda paths: load_nitfs( paths, workers = cmd_args.workers, mode = 'process', metadata_only = True ) )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+#  Run from a checkout, with the unit-tests' synthetic NITF builder and the
+#  field-by-field parsers as the baseline
+REPO_ROOT = os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' )
+sys.path.insert( 0, REPO_ROOT )
+sys.path.insert( 0, os.path.join( REPO_ROOT, 'test' ) )
+
+#  Terminus Libraries
+from tmns.nitf.fhdr     import File_Header
+from tmns.nitf.imsubhdr import Image_Subheader
+from tmns.nitf.tre      import TRE_Factory
+
+#  Unit-Test Utilities
+from legacy_header_parser import ( parse_file_header,
+                                   parse_image_subheader )
+from nitf_builder         import ( build_image_subheader,
+                                   build_nitf )
+
+
+def parse_command_line():
+
+    parser = argparse.ArgumentParser( description = 'Measure memory retained by parsed headers' )
+
+    parser.add_argument( '-n', '--number',
+                         dest = 'number',
+                         type = int,
+                         default = 5000,
+                         help = 'Number of files worth of headers to keep alive.' )
+
+    parser.add_argument( '--bands',
+                         dest = 'bands',
+                         type = int,
+                         default = 3,
+                         help = 'Number of bands in the image subheader.' )
+
+    return parser.parse_args()
+
+
+def measure( name, parse, number ):
+    '''
+    Keep `number` files worth of headers from `parse()` alive, as a list of
+    entry dictionaries per file, and report the memory they retain and the
+    time to access every value twice.
+    '''
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+
+    headers = [ parse() for _ in range( number ) ]
+
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    #  Access every value twice to show the cost of repeated decoding
+    t0 = time.perf_counter()
+    for _ in range( 2 ):
+        for header_data in headers:
+            for data in header_data:
+                for k in data.keys():
+                    data[k]['data'].value()
+    t1 = time.perf_counter()
+
+    print( f'{name:<30} {retained / number / 1024:10.2f} KiB/file {1e6 * (t1 - t0) / number:10.2f} us/file' )
+
+
+def main():
+
+    cmd_args = parse_command_line()
+
+    tre_factory = TRE_Factory.default()
+
+    subheader = build_image_subheader( 1024, 1024, nbands = cmd_args.bands, imode = 'P' )
+    fhdr      = build_nitf( images = [ ( subheader, b'' ) ] )
+    fhdr      = fhdr[:len(fhdr) - len(subheader)]
+
+    def parse_lazy():
+        return ( File_Header.parse_buffer( fhdr, tre_factory = tre_factory ).data,
+                 Image_Subheader.parse_buffer( subheader, tre_factory = tre_factory ).data )
+
+    def parse_decoded():
+        output = parse_lazy()
+        for data in output:
+            for entry in data.values():
+                entry.data
+        return output
+
+    #  Baseline of 4-key dictionaries, each holding a value decoded while parsing
+    def parse_eager():
+        return ( parse_file_header( fhdr, tre_factory )[0],
+                 parse_image_subheader( subheader, tre_factory )[0] )
+
+    print( f'Headers Retained: {cmd_args.number} files' )
+    print( f'{"Layout":<30} {"Memory":>19} {"Repeated value()":>18}' )
+    measure( 'Dictionaries (baseline)', parse_eager,   cmd_args.number )
+    measure( 'Field_Entry, decoded',    parse_decoded, cmd_args.number )
+    measure( 'Field_Entry',             parse_lazy,    cmd_args.number )
+
+if __name__ == '__main__':
+    main()
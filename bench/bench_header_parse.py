@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import argparse
+import os
+import sys
+import timeit
+
+#  Run from a checkout, with the unit-tests' synthetic NITF builder and the
+#  field-by-field parsers as the baseline
+REPO_ROOT = os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' )
+sys.path.insert( 0, REPO_ROOT )
+sys.path.insert( 0, os.path.join( REPO_ROOT, 'test' ) )
+
+#  Terminus Libraries
+from tmns.nitf.fhdr     import File_Header
+from tmns.nitf.imsubhdr import Image_Subheader
+from tmns.nitf.tre      import TRE_Factory
+
+#  Unit-Test Utilities
+from legacy_header_parser import ( parse_file_header,
+                                   parse_image_subheader )
+from nitf_builder         import ( build_image_subheader,
+                                   build_nitf )
+
+
+def parse_command_line():
+
+    parser = argparse.ArgumentParser( description = 'Benchmark File_Header and Image_Subheader parsing against the field-by-field parsers' )
+
+    parser.add_argument( '-n', '--number',
+                         dest = 'number',
+                         type = int,
+                         default = 2000,
+                         help = 'Number of parses per timing run.' )
+
+    parser.add_argument( '-r', '--repeat',
+                         dest = 'repeat',
+                         type = int,
+                         default = 5,
+                         help = 'Number of timing runs.  The best is reported.' )
+
+    parser.add_argument( '--bands',
+                         dest = 'bands',
+                         type = int,
+                         default = 3,
+                         help = 'Number of bands in the image subheader.' )
+
+    return parser.parse_args()
+
+
+def report( name, seconds, number ):
+    print( f'{name:<28} {1e6 * seconds / number:10.2f} us/header' )
+
+
+def main():
+
+    cmd_args = parse_command_line()
+
+    tre_factory = TRE_Factory.default()
+
+    subheader = build_image_subheader( 1024, 1024, nbands = cmd_args.bands, imode = 'P' )
+    images    = [ ( subheader, b'' ) for _ in range( 10 ) ]
+    fhdr      = build_nitf( images = images )
+    fhdr      = fhdr[:len(fhdr) - len(subheader) * len(images)]
+
+    def best( function ):
+        return min( timeit.Timer( function ).repeat( cmd_args.repeat, cmd_args.number ) )
+
+    report( 'File_Header (baseline)',     best( lambda: parse_file_header( fhdr, tre_factory ) ), cmd_args.number )
+    report( 'File_Header',                best( lambda: File_Header.parse_buffer( fhdr, tre_factory = tre_factory ) ), cmd_args.number )
+    report( 'Image_Subheader (baseline)', best( lambda: parse_image_subheader( subheader, tre_factory ) ), cmd_args.number )
+    report( 'Image_Subheader',            best( lambda: Image_Subheader.parse_buffer( subheader, tre_factory = tre_factory ) ), cmd_args.number )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import argparse
+import io
+import os
+import sys
+import time
+
+import numpy as np
+
+#  Pillow
+from PIL import Image
+
+#  Run from a checkout
+REPO_ROOT = os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' )
+sys.path.insert( 0, REPO_ROOT )
+
+#  Terminus Libraries
+from tmns.nitf.enums                import ImageCompression
+from tmns.nitf.image                import opj_driver
+from tmns.nitf.image.pil_j2k_driver import ( Pillow_J2K_Driver,
+                                             is_available )
+
+
+def parse_command_line():
+
+    parser = argparse.ArgumentParser( description = 'Benchmark JPEG 2000 decoding in memory with Pillow against opj_decompress' )
+
+    parser.add_argument( '-s', '--size',
+                         dest = 'size',
+                         type = int,
+                         default = 2048,
+                         help = 'Width and height of the test image.' )
+
+    parser.add_argument( '-n', '--number',
+                         dest = 'number',
+                         type = int,
+                         default = 5,
+                         help = 'Number of decodes per driver.' )
+
+    return parser.parse_args()
+
+
+def run( name, driver, codestream, number ):
+
+    timings = []
+    for _ in range( number ):
+        start = time.perf_counter()
+        driver.decode( ImageCompression.C8, codestream )
+        timings.append( time.perf_counter() - start )
+    print( f'{name:<24} {1000 * min( timings ):10.1f} ms (best of {number})' )
+
+
+def main():
+
+    cmd_args = parse_command_line()
+
+    #  Smooth, noisy 8-bit image, which compresses like real imagery
+    rng  = np.random.default_rng( 0 )
+    grid = np.linspace( 0, 8 * np.pi, cmd_args.size )
+    image = 127 + 60 * np.sin( grid )[:, None] * np.cos( grid )[None, :] + rng.normal( 0, 8, ( cmd_args.size, cmd_args.size ) )
+    image = np.clip( image, 0, 255 ).astype( np.uint8 )
+
+    output = io.BytesIO()
+    Image.fromarray( image ).save( output, format = 'JPEG2000', no_jp2 = True )
+    codestream = output.getvalue()
+    print( f'Codestream: {cmd_args.size}x{cmd_args.size}, {len(codestream)} bytes' )
+
+    if is_available():
+        run( 'Pillow (in memory)', Pillow_J2K_Driver(), codestream, cmd_args.number )
+    else:
+        print( 'Pillow was built without OpenJPEG' )
+
+    if opj_driver.is_available():
+        driver = opj_driver.OPJ_Driver()
+        run( 'opj_decompress', driver, codestream, cmd_args.number )
+
+        start = time.perf_counter()
+        driver.decode_many( ImageCompression.C8, [ codestream ] * cmd_args.number )
+        elapsed = time.perf_counter() - start
+        print( f'{"opj_decompress (pool)":<24} {1000 * elapsed / cmd_args.number:10.1f} ms per image, '
+               f'{driver.config["max_workers"]} workers' )
+        driver.close()
+    else:
+        print( 'opj_decompress is not installed' )
+
+
+if __name__ == '__main__':
+    main()
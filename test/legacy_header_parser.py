@@ -0,0 +1,168 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Field-by-field header parsers, as they were before the `Field_Run` parse
+plans.  They are the reference for the parse plan parity tests and the
+baseline of `bench/bench_header_parse.py`.
+
+Each returns the entries as a dictionary of position to entry, with the
+field's value decoded as it is read, and the TRE records of each extension section.
+'''
+
+#  Python Libraries
+from collections import deque
+
+#  Terminus Libraries
+from tmns.nitf.fhdr        import Field as FHDR_Field
+from tmns.nitf.field_types import FieldType
+from tmns.nitf.imsubhdr    import Field as IM_Field
+from tmns.nitf.tre         import ( TRE_Base,
+                                    TRE_Factory )
+from tmns.nitf.utils       import Buffer_Reader
+
+
+#  Segment count and the (subheader length, data length) fields which follow it
+SEGMENT_LENGTHS = { FHDR_Field.NUMI:    ( FHDR_Field.LISH_N,  FHDR_Field.LI_N ),
+                    FHDR_Field.NUMS:    ( FHDR_Field.LSSH_N,  FHDR_Field.LS_N ),
+                    FHDR_Field.NUMT:    ( FHDR_Field.LTSH_N,  FHDR_Field.LT_N ),
+                    FHDR_Field.NUMDES:  ( FHDR_Field.LDSH_N,  FHDR_Field.LD_N ),
+                    FHDR_Field.NUM_RES: ( FHDR_Field.LRESH_N, FHDR_Field.LRE_N ) }
+
+#  Image subheader fields which control the fields after them
+IM_CONTROL_FIELDS = frozenset( [ IM_Field.NICOM,   IM_Field.NBANDS,  IM_Field.XBANDS, IM_Field.NLUTS_N,
+                                 IM_Field.NELUT_N, IM_Field.UDIDL,   IM_Field.IXSHDL ] )
+
+
+def read_entry( reader, field, field_length ):
+
+    field_data = reader.read( field_length )
+    if len(field_data) != field_length:
+        raise Exception( f'Reached end of file before field. Field: {field}' )
+
+    tp = FieldType.to_type( field.value[2] )
+    return { 'name':  field.name,
+             'field': field,
+             'type':  tp,
+             'data':  tp( field_data, field_length ) }
+
+
+def parse_file_header( buffer, tre_factory = None ):
+    '''
+    Parse a file header, returning ( entries, UDHD records, XHD records ).
+    '''
+    if tre_factory is None:
+        tre_factory = TRE_Factory.default()
+
+    reader = Buffer_Reader( buffer )
+    data   = {}
+    tres   = { FHDR_Field.UDHD: [], FHDR_Field.XHD: [] }
+
+    fields = deque( FHDR_Field.default_list() )
+    offset = 0
+    while len(fields) > 0:
+
+        field = fields.popleft()
+        field_length = field.value[1]
+
+        #  UDHD and XHD lengths are the previous field
+        if field_length <= 0 and field in ( FHDR_Field.UDHD, FHDR_Field.XHD ):
+            field_length = data[offset - 1]['data'].value()
+
+        entry = read_entry( reader, field, field_length )
+
+        if field in SEGMENT_LENGTHS:
+            for _ in range( entry['data'].value() ):
+                fields.extendleft( reversed( SEGMENT_LENGTHS[field] ) )
+
+        if field in tres:
+            tres[field] = TRE_Base.parse_binary( entry['data'].data[3:], factory = tre_factory ).records
+            continue
+
+        data[offset] = entry
+        offset += 1
+
+    return data, tres[FHDR_Field.UDHD], tres[FHDR_Field.XHD]
+
+
+def parse_image_subheader( buffer, tre_factory = None ):
+    '''
+    Parse an image subheader, returning ( entries, UDID records, IXSHD records ).
+    '''
+    if tre_factory is None:
+        tre_factory = TRE_Factory.default()
+
+    reader = Buffer_Reader( buffer )
+    data   = {}
+    tres   = { IM_Field.UDID: [], IM_Field.IXSHD: [] }
+
+    fields     = deque( IM_Field.default_list() )
+    size_queue = deque()
+    offset     = 0
+    nbands     = None
+    xbands     = None
+    while len(fields) > 0:
+
+        field = fields.popleft()
+        field_length = field.value[1]
+        if field_length == 0 and len(size_queue) > 0:
+            field_length = size_queue.popleft()
+
+        entry = read_entry( reader, field, field_length )
+        value = entry['data'].value() if field in IM_CONTROL_FIELDS else None
+
+        if field == IM_Field.NICOM:
+            fields.extendleft( [ IM_Field.ICOM_N ] * value )
+
+        #  Comrat doesn't work for NC and NM
+        if field == IM_Field.IC and entry['data'].value() not in ( 'NC', 'NM' ):
+            fields.appendleft( IM_Field.COMRAT )
+
+        if field == IM_Field.NBANDS:
+            nbands = value
+            if nbands == 0:
+                fields.appendleft( IM_Field.XBANDS )
+            else:
+                xbands = -1
+
+        if field == IM_Field.XBANDS:
+            xbands = value
+
+        if ( field == IM_Field.NBANDS and nbands != 0 ) or field == IM_Field.XBANDS:
+            for _ in range( max( nbands, xbands ) ):
+                fields.extendleft( reversed( [ IM_Field.IREPBAND_N, IM_Field.ISUBCAT_N, IM_Field.IFC_N,
+                                               IM_Field.IMFLT_N,    IM_Field.NLUTS_N ] ) )
+
+        if field == IM_Field.NLUTS_N and value > 0:
+            fields.appendleft( IM_Field.NELUT_N )
+
+        if field == IM_Field.NELUT_N:
+            size_queue.appendleft( data[offset - 1]['data'].value() * value )
+            fields.appendleft( IM_Field.LUTD_N_M )
+
+        #  The overflow was only read when the section was at its maximum length
+        if field == IM_Field.UDIDL:
+            if value == 99999:
+                fields.appendleft( IM_Field.UDOFL )
+            size_queue.append( value )
+
+        if field == IM_Field.IXSHDL:
+            if value == 99999:
+                fields.appendleft( IM_Field.IXSOFL )
+            size_queue.append( value )
+
+        if field in tres:
+            tres[field] = TRE_Base.parse_binary( entry['data'].data[3:], factory = tre_factory ).records
+            continue
+
+        data[offset] = entry
+        offset += 1
+
+    return data, tres[IM_Field.UDID], tres[IM_Field.IXSHD]
@@ -0,0 +1,161 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Helpers for building small, synthetic NITF 2.1 files for the unit-tests.
+'''
+
+def _a( value, size ):
+    '''
+    Left-justified, space-filled alphanumeric field
+    '''
+    output = str(value).encode('utf8')[:size]
+    return output + b' ' * (size - len(output))
+
+def _n( value, size ):
+    '''
+    Right-justified, zero-filled numeric field
+    '''
+    output = str(int(value)).encode('utf8')
+    if len(output) > size:
+        raise ValueError( f'Value {value} does not fit in {size} bytes' )
+    return b'0' * (size - len(output)) + output
+
+
+def build_tre( cetag, cedata: bytes ):
+    return _a( cetag, 6 ) + _n( len(cedata), 5 ) + cedata
+
+
+def _tre_section( tres: bytes ):
+    '''
+    Build a length + overflow + data section.  Empty sections are just a zero length.
+    '''
+    if len(tres) == 0:
+        return _n( 0, 5 )
+    return _n( len(tres) + 3, 5 ) + _n( 0, 3 ) + tres
+
+
+def build_image_subheader( nrows,
+                           ncols,
+                           nbands = 1,
+                           ic     = 'NC',
+                           imode  = 'B',
+                           nbpr   = 1,
+                           nbpc   = 1,
+                           nppbh  = None,
+                           nppbv  = None,
+                           nbpp   = 8,
+                           pvtype = 'INT',
+                           irep   = 'MONO',
+                           icat   = 'VIS',
+                           iid1   = 'TEST',
+                           comrat = '    ',
+                           comments = (),
+                           luts     = None,
+                           udid:  bytes = b'',
+                           ixshd: bytes = b'' ):
+    '''
+    Build an image subheader.  `luts` holds a list of equal length lookup
+    tables, as bytes, for each band.
+    '''
+
+    if nppbh is None:
+        nppbh = ncols
+    if nppbv is None:
+        nppbv = nrows
+
+    output  = b'IM' + _a( iid1, 10 ) + _n( 20250101120000, 14 ) + _a( '', 17 ) + _a( 'Synthetic', 80 )
+    output += b'U' + _a( '', 2 ) + _a( '', 11 ) + _a( '', 2 ) + _a( '', 20 ) + _a( '', 2 )
+    output += _a( '', 8 ) + _a( '', 4 ) + _a( '', 1 ) + _a( '', 8 ) + _a( '', 43 ) + _a( '', 1 )
+    output += _a( '', 40 ) + _a( '', 1 ) + _a( '', 8 ) + _a( '', 15 ) + b'0' + _a( 'Unit Test', 42 )
+    output += _n( nrows, 8 ) + _n( ncols, 8 ) + _a( pvtype, 3 ) + _a( irep, 8 ) + _a( icat, 8 )
+    output += _n( nbpp, 2 ) + b'R' + b'G' + _a( '0' * 60, 60 )
+    output += _n( len(comments), 1 )
+    for comment in comments:
+        output += _a( comment, 80 )
+    output += _a( ic, 2 )
+    if ic not in ( 'NC', 'NM' ):
+        output += _a( comrat, 4 )
+
+    if nbands < 10:
+        output += _n( nbands, 1 )
+    else:
+        output += _n( 0, 1 ) + _n( nbands, 5 )
+
+    for band in range( nbands ):
+        output += _a( 'M' if nbands == 1 else '', 2 ) + _a( '', 6 ) + b'N' + _a( '', 3 )
+        band_luts = [] if luts is None else luts[band]
+        output += _n( len(band_luts), 1 )
+        if len(band_luts) > 0:
+            output += _n( len(band_luts[0]), 5 ) + b''.join( band_luts )
+
+    output += _n( 0, 1 ) + _a( imode, 1 ) + _n( nbpr, 4 ) + _n( nbpc, 4 )
+    output += _n( nppbh, 4 ) + _n( nppbv, 4 ) + _n( nbpp, 2 ) + _n( 1, 3 ) + _n( 0, 3 )
+    output += _n( 0, 10 ) + _a( '1.0', 4 )
+    output += _tre_section( udid )
+    output += _tre_section( ixshd )
+    return output
+
+
+def build_nitf( images   = [],
+                graphics = [],
+                texts    = [],
+                des      = [],
+                xhd: bytes = b'' ):
+    '''
+    Build a complete NITF file.
+
+    Each segment list holds (subheader bytes, data bytes) pairs.
+    '''
+    lengths = _n( len(images), 3 )
+    for subheader, data in images:
+        lengths += _n( len(subheader), 6 ) + _n( len(data), 10 )
+
+    lengths += _n( len(graphics), 3 )
+    for subheader, data in graphics:
+        lengths += _n( len(subheader), 4 ) + _n( len(data), 6 )
+
+    lengths += _n( 0, 3 )
+    lengths += _n( len(texts), 3 )
+    for subheader, data in texts:
+        lengths += _n( len(subheader), 4 ) + _n( len(data), 5 )
+
+    lengths += _n( len(des), 3 )
+    for subheader, data in des:
+        lengths += _n( len(subheader), 4 ) + _n( len(data), 9 )
+
+    lengths += _n( 0, 3 )
+    lengths += _tre_section( b'' )
+    lengths += _tre_section( xhd )
+
+    prefix  = b'NITF02.10' + b'03' + b'BF01' + _a( 'TMNS', 10 ) + _n( 20250101120000, 14 )
+    prefix += _a( 'Synthetic Unit-Test NITF', 80 ) + b'U' + _a( '', 2 ) + _a( '', 11 )
+    prefix += _a( '', 2 ) + _a( '', 20 ) + _a( '', 2 ) + _a( '', 8 ) + _a( '', 4 ) + _a( '', 1 )
+    prefix += _a( '', 8 ) + _a( '', 43 ) + _a( '', 1 ) + _a( '', 40 ) + _a( '', 1 ) + _a( '', 8 )
+    prefix += _a( '', 15 ) + _n( 0, 5 ) + _n( 0, 5 ) + b'0' + b'\x00\x00\x00'
+    prefix += _a( 'Terminus', 24 ) + _a( '', 18 )
+
+    header_length = len(prefix) + 12 + 6 + len(lengths)
+
+    body = b''
+    for segments in ( images, graphics, texts, des ):
+        for subheader, data in segments:
+            body += subheader + data
+
+    file_length = header_length + len(body)
+    return prefix + _n( file_length, 12 ) + _n( header_length, 6 ) + lengths + body
+
+
+def write_nitf( pathname, **kwargs ):
+
+    buffer = build_nitf( **kwargs )
+    with open( pathname, 'wb' ) as fout:
+        fout.write( buffer )
+    return buffer
@@ -0,0 +1,101 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import asyncio
+import os
+import tempfile
+import unittest
+
+#  Terminus Libraries
+from tmns.nitf.aio import ( Async_Reader,
+                            load_nitf_async,
+                            load_nitfs_async )
+from tmns.nitf.core import load_nitf
+from tmns.nitf.imsubhdr import Field as IMGSUB_Field
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           build_tre,
+                           write_nitf )
+
+
+class Memory_Reader(Async_Reader):
+    '''
+    Serves reads from memory and records them
+    '''
+    def __init__( self, buffer ):
+        self.buffer = buffer
+        self.reads  = []
+
+    async def size( self ):
+        return len(self.buffer)
+
+    async def read( self, offset, length ):
+        self.reads.append( ( offset, length ) )
+        await asyncio.sleep( 0 )
+        return self.buffer[offset:(offset + length)]
+
+
+class TEST_aio_load_nitf_async(unittest.TestCase):
+
+    def setUp( self ):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pathname = os.path.join( self.temp_dir.name, 'sample.ntf' )
+        self.pixels = [ bytes( range( 20 ) ), bytes( range( 100, 118 ) ) ]
+        images = [ ( build_image_subheader( 4, 5, ixshd = build_tre( 'BLOCKA', b'0' * 123 ) ), self.pixels[0] ),
+                   ( build_image_subheader( 2, 3, nbands = 3, imode = 'P' ), self.pixels[1] ) ]
+        self.buffer = write_nitf( self.pathname, images = images )
+
+    def tearDown( self ):
+        self.temp_dir.cleanup()
+
+    def test_local_file( self ):
+
+        nitf = asyncio.run( load_nitf_async( self.pathname ) )
+        self.assertEqual( nitf.as_kvp(), load_nitf( self.pathname ).as_kvp() )
+        self.assertEqual( [ segment.buffer for segment in nitf.image_segments ], self.pixels )
+
+        #  Skipped image data is read on demand
+        nitf = asyncio.run( load_nitf_async( self.pathname, metadata_only = True ) )
+        self.assertIsNone( nitf.image_segments[1].buffer )
+        self.assertEqual( nitf.image_segments[1].get_buffer(), self.pixels[1] )
+
+    def test_custom_reader( self ):
+
+        reader = Memory_Reader( self.buffer )
+        nitf = asyncio.run( load_nitf_async( reader = reader, tres = [] ) )
+
+        #  Two reads for the file header, then one per subheader and one per image
+        self.assertEqual( len(reader.reads), 6 )
+        self.assertEqual( len( nitf.image_segments[0].subheader.ixshd ), 0 )
+        self.assertEqual( nitf.image_segments[0].buffer, self.pixels[0] )
+
+    def test_load_nitfs_async( self ):
+
+        paths = []
+        for idx in range( 5 ):
+            pathname = os.path.join( self.temp_dir.name, f'batch_{idx}.ntf' )
+            write_nitf( pathname, images = [ ( build_image_subheader( idx + 1, 2 ), bytes( 2 * (idx + 1) ) ) ] )
+            paths.append( pathname )
+        paths.insert( 1, os.path.join( self.temp_dir.name, 'missing.ntf' ) )
+
+        async def collect( **kwargs ):
+            return [ item async for item in load_nitfs_async( paths, **kwargs ) ]
+
+        results = asyncio.run( collect( concurrency = 2, ordered = True ) )
+        self.assertEqual( [ pathname for pathname, _ in results ], paths )
+        self.assertIsInstance( results[1][1], FileNotFoundError )
+        self.assertEqual( results[5][1].image_segments[0].subheader.get( IMGSUB_Field.NROWS )['data'].value(), 5 )
+
+        results = asyncio.run( collect( concurrency = 3 ) )
+        self.assertEqual( sorted( pathname for pathname, _ in results ), sorted( paths ) )
@@ -0,0 +1,103 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+#  Terminus Libraries
+from tmns.nitf.cache import Header_Cache
+from tmns.nitf.core import load_nitf
+from tmns.nitf.fhdr import File_Header
+from tmns.nitf.tre import TRE_Factory
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           build_tre,
+                           write_nitf )
+
+
+class TEST_cache_Header_Cache(unittest.TestCase):
+
+    def setUp( self ):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache    = Header_Cache( os.path.join( self.temp_dir.name, 'headers.db' ) )
+        self.pathname = os.path.join( self.temp_dir.name, 'sample.ntf' )
+        self.pixels   = bytes( range( 20 ) )
+        write_nitf( self.pathname,
+                    images = [ ( build_image_subheader( 4, 5, ixshd = build_tre( 'BLOCKA', b'0' * 123 ) ), self.pixels ) ] )
+
+    def tearDown( self ):
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_warm_load( self ):
+
+        cold = load_nitf( self.pathname, cache = self.cache )
+        self.assertEqual( len(self.cache), 1 )
+
+        #  A warm load never parses a header
+        with mock.patch.object( File_Header, 'parse_binary', side_effect = AssertionError( 'Parsed on a warm load' ) ):
+            warm = load_nitf( self.pathname, cache = self.cache )
+
+        self.assertEqual( warm.as_kvp(), cold.as_kvp() )
+        self.assertEqual( warm.image_segments[0].buffer, self.pixels )
+        self.assertEqual( warm.image_segments[0].subheader.ixshd[0].cetag().strip(), 'BLOCKA' )
+
+    def test_invalidation( self ):
+
+        load_nitf( self.pathname, cache = self.cache )
+        self.assertIsNotNone( self.cache.get( self.pathname ) )
+
+        #  Changing the file's modification time is a miss
+        stat = os.stat( self.pathname )
+        os.utime( self.pathname, ns = ( stat.st_atime_ns, stat.st_mtime_ns + 1000 ) )
+        self.assertIsNone( self.cache.get( self.pathname ) )
+
+        #  Projected loads bypass the cache
+        self.cache.clear()
+        load_nitf( self.pathname, cache = self.cache, tres = [] )
+        self.assertEqual( len(self.cache), 0 )
+
+    def test_eviction( self ):
+
+        paths = []
+        for idx in range( 4 ):
+            pathname = os.path.join( self.temp_dir.name, f'evict_{idx}.ntf' )
+            write_nitf( pathname, images = [ ( build_image_subheader( 2, 2 ), bytes( 4 ) ) ] )
+            paths.append( pathname )
+
+        load_nitf( paths[0], cache = self.cache )
+        entry_size = self.cache.total_bytes()
+        self.cache.max_bytes = 2 * entry_size
+
+        for pathname in paths[1:]:
+            load_nitf( pathname, cache = self.cache )
+
+        #  Only the most recently used entries remain
+        self.assertLessEqual( self.cache.total_bytes(), self.cache.max_bytes )
+        self.assertIsNone( self.cache.get( paths[0] ) )
+        self.assertIsNotNone( self.cache.get( paths[3] ) )
+
+    def test_pickle( self ):
+
+        load_nitf( self.pathname, cache = self.cache )
+
+        cache = pickle.loads( pickle.dumps( self.cache ) )
+        tre_factory = TRE_Factory.default()
+        fhdr, subheaders, directory = cache.get( self.pathname, tre_factory = tre_factory )
+        self.assertIs( subheaders[0].ixshd.factory, tre_factory )
+        self.assertEqual( subheaders[0].ixshd[0].cetag().strip(), 'BLOCKA' )
+        cache.close()
@@ -0,0 +1,102 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import os
+import tempfile
+import unittest
+
+#  Terminus Libraries
+from tmns.nitf.catalog import ( Catalog,
+                                parse_predicates )
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           build_tre,
+                           write_nitf )
+
+
+def build_aimidb( country ):
+
+    cedata  = b'20250101120000' + b'0001' + b'MISSION   ' + b'01' + b'001' + b'AA' + b'00' + b'000' + b' '
+    cedata += b'001' + b'00001' + b'AA' + b'001' + b'00001' + country.encode('utf8') + b'    '
+    cedata += b'LOCATION   ' + b' ' * 13
+    return build_tre( 'AIMIDB', cedata )
+
+
+class TEST_catalog_Catalog(unittest.TestCase):
+
+    def setUp( self ):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = os.path.join( self.temp_dir.name, 'corpus' )
+        os.makedirs( os.path.join( root, 'nested' ) )
+
+        def write( name, nrows, icat, country ):
+            subheader = build_image_subheader( nrows, 2, nbpc = nrows // 100, nppbv = 100,
+                                               icat = icat, ixshd = build_aimidb( country ) + build_tre( 'TSTTRE', b'MISSION-42' ) )
+            pathname = os.path.join( root, name )
+            write_nitf( pathname, images = [ ( subheader, bytes( 2 * nrows ) ) ] )
+            return pathname
+
+        self.small_sar = write( 'small_sar.ntf',        100, 'SAR', 'US' )
+        self.large_sar = write( 'nested/large_sar.ntf', 20000, 'SAR', 'US' )
+        self.large_eo  = write( 'nested/large_eo.ntf',  20000, 'VIS', 'US' )
+        self.large_ca  = write( 'large_ca.ntf',         20000, 'SAR', 'CA' )
+
+        self.root    = root
+        self.catalog = Catalog( os.path.join( self.temp_dir.name, 'catalog.db' ) )
+
+    def tearDown( self ):
+        self.catalog.close()
+        self.temp_dir.cleanup()
+
+    def test_query( self ):
+
+        self.assertEqual( self.catalog.ingest( self.root, workers = 2 ), 4 )
+        self.assertEqual( len(self.catalog), 4 )
+
+        results = self.catalog.query( "ICAT=SAR, AIMIDB.COUNTRY='US', NROWS>10000" )
+        self.assertEqual( results, [ self.large_sar ] )
+
+        results = self.catalog.query( [ ( 'NROWS', '<=', 20000 ), ( 'ICAT', '=', 'SAR' ) ] )
+        self.assertEqual( results, sorted( [ self.small_sar, self.large_sar, self.large_ca ] ) )
+
+        self.assertEqual( self.catalog.values( self.large_eo, 'ICAT' ), [ ( 0, 'image_subheader', 'VIS' ) ] )
+        self.assertEqual( self.catalog.values( self.large_eo, 'AIMIDB.COUNTRY' ), [ ( 0, 'ixshd', 'US' ) ] )
+
+        #  TREs without their own class are indexed as text, not as bytes literals
+        self.assertEqual( self.catalog.values( self.large_eo, 'TSTTRE.CEDATA' ), [ ( 0, 'ixshd', 'MISSION-42' ) ] )
+        self.assertEqual( len( self.catalog.query( "TSTTRE.CEDATA='MISSION-42'" ) ), 4 )
+
+    def test_reingest( self ):
+
+        self.catalog.ingest( self.root )
+
+        #  Unchanged files are skipped, and changed files are replaced
+        self.assertEqual( self.catalog.ingest( self.root ), 0 )
+        write_nitf( self.small_sar, images = [ ( build_image_subheader( 50000, 2, nbpc = 500, nppbv = 100, icat = 'SAR' ), bytes( 4 ) ) ] )
+        os.utime( self.small_sar, ns = ( 0, 0 ) )
+
+        self.assertEqual( self.catalog.ingest( self.root ), 1 )
+        self.assertEqual( self.catalog.values( self.small_sar, 'NROWS' ), [ ( 0, 'image_subheader', '00050000' ) ] )
+        self.assertEqual( self.catalog.query( 'AIMIDB.COUNTRY=US' ), sorted( [ self.large_sar, self.large_eo ] ) )
+
+    def test_parse_predicates( self ):
+
+        self.assertEqual( parse_predicates( "ICAT = SAR, AIMIDB.COUNTRY='US', NROWS>=10000, IID1 LIKE 'T%'" ),
+                          [ ( 'ICAT', '=', 'SAR' ),
+                            ( 'AIMIDB.COUNTRY', '=', 'US' ),
+                            ( 'NROWS', '>=', 10000.0 ),
+                            ( 'IID1', 'LIKE', 'T%' ) ] )
+
+        with self.assertRaises( ValueError ):
+            parse_predicates( 'NROWS ~ 5' )
@@ -0,0 +1,86 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf import columnar
+from tmns.nitf.columnar import ( INT_FILL,
+                                 to_structured_array,
+                                 write_parquet )
+from tmns.nitf.core import ( load_nitf,
+                             load_nitfs )
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           build_tre,
+                           write_nitf )
+
+
+class TEST_columnar_to_structured_array(unittest.TestCase):
+
+    def setUp( self ):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.first  = os.path.join( self.temp_dir.name, 'first.ntf' )
+        self.second = os.path.join( self.temp_dir.name, 'second.ntf' )
+
+        blocka = build_tre( 'BLOCKA', b'0' * 123 )
+        write_nitf( self.first,
+                    images = [ ( build_image_subheader( 4, 5, icat = 'SAR', ixshd = blocka ), bytes( 20 ) ),
+                               ( build_image_subheader( 2, 3, nbands = 3, imode = 'P' ), bytes( 18 ) ) ] )
+        write_nitf( self.second, xhd = blocka )
+
+    def tearDown( self ):
+        self.temp_dir.cleanup()
+
+    def test_columns( self ):
+
+        results = load_nitfs( [ self.first, self.second, os.path.join( self.temp_dir.name, 'missing.ntf' ) ], ordered = True )
+        array = to_structured_array( results, tres = [ 'BLOCKA' ] )
+
+        #  One row per image segment, and one for the file without images
+        self.assertEqual( len(array), 3 )
+        self.assertEqual( array['segment'].tolist(), [ 0, 1, -1 ] )
+        self.assertEqual( array['path'][0].decode('utf8'), self.first )
+
+        #  Numbers are typed, and text is fixed-width bytes
+        self.assertEqual( array.dtype['NROWS'], np.int64 )
+        self.assertEqual( array.dtype['ICAT'], np.dtype( 'S8' ) )
+        self.assertEqual( array['NROWS'].tolist(), [ 4, 2, INT_FILL ] )
+        self.assertEqual( array['ICAT'].tolist(), [ b'SAR', b'VIS', b'' ] )
+        self.assertEqual( array['file_header.FTITLE'][2], b'Synthetic Unit-Test NITF' )
+
+        #  TRE columns, which are empty for segments without the TRE
+        self.assertEqual( array['BLOCKA.FRLC_LOC'].tolist(), [ b'0' * 21, b'', b'' ] )
+        self.assertEqual( array['file_header.BLOCKA.FRLC_LOC'].tolist(), [ b'', b'', b'0' * 21 ] )
+
+        #  Repeated fields are left out
+        self.assertNotIn( 'IREPBAND_N', array.dtype.names )
+
+    def test_containers( self ):
+
+        array = to_structured_array( [ load_nitf( self.first ) ] )
+        self.assertEqual( array['path'].tolist(), [ self.first.encode('utf8') ] * 2 )
+
+    @unittest.skipIf( columnar.pyarrow is None, 'pyarrow is not installed' )
+    def test_parquet( self ):
+
+        pathname = os.path.join( self.temp_dir.name, 'metadata.parquet' )
+        write_parquet( load_nitfs( [ self.first, self.second ], ordered = True ), pathname )
+
+        table = columnar.pyarrow.parquet.read_table( pathname )
+        self.assertEqual( table.column( 'NROWS' ).to_pylist(), [ 4, 2, None ] )
@@ -0,0 +1,326 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import io
+import os
+import tempfile
+import unittest
+
+#  Terminus Libraries
+from tmns.nitf.core import ( load_nitf,
+                            load_nitfs )
+from tmns.nitf.enums import Segment_Type
+from tmns.nitf.fhdr import ( Field as FHDR_Field,
+                             File_Header )
+from tmns.nitf.image.factory import Driver_Factory
+from tmns.nitf.imsubhdr import ( Field as IMGSUB_Field,
+                                 Image_Subheader )
+from tmns.nitf.tre import TRE_Factory
+from tmns.nitf.tres.base import Field as TRE_Field
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           build_nitf,
+                           build_tre,
+                           write_nitf )
+
+
+class TEST_core_load_nitf(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.pathname = os.path.join( self.tempdir.name, 'sample.ntf' )
+
+        self.pixels = [ bytes( range( 20 ) ),
+                        bytes( range( 100, 118 ) ) ]
+        self.images = [ ( build_image_subheader( 4, 5, iid1 = 'FIRST' ), self.pixels[0] ),
+                        ( build_image_subheader( 2, 3, nbands = 3, imode = 'P', iid1 = 'SECOND' ), self.pixels[1] ) ]
+        write_nitf( self.pathname, images = self.images )
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_load_default( self ):
+
+        nitf_data = load_nitf( self.pathname )
+
+        self.assertEqual( len( nitf_data.image_segments ), 2 )
+        for idx in range( 2 ):
+            segment = nitf_data.image_segments[idx]
+            self.assertIsInstance( segment.buffer, bytes )
+            self.assertEqual( segment.buffer, self.pixels[idx] )
+            self.assertEqual( segment.length, len( self.pixels[idx] ) )
+
+        self.assertEqual( nitf_data.image_segments[1].subheader.get( IMGSUB_Field.IID1 )['data'].value().strip(), 'SECOND' )
+
+    def test_load_mmap( self ):
+
+        with load_nitf( self.pathname, use_mmap = True ) as nitf_data:
+
+            self.assertIsNotNone( nitf_data.mapping )
+            for idx in range( 2 ):
+                segment = nitf_data.image_segments[idx]
+                self.assertIsInstance( segment.buffer, memoryview )
+                self.assertEqual( segment.buffer.tobytes(), self.pixels[idx] )
+
+                #  Offsets should point at the segment within the file
+                with open( self.pathname, 'rb' ) as fin:
+                    fin.seek( segment.offset )
+                    self.assertEqual( fin.read( segment.length ), self.pixels[idx] )
+
+        self.assertIsNone( nitf_data.mapping )
+        self.assertIsNone( nitf_data.image_segments[0].buffer )
+
+    def test_load_metadata_only( self ):
+
+        nitf_data = load_nitf( self.pathname, metadata_only = True )
+
+        self.assertEqual( len( nitf_data.image_segments ), 2 )
+        for idx in range( 2 ):
+            segment = nitf_data.image_segments[idx]
+            self.assertIsNone( segment.buffer )
+            self.assertEqual( segment.get_buffer(), self.pixels[idx] )
+
+
+class TEST_core_Segment_Directory(unittest.TestCase):
+
+    def test_all_segment_types( self ):
+
+        images   = [ ( build_image_subheader( 4, 5 ), bytes( 20 ) ) ]
+        graphics = [ ( b'S' * 7, b'g' * 11 ), ( b'S' * 3, b'g' * 2 ) ]
+        texts    = [ ( b'T' * 5, b'hello world' ) ]
+        des      = [ ( b'D' * 9, b'd' * 13 ) ]
+
+        with tempfile.TemporaryDirectory() as tempdir:
+
+            pathname = os.path.join( tempdir, 'segments.ntf' )
+            buffer = write_nitf( pathname,
+                                 images   = images,
+                                 graphics = graphics,
+                                 texts    = texts,
+                                 des      = des,
+                                 xhd      = build_tre( 'FOOBAR', b'xyz' ) )
+
+            nitf_data = load_nitf( pathname, metadata_only = True )
+
+        directory = nitf_data.segment_directory
+        self.assertEqual( len( directory ), 5 )
+        self.assertEqual( directory.file_length(), len( buffer ) )
+        self.assertEqual( len( nitf_data.file_header.xhd ), 1 )
+
+        expected = [ ( Segment_Type.IMAGE,   images[0] ),
+                     ( Segment_Type.GRAPHIC, graphics[0] ),
+                     ( Segment_Type.GRAPHIC, graphics[1] ),
+                     ( Segment_Type.TEXT,    texts[0] ),
+                     ( Segment_Type.DES,     des[0] ) ]
+
+        for entry, ( segment_type, ( subheader, data ) ) in zip( directory, expected ):
+            self.assertEqual( entry.segment_type, segment_type )
+            self.assertEqual( buffer[entry.subheader_offset:entry.data_offset], subheader )
+            self.assertEqual( buffer[entry.data_offset:entry.end()], data )
+
+        self.assertEqual( directory.get( Segment_Type.GRAPHIC, 1 ).data_length, 2 )
+
+
+class Counting_Reader:
+
+    def __init__( self, file_handle ):
+        self.file_handle = file_handle
+        self.reads = 0
+
+    def read( self, size = -1 ):
+        self.reads += 1
+        return self.file_handle.read( size )
+
+
+class TEST_core_Bulk_Header_Reads(unittest.TestCase):
+
+    def test_header_reads( self ):
+
+        subheader = build_image_subheader( 4, 5, nbands = 3, imode = 'P' )
+        buffer = build_nitf( images = [ ( subheader, bytes( 60 ) ) ] )
+
+        reader = Counting_Reader( io.BytesIO( buffer ) )
+        fhdr = File_Header.parse_binary( reader )
+        self.assertEqual( reader.reads, 2 )
+        self.assertEqual( fhdr.get( FHDR_Field.LISH_N )['data'].value(), len( subheader ) )
+
+        reader = Counting_Reader( io.BytesIO( subheader ) )
+        imsubhdr = Image_Subheader.parse_binary( reader, length = len( subheader ) )
+        self.assertEqual( reader.reads, 1 )
+        self.assertEqual( imsubhdr.get( IMGSUB_Field.NBANDS )['data'].value(), 3 )
+
+
+class TEST_core_Field_Index(unittest.TestCase):
+
+    def test_repeated_fields( self ):
+
+        images = [ ( build_image_subheader( 4, 5, nbands = 3, imode = 'P', ixshd = build_tre( 'FOOBAR', b'xyz' ) ), bytes( 60 ) ),
+                   ( build_image_subheader( 2, 3 ), bytes( 6 ) ) ]
+        buffer = build_nitf( images = images )
+
+        fhdr = File_Header.parse_buffer( buffer )
+        self.assertEqual( fhdr.count( FHDR_Field.LI_N ), 2 )
+        self.assertEqual( fhdr.get( FHDR_Field.LI_N, index = 1 )['data'].value(), 6 )
+        self.assertIsNone( fhdr.get( FHDR_Field.LI_N, index = 2 ) )
+        self.assertIsNone( fhdr.get( FHDR_Field.LSSH_N ) )
+
+        imsubhdr = Image_Subheader.parse_buffer( images[0][0] )
+        self.assertEqual( imsubhdr.count( IMGSUB_Field.IFC_N ), 3 )
+        self.assertEqual( imsubhdr.get( IMGSUB_Field.NROWS )['data'].value(), 4 )
+
+        tre = imsubhdr.ixshd[0]
+        self.assertEqual( tre.cetag().strip(), 'FOOBAR' )
+        self.assertEqual( tre.get( TRE_Field.CEDATA )['data'].value(), b'xyz' )
+
+    def test_lazy_headers( self ):
+
+        subheader = build_image_subheader( 4, 5, ixshd = build_tre( 'FOOBAR', b'xyz' ) + build_tre( 'BLOCKA', b'0' * 123 ) )
+        imsubhdr = Image_Subheader.parse_buffer( subheader )
+
+        #  Only the fields needed to walk the structure are decoded
+        self.assertFalse( imsubhdr.get( IMGSUB_Field.IID2 ).is_decoded() )
+        self.assertTrue( imsubhdr.get( IMGSUB_Field.NBANDS ).is_decoded() )
+
+        #  TREs are built on first access
+        self.assertEqual( imsubhdr.ixshd.tags(), [ 'FOOBAR', 'BLOCKA' ] )
+        self.assertEqual( imsubhdr.ixshd.tres, [ None, None ] )
+        self.assertEqual( imsubhdr.ixshd[1].cetag().strip(), 'BLOCKA' )
+        self.assertIsNone( imsubhdr.ixshd.tres[0] )
+
+
+class TEST_core_Projection(unittest.TestCase):
+
+    def test_load_projection( self ):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            pathname = os.path.join( temp_dir, 'projection.ntf' )
+            subheader = build_image_subheader( 4, 5, ixshd = build_tre( 'FOOBAR', b'xyz' ) + build_tre( 'BLOCKA', b'0' * 123 ) )
+            write_nitf( pathname, images = [ ( subheader, bytes( 20 ) ) ] )
+
+            nitf = load_nitf( pathname,
+                              fields = [ FHDR_Field.FTITLE, IMGSUB_Field.IID1 ],
+                              tres   = [ 'BLOCKA' ] )
+
+            #  Requested fields are kept, unrequested are dropped
+            fhdr = nitf.file_header
+            self.assertEqual( fhdr.get( FHDR_Field.FTITLE )['data'].value().strip(), 'Synthetic Unit-Test NITF' )
+            self.assertIsNone( fhdr.get( FHDR_Field.OSTAID ) )
+
+            imsubhdr = nitf.image_segments[0].subheader
+            self.assertEqual( imsubhdr.get( IMGSUB_Field.IID1 )['data'].value().strip(), 'TEST' )
+            self.assertIsNone( imsubhdr.get( IMGSUB_Field.IDATIM ) )
+
+            #  Structural fields are always kept
+            self.assertEqual( fhdr.get( FHDR_Field.LI_N )['data'].value(), 20 )
+            self.assertEqual( imsubhdr.get( IMGSUB_Field.NCOLS )['data'].value(), 5 )
+
+            #  Only the requested TREs are kept
+            self.assertEqual( imsubhdr.ixshd.tags(), [ 'BLOCKA' ] )
+
+            #  An empty TRE list skips the extension sections
+            nitf = load_nitf( pathname, tres = [] )
+            self.assertEqual( len( nitf.image_segments[0].subheader.ixshd ), 0 )
+            self.assertIsNotNone( nitf.image_segments[0].subheader.get( IMGSUB_Field.IDATIM ) )
+
+
+class TEST_core_load_nitfs(unittest.TestCase):
+
+    def setUp( self ):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for idx in range( 6 ):
+            pathname = os.path.join( self.temp_dir.name, f'batch_{idx}.ntf' )
+            write_nitf( pathname, images = [ ( build_image_subheader( idx + 1, 3 ), bytes( 3 * (idx + 1) ) ) ] )
+            self.paths.append( pathname )
+
+        #  A missing file should be reported, not stop the batch
+        self.paths.insert( 2, os.path.join( self.temp_dir.name, 'missing.ntf' ) )
+
+    def tearDown( self ):
+        self.temp_dir.cleanup()
+
+    def check_results( self, results ):
+
+        self.assertEqual( sorted( pathname for pathname, _ in results ), sorted( self.paths ) )
+        for pathname, result in results:
+            if pathname.endswith( 'missing.ntf' ):
+                self.assertIsInstance( result, FileNotFoundError )
+            else:
+                nrows = int( os.path.basename( pathname )[6:-4] ) + 1
+                self.assertEqual( result.image_segments[0].subheader.get( IMGSUB_Field.NROWS )['data'].value(), nrows )
+
+    def test_threads( self ):
+
+        results = list( load_nitfs( self.paths, workers = 3, ordered = True, max_in_flight = 2 ) )
+        self.assertEqual( [ pathname for pathname, _ in results ], self.paths )
+        self.check_results( results )
+
+        results = list( load_nitfs( self.paths, workers = 3 ) )
+        self.check_results( results )
+
+    def test_processes( self ):
+
+        results = list( load_nitfs( self.paths, workers = 2, mode = 'process', metadata_only = True ) )
+        self.check_results( results )
+
+        with self.assertRaises( ValueError ):
+            load_nitfs( self.paths, mode = 'process', use_mmap = True )
+
+    def test_processes_with_factories( self ):
+
+        #  As tmns-nitf-info does, the default factories are sent to the workers and back with each container
+        results = list( load_nitfs( self.paths,
+                                    workers     = 2,
+                                    mode        = 'process',
+                                    ordered     = True,
+                                    tre_factory = TRE_Factory.default(),
+                                    img_factory = Driver_Factory.default() ) )
+        self.check_results( results )
+
+        for pathname, result in results:
+            if not pathname.endswith( 'missing.ntf' ):
+                nrows = int( os.path.basename( pathname )[6:-4] ) + 1
+                self.assertEqual( result.get_image().shape, ( nrows, 3 ) )
+
+
+class TEST_core_Mapping(unittest.TestCase):
+
+    def test_mapping( self ):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            pathname = os.path.join( temp_dir, 'mapping.ntf' )
+            images = [ ( build_image_subheader( 4, 5, ixshd = build_tre( 'FOOBAR', b'xyz' ) + build_tre( 'BLOCKA', b'0' * 123 ) ), bytes( 20 ) ),
+                       ( build_image_subheader( 2, 3, nbands = 3, imode = 'P' ), bytes( 18 ) ) ]
+            write_nitf( pathname, images = images )
+
+            #  A single lookup only builds the TRE it needs
+            nitf = load_nitf( pathname )
+            mapping = nitf.as_mapping()
+            self.assertEqual( mapping['image_segment.1.NCOLS'], nitf.image_segments[1].as_kvp()['NCOLS'] )
+            self.assertEqual( mapping['image_segment.0.ixshd.BLOCKA.CEL'], '00123' )
+            self.assertIsNone( nitf.image_segments[0].subheader.ixshd.tres[0] )
+
+            for key in [ 'file_header.NOPE', 'image_segment.2.NROWS', 'image_segment.0.ixshd.NOPE.CEL', 'NROWS' ]:
+                self.assertNotIn( key, mapping )
+                with self.assertRaises( KeyError ):
+                    mapping[key]
+
+            #  Keys, order and values match the eager flattening
+            expected = load_nitf( pathname ).as_kvp()
+            self.assertEqual( list( mapping.keys() ), list( expected.keys() ) )
+            self.assertEqual( dict( mapping ), expected )
+            self.assertEqual( len( mapping ), len( expected ) )
@@ -0,0 +1,72 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import pickle
+import unittest
+
+#  Terminus Libraries
+from tmns.nitf.field_types import ( BCS_A,
+                                    BCS_N,
+                                    Field_Entry )
+from tmns.nitf.fhdr import Field as FHDR_Field
+
+
+class TEST_field_types_Field_Entry(unittest.TestCase):
+
+    def test_dict_access( self ):
+
+        entry = Field_Entry( FHDR_Field.NUMI, BCS_N( b'003', 3 ) )
+
+        self.assertEqual( entry['name'], 'NUMI' )
+        self.assertEqual( entry['field'], FHDR_Field.NUMI )
+        self.assertEqual( entry['type'], BCS_N )
+        self.assertEqual( entry['data'].value(), 3 )
+        with self.assertRaises( KeyError ):
+            entry['missing']
+
+        self.assertFalse( hasattr( entry, '__dict__' ) )
+
+    def test_value_is_memoized( self ):
+
+        value = BCS_A( b'NITF', 4 )
+        self.assertIs( value.value(), value.value() )
+
+    def test_pickle( self ):
+
+        entry = Field_Entry( FHDR_Field.FHDR, BCS_A( b'NITF', 4 ) )
+        entry['data'].value()
+
+        result = pickle.loads( pickle.dumps( entry ) )
+        self.assertEqual( result['field'], FHDR_Field.FHDR )
+        self.assertEqual( result['data'].value(), 'NITF' )
+
+    def test_lazy_decode( self ):
+
+        buffer = b'xxNITF02.10'
+        entry = Field_Entry( FHDR_Field.FVER, buffer = buffer, start = 6, length = 5 )
+
+        self.assertFalse( entry.is_decoded() )
+        self.assertEqual( entry['type'], BCS_A )
+        self.assertFalse( entry.is_decoded() )
+
+        self.assertEqual( entry['data'].value(), '02.10' )
+        self.assertTrue( entry.is_decoded() )
+
+    def test_raw( self ):
+
+        entry = Field_Entry( FHDR_Field.FVER, buffer = b'xxNITF02.10', start = 6, length = 5 )
+        self.assertEqual( entry.raw(), b'02.10' )
+        self.assertFalse( entry.is_decoded() )
+
+        entry['data'].value()
+        self.assertEqual( entry.raw(), b'02.10' )
+        self.assertEqual( Field_Entry( FHDR_Field.NUMI, BCS_N( b'003', 3 ) ).raw(), b'003' )
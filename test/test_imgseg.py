@@ -0,0 +1,206 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+from contextlib import contextmanager
+import os
+import struct
+import tempfile
+import unittest
+
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf.core import load_nitf
+from tmns.nitf.image.factory import Driver_Factory
+from tmns.nitf.image.layout import EMPTY_BLOCK
+from tmns.nitf.sidecar import ( Sidecar,
+                                sidecar_path )
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           write_nitf )
+from test_raw_driver import encode_blocks
+
+
+def counting_reads( segment ):
+    '''
+    Record the length of every read of a segment's image data.
+    '''
+    reads = []
+    open_data = segment.open_data
+
+    @contextmanager
+    def counting_open_data():
+        with open_data() as read:
+            yield lambda offset, length: reads.append( length ) or read( offset, length )
+
+    segment.open_data = counting_open_data
+    return reads
+
+
+class TEST_imgseg_Window_Reads(unittest.TestCase):
+
+    def setUp( self ):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pathname = os.path.join( self.temp_dir.name, 'window.ntf' )
+
+        rng = np.random.default_rng( 3 )
+        self.image = rng.integers( 0, 60000, ( 11, 13, 3 ) ).astype( np.uint16 )
+
+    def tearDown( self ):
+        self.temp_dir.cleanup()
+
+    def load( self, imode, nppbv = 4, nppbh = 5, **kwargs ):
+
+        data, nbpr, nbpc = encode_blocks( self.image, imode, nppbv, nppbh, '>u2' )
+        subheader = build_image_subheader( 11, 13, nbands = 3, imode = imode, nbpr = nbpr, nbpc = nbpc,
+                                           nppbh = nppbh, nppbv = nppbv, nbpp = 16 )
+        write_nitf( self.pathname, images = [ ( subheader, data ) ] )
+        return load_nitf( self.pathname, img_factory = Driver_Factory.default(), **kwargs )
+
+    def test_windows( self ):
+
+        windows = [ ( 0, 0, 11, 13 ), ( 3, 4, 2, 2 ), ( 5, 6, 6, 7 ), ( 10, 12, 1, 1 ) ]
+        for imode in [ 'B', 'P', 'R', 'S' ]:
+            for kwargs in [ {}, { 'use_mmap': True }, { 'metadata_only': True } ]:
+
+                nitf = self.load( imode, **kwargs )
+                segment = nitf.image_segments[0]
+                for row, col, height, width in windows:
+                    with self.subTest( imode = imode, kwargs = kwargs, window = ( row, col, height, width ) ):
+                        expected = self.image[row:(row + height), col:(col + width)]
+                        np.testing.assert_array_equal( segment.read_window( row, col, height, width ), expected )
+                        np.testing.assert_array_equal( segment.read_window( row, col, height, width, bands = [ 2, 0 ] ),
+                                                       expected[:, :, [ 2, 0 ]] )
+                        np.testing.assert_array_equal( segment.read_window( row, col, height, width, bands = [ 1 ] ),
+                                                       expected[:, :, 1] )
+                nitf.close()
+
+        with self.assertRaises( ValueError ):
+            segment.read_window( 8, 0, 4, 4 )
+
+    def test_read_block( self ):
+
+        nitf = self.load( 'P', metadata_only = True )
+        segment = nitf.image_segments[0]
+
+        np.testing.assert_array_equal( segment.read_block( 1, 1 ), self.image[4:8, 5:10] )
+
+        #  Edge blocks keep their padding
+        block = segment.read_block( 2, 2 )
+        self.assertEqual( block.shape, ( 4, 5, 3 ) )
+        np.testing.assert_array_equal( block[:3, :3], self.image[8:11, 10:13] )
+
+        with self.assertRaises( IndexError ):
+            segment.read_block( 3, 0 )
+
+        np.testing.assert_array_equal( segment.read_window( 1, 0, 10, 13, reduce = 1 ), self.image[1::2, ::2] )
+
+    def test_get_image_reduce( self ):
+
+        #  Images other than JPEG 2000 are decimated
+        nitf = self.load( 'B' )
+        np.testing.assert_array_equal( nitf.get_image( reduce = 1 ), self.image[::2, ::2] )
+        np.testing.assert_array_equal( nitf.image_segments[0].get_image( reduce = 2 ), self.image[::4, ::4] )
+        nitf.close()
+
+    def test_partial_reads( self ):
+
+        #  A single block image only has the window's rows read
+        nitf = self.load( 'B', nppbv = 11, nppbh = 13, metadata_only = True )
+        segment = nitf.image_segments[0]
+
+        reads = counting_reads( segment )
+        np.testing.assert_array_equal( segment.read_window( 2, 3, 2, 4 ), self.image[2:4, 3:7] )
+        self.assertEqual( reads, [ 2 * 13 * 2 ] * 3 )
+
+
+class TEST_imgseg_Masked_Reads(unittest.TestCase):
+
+    def setUp( self ):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pathname = os.path.join( self.temp_dir.name, 'masked.ntf' )
+
+        #  3x3 blocks of 2x2 pixels, where only the diagonal blocks have data and the pad value is 7
+        self.image = np.arange( 1, 37, dtype = np.uint8 ).reshape( 6, 6 )
+        blocks  = b''
+        offsets = []
+        for block_row in range( 3 ):
+            for block_col in range( 3 ):
+                if block_row == block_col:
+                    offsets.append( len(blocks) )
+                    blocks += self.image[(2 * block_row):(2 * block_row + 2), (2 * block_col):(2 * block_col + 2)].tobytes()
+                else:
+                    offsets.append( 0xFFFFFFFF )
+
+        table = struct.pack( '>HHHB', 4, 0, 8, 7 ) + struct.pack( f'>{len(offsets)}I', *offsets )
+        self.imdatoff = 4 + len(table)
+        data = struct.pack( '>I', self.imdatoff ) + table + blocks
+
+        self.expected = np.full( ( 6, 6 ), 7, dtype = np.uint8 )
+        for block in range( 3 ):
+            rows = slice( 2 * block, 2 * block + 2 )
+            self.expected[rows, rows] = self.image[rows, rows]
+
+        subheader = build_image_subheader( 6, 6, ic = 'NM', nbpr = 3, nbpc = 3, nppbh = 2, nppbv = 2 )
+        write_nitf( self.pathname, images = [ ( subheader, data ) ] )
+
+    def tearDown( self ):
+        self.temp_dir.cleanup()
+
+    def test_block_offsets( self ):
+
+        segment = load_nitf( self.pathname, metadata_only = True ).image_segments[0]
+        offsets = segment.get_block_offsets()
+
+        self.assertEqual( offsets.shape, ( 1, 3, 3 ) )
+        self.assertEqual( offsets[0].diagonal().tolist(), [ self.imdatoff, self.imdatoff + 4, self.imdatoff + 8 ] )
+        self.assertEqual( int( ( offsets == EMPTY_BLOCK ).sum() ), 6 )
+        self.assertEqual( segment.get_pad_value(), 7 )
+        self.assertEqual( segment.get_mask().tpxcdlnth, 8 )
+
+    def test_windows( self ):
+
+        for kwargs in [ {}, { 'use_mmap': True }, { 'metadata_only': True } ]:
+            nitf = load_nitf( self.pathname, img_factory = Driver_Factory.default(), **kwargs )
+            segment = nitf.image_segments[0]
+            with self.subTest( kwargs = kwargs ):
+                np.testing.assert_array_equal( segment.read_window( 0, 0, 6, 6 ), self.expected )
+                np.testing.assert_array_equal( segment.read_window( 1, 1, 3, 4 ), self.expected[1:4, 1:5] )
+                np.testing.assert_array_equal( segment.read_block( 0, 1 ), np.full( ( 2, 2 ), 7 ) )
+                np.testing.assert_array_equal( nitf.get_image(), self.expected )
+            nitf.close()
+
+    def test_empty_blocks_skip_io( self ):
+
+        segment = load_nitf( self.pathname, metadata_only = True ).image_segments[0]
+        segment.get_block_offsets()
+
+        reads = counting_reads( segment )
+        np.testing.assert_array_equal( segment.read_window( 0, 2, 2, 4 ), np.full( ( 2, 4 ), 7 ) )
+        self.assertEqual( reads, [] )
+
+    def test_sidecar( self ):
+
+        load_nitf( self.pathname, sidecar = True )
+        index = Sidecar.read( sidecar_path( self.pathname ) )
+        self.assertEqual( index.pad_values, [ 7 ] )
+        self.assertEqual( int( index.block_tables[0][0, 2, 2] ), self.imdatoff + 8 )
+
+        #  With the sidecar, neither the mask table nor empty blocks are read
+        segment = load_nitf( self.pathname, metadata_only = True, sidecar = True ).image_segments[0]
+        reads = counting_reads( segment )
+        np.testing.assert_array_equal( segment.read_window( 0, 0, 4, 4 ), self.expected[:4, :4] )
+        self.assertEqual( reads, [ 4, 4 ] )
+        self.assertIsNone( segment.mask )
@@ -0,0 +1,157 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import os
+import struct
+import tempfile
+import tracemalloc
+import unittest
+
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf.core import load_nitf
+from tmns.nitf.enums import ImageCompression
+from tmns.nitf.image import pil_j2k_driver
+from tmns.nitf.image.factory import Driver_Factory
+from tmns.nitf.image.j2k_codestream import ( SOT,
+                                             Codestream,
+                                             decode_window )
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           write_nitf )
+from test_imgseg import counting_reads
+from test_pil_j2k_driver import encode_j2k
+
+
+def reader( buffer ):
+    return lambda offset, length: buffer[offset:(offset + length)]
+
+
+def add_tlm( codestream ):
+    '''
+    Insert a TLM marker, with 2-byte tile indices and 4-byte lengths, before the first tile-part.
+    '''
+    table = Codestream.scan( reader( codestream ), len(codestream) ).tile_parts
+    body  = b''.join( struct.pack( '>HI', int( row['tile'] ), int( row['length'] ) ) for row in table )
+    tlm   = struct.pack( '>HHBB', 0xFF55, 4 + len(body), 0, 0x60 ) + body
+
+    first = codestream.index( struct.pack( '>H', SOT ) )
+    return codestream[:first] + tlm + codestream[first:]
+
+
+@unittest.skipUnless( pil_j2k_driver.is_available(), 'Pillow was built without OpenJPEG' )
+class TEST_j2k_codestream_Codestream(unittest.TestCase):
+
+    def setUp( self ):
+
+        rng = np.random.default_rng( 6 )
+        self.image = rng.integers( 0, 255, ( 100, 130 ), dtype = np.uint8 )
+        self.codestream = encode_j2k( self.image, tile_size = ( 32, 32 ), num_resolutions = 4 )
+
+    def test_main_header( self ):
+
+        codestream = Codestream.scan( reader( self.codestream ), len(self.codestream) )
+
+        self.assertEqual( ( codestream.nrows(), codestream.ncols(), codestream.nbands() ), ( 100, 130, 1 ) )
+        self.assertEqual( codestream.components[0][:2], ( 8, False ) )
+        self.assertEqual( ( codestream.tile_rows(), codestream.tile_cols() ), ( 4, 5 ) )
+        self.assertEqual( codestream.levels, 3 )
+        self.assertTrue( codestream.reversible )
+        self.assertFalse( codestream.has_tlm )
+
+        #  Tile-parts are contiguous and cover the codestream
+        table = codestream.tile_parts
+        self.assertEqual( table['tile'].tolist(), list( range( 20 ) ) )
+        self.assertEqual( int( table['offset'][0] ), codestream.header_length )
+        self.assertTrue( np.array_equal( table['offset'][1:], table['offset'][:-1] + table['length'][:-1] ) )
+        self.assertEqual( int( table['offset'][-1] + table['length'][-1] ), len(self.codestream) - 2 )
+
+        self.assertEqual( codestream.tiles_in_region( 40, 60, 10, 40 ).tolist(), [ 6, 7, 8 ] )
+
+    def test_tlm( self ):
+
+        data = add_tlm( self.codestream )
+        reads = []
+        def counting_read( offset, length ):
+            reads.append( length )
+            return data[offset:(offset + length)]
+
+        codestream = Codestream.scan( counting_read, len(data) )
+
+        self.assertTrue( codestream.has_tlm )
+        self.assertTrue( np.array_equal( codestream.tile_parts, Codestream.walk_tile_parts( reader( data ), codestream.header_length, len(data) ) ) )
+
+        #  No tile-part is visited when TLM is present
+        self.assertTrue( all( length != 2 + 10 for length in reads ) )
+
+        #  The decoder accepts the rewritten codestream
+        np.testing.assert_array_equal( np.asarray( pil_j2k_driver.Pillow_J2K_Driver.open( data ) ), self.image )
+
+        #  Extracted codestreams drop TLM, whose lengths no longer apply
+        extracted = codestream.extract( reader( data ), [ 6, 7, 8 ] )
+        self.assertFalse( Codestream.scan( reader( extracted ), len(extracted) ).has_tlm )
+
+        driver = pil_j2k_driver.Pillow_J2K_Driver()
+        for reduce in [ 0, 1 ]:
+            window = driver.decode( ImageCompression.C8, extracted, region = ( 40, 60, 10, 40 ), reduce = reduce )
+            if reduce == 0:
+                np.testing.assert_array_equal( window, self.image[40:50, 60:100] )
+            else:
+                self.assertEqual( window.shape, ( 5, 20 ) )
+
+    def test_bounded_window( self ):
+
+        rng = np.random.default_rng( 7 )
+        image = rng.integers( 0, 255, ( 512, 512 ), dtype = np.uint8 )
+        data  = encode_j2k( image, tile_size = ( 64, 64 ) )
+        driver = pil_j2k_driver.Pillow_J2K_Driver()
+
+        #  Only the window and a tile are allocated, never the 256 KiB image
+        tracemalloc.start()
+        try:
+            window = driver.decode( ImageCompression.C8, data, region = ( 300, 400, 40, 90 ) )
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        np.testing.assert_array_equal( window, image[300:340, 400:490] )
+        self.assertEqual( window.nbytes, 40 * 90 )
+        self.assertLess( peak, 128 * 1024 )
+
+        #  Tiles away from the origin, on their own or together
+        decode = lambda tile: driver.decode_codestream( tile, 0 )
+        np.testing.assert_array_equal( decode_window( data, ( 448, 448, 64, 64 ), 0, decode ), image[448:, 448:] )
+        np.testing.assert_array_equal( decode_window( data, ( 300, 400, 40, 90 ), 0, decode, area = 'window' ), image[300:340, 400:490] )
+        np.testing.assert_array_equal( decode_window( data, ( 300, 400, 40, 90 ), 0, decode, area = 'origin' ), image[300:340, 400:490] )
+
+        with self.assertRaises( ValueError ):
+            decode_window( data, ( 0, 0, 8, 8 ), 0, decode, area = 'image' )
+
+    def test_window_reads( self ):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            pathname = os.path.join( temp_dir, 'tiles.ntf' )
+            subheader = build_image_subheader( 100, 130, ic = 'C8', comrat = 'N001' )
+            write_nitf( pathname, images = [ ( subheader, self.codestream ) ] )
+
+            segment = load_nitf( pathname, img_factory = Driver_Factory.default(), metadata_only = True ).image_segments[0]
+            self.assertEqual( segment.get_codestream().ncols(), 130 )
+
+            #  Only the main header and the window's tile-parts are read
+            reads = counting_reads( segment )
+            np.testing.assert_array_equal( segment.read_window( 40, 60, 10, 40 ), self.image[40:50, 60:100] )
+
+            table = segment.get_codestream().tile_parts
+            self.assertEqual( sum( reads ), segment.get_codestream().header_length + int( table['length'][6:9].sum() ) )
@@ -0,0 +1,161 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import io
+import os
+import pickle
+import struct
+import tempfile
+import unittest
+
+import numpy as np
+
+#  Pillow
+from PIL import Image
+
+#  Terminus Libraries
+from tmns.nitf.core import load_nitf
+from tmns.nitf.enums import ImageCompression
+from tmns.nitf.image import jpeg_driver
+from tmns.nitf.image.factory import Driver_Factory
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           write_nitf )
+
+
+def encode_jpeg_blocks( image, nppbv, nppbh ):
+    '''
+    Encode each block of an image as its own JPEG stream.  Returns the
+    streams in block order, and the image as they decode, both padded to
+    whole blocks.
+    '''
+    nbpc = -(-image.shape[0] // nppbv)
+    nbpr = -(-image.shape[1] // nppbh)
+    padded = np.zeros( ( nbpc * nppbv, nbpr * nppbh ) + image.shape[2:], dtype = np.uint8 )
+    padded[:image.shape[0], :image.shape[1]] = image
+
+    streams  = []
+    expected = np.zeros_like( padded )
+    for block_row in range( nbpc ):
+        for block_col in range( nbpr ):
+            rows = slice( block_row * nppbv, ( block_row + 1 ) * nppbv )
+            cols = slice( block_col * nppbh, ( block_col + 1 ) * nppbh )
+
+            output = io.BytesIO()
+            Image.fromarray( padded[rows, cols] ).save( output, format = 'JPEG', quality = 90 )
+            streams.append( output.getvalue() )
+            expected[rows, cols] = np.asarray( Image.open( io.BytesIO( streams[-1] ) ) )
+
+    return streams, expected, nbpr, nbpc
+
+
+@unittest.skipUnless( jpeg_driver.is_available(), 'Pillow was built without libjpeg' )
+class TEST_jpeg_driver_JPEG_Driver(unittest.TestCase):
+
+    def setUp( self ):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pathname = os.path.join( self.temp_dir.name, 'jpeg.ntf' )
+
+        rng  = np.random.default_rng( 12 )
+        grid = np.linspace( 0, 4 * np.pi, 50 )
+        base = 120 + 60 * np.sin( grid )[:, None] * np.cos( grid[:45] )[None, :]
+        self.gray  = np.clip( base + rng.normal( 0, 5, base.shape ), 0, 255 ).astype( np.uint8 )
+        self.color = np.stack( [ self.gray, 255 - self.gray, self.gray // 2 ], axis = 2 )
+
+    def tearDown( self ):
+        self.temp_dir.cleanup()
+
+    def load( self, data, nbands = 1, **kwargs ):
+
+        subheader = build_image_subheader( 50, 45, nbands = nbands, nppbh = 16, nppbv = 16, **kwargs )
+        write_nitf( self.pathname, images = [ ( subheader, data ) ] )
+        return load_nitf( self.pathname, img_factory = Driver_Factory.default() )
+
+    def test_default_driver( self ):
+
+        factory = Driver_Factory.default()
+        self.assertIs( factory.decode_drivers[ImageCompression.C3], factory.decode_drivers[ImageCompression.M3] )
+
+    def test_decode( self ):
+
+        for image, imode in [ ( self.gray, 'B' ), ( self.color, 'P' ) ]:
+            streams, expected, nbpr, nbpc = encode_jpeg_blocks( image, 16, 16 )
+            nitf = self.load( b''.join( streams ), nbands = image.ndim == 3 and 3 or 1,
+                              ic = 'C3', imode = imode, nbpr = nbpr, nbpc = nbpc )
+            with self.subTest( imode = imode ):
+                np.testing.assert_array_equal( nitf.get_image(), expected[:50, :45] )
+
+                #  Decoding on one thread gives the same image
+                driver = jpeg_driver.JPEG_Driver( { 'max_workers': 1 } )
+                np.testing.assert_array_equal( driver.decode( ImageCompression.C3,
+                                                              nitf.image_segments[0].get_buffer(),
+                                                              nitf.image_segments[0].subheader ),
+                                               expected[:50, :45] )
+
+    def test_pickle( self ):
+
+        #  A driver whose pool has started can still be sent to a worker process
+        streams, expected, nbpr, nbpc = encode_jpeg_blocks( self.gray, 16, 16 )
+        nitf   = self.load( b''.join( streams ), ic = 'C3', nbpr = nbpr, nbpc = nbpc )
+        driver = jpeg_driver.JPEG_Driver( { 'max_workers': 2 } )
+        driver.decode( ImageCompression.C3, nitf.image_segments[0].get_buffer(), nitf.image_segments[0].subheader )
+        self.assertIsNotNone( driver.executor )
+
+        copy = pickle.loads( pickle.dumps( driver ) )
+        self.assertEqual( copy.config, driver.config )
+        np.testing.assert_array_equal( copy.decode( ImageCompression.C3,
+                                                    nitf.image_segments[0].get_buffer(),
+                                                    nitf.image_segments[0].subheader ),
+                                       expected[:50, :45] )
+        driver.close()
+        copy.close()
+
+    def test_band_sequential( self ):
+
+        planes = [ encode_jpeg_blocks( self.color[:, :, band], 16, 16 ) for band in range( 3 ) ]
+        data   = b''.join( b''.join( plane[0] ) for plane in planes )
+        nitf   = self.load( data, nbands = 3, ic = 'C3', imode = 'S', nbpr = 3, nbpc = 4 )
+
+        expected = np.stack( [ plane[1][:50, :45] for plane in planes ], axis = 2 )
+        np.testing.assert_array_equal( nitf.get_image(), expected )
+
+    def test_masked( self ):
+
+        #  Blocks are stored out of order, and the second block has no data
+        streams, expected, nbpr, nbpc = encode_jpeg_blocks( self.gray, 16, 16 )
+        offsets = [ 0xFFFFFFFF ] * len(streams)
+        blocks  = b''
+        for idx in reversed( range( len(streams) ) ):
+            if idx != 1:
+                offsets[idx] = len(blocks)
+                blocks += streams[idx]
+
+        table = struct.pack( '>HHHB', 4, 0, 8, 9 ) + struct.pack( f'>{len(offsets)}I', *offsets )
+        data  = struct.pack( '>I', 4 + len(table) ) + table + blocks
+        nitf  = self.load( data, ic = 'M3', nbpr = nbpr, nbpc = nbpc )
+
+        expected[0:16, 16:32] = 9
+        np.testing.assert_array_equal( nitf.get_image(), expected[:50, :45] )
+
+    def test_find_streams( self ):
+
+        streams, _, _, _ = encode_jpeg_blocks( self.gray, 16, 16 )
+        data = b''.join( streams )
+
+        found = jpeg_driver.find_streams( data )
+        self.assertEqual( [ length for _, length in found ], [ len(stream) for stream in streams ] )
+        self.assertEqual( len(jpeg_driver.find_streams( data, 0, 3 )), 3 )
+
+        with self.assertRaises( ValueError ):
+            jpeg_driver.find_streams( data[:-100] )
@@ -0,0 +1,101 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf.enums import ImageCompression
+from tmns.nitf.image import ( opj_driver,
+                              pil_j2k_driver )
+from tmns.nitf.image.j2k_codestream import Codestream
+
+#  Unit-Test Utilities
+from test_pil_j2k_driver import encode_j2k
+
+
+class TEST_opj_driver_Pickle(unittest.TestCase):
+
+    def test_pickle( self ):
+
+        driver = opj_driver.OPJ_Driver( { 'max_workers': 3, 'timeout': 5 } )
+        driver.decode_many( ImageCompression.C8, [] )
+
+        copy = pickle.loads( pickle.dumps( driver ) )
+        self.assertEqual( copy.config, driver.config )
+        self.assertIsNone( copy.executor )
+        driver.close()
+
+
+@unittest.skipUnless( pil_j2k_driver.is_available(), 'Pillow was built without OpenJPEG' )
+class TEST_opj_driver_Planes(unittest.TestCase):
+
+    def setUp( self ):
+
+        rng = np.random.default_rng( 9 )
+        self.image = rng.integers( 0, 256, ( 37, 45, 3 ) ).astype( np.uint8 )
+        self.codestream = encode_j2k( self.image )
+
+    def test_read_planes( self ):
+
+        codestream = Codestream.scan( lambda offset, length: self.codestream[offset:(offset + length)], len(self.codestream) )
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            #  Planes are written one band after another, and each dimension is rounded up when reduced
+            pathname = os.path.join( temp_dir, 'planes.rawl' )
+            self.image.transpose( 2, 0, 1 ).tofile( pathname )
+            np.testing.assert_array_equal( opj_driver.OPJ_Driver.read_planes( pathname, codestream, 0 ), self.image )
+
+            self.image[::2, ::2].transpose( 2, 0, 1 ).tofile( pathname )
+            self.assertEqual( opj_driver.OPJ_Driver.read_planes( pathname, codestream, 1 ).shape, ( 19, 23, 3 ) )
+
+            with self.assertRaises( RuntimeError ):
+                opj_driver.OPJ_Driver.read_planes( pathname, codestream, 0 )
+
+    def test_failed_run( self ):
+
+        #  The exit status is checked, and temporary files are removed
+        with tempfile.TemporaryDirectory() as temp_dir:
+            driver = opj_driver.OPJ_Driver( { 'executable': 'false', 'tempdir': temp_dir } )
+            with self.assertRaises( RuntimeError ):
+                driver.decode( ImageCompression.C8, self.codestream )
+            self.assertEqual( os.listdir( temp_dir ), [] )
+
+
+@unittest.skipUnless( opj_driver.is_available() and pil_j2k_driver.is_available(), 'opj_decompress is not installed' )
+class TEST_opj_driver_OPJ_Driver(unittest.TestCase):
+
+    def setUp( self ):
+
+        rng = np.random.default_rng( 10 )
+        self.images = [ rng.integers( 0, 256, ( 64, 80 ) ).astype( np.uint8 ) for _ in range( 4 ) ]
+        self.codestreams = [ encode_j2k( image, tile_size = ( 32, 32 ) ) for image in self.images ]
+        self.driver = opj_driver.OPJ_Driver( { 'max_workers': 2 } )
+
+    def tearDown( self ):
+        self.driver.close()
+
+    def test_decode( self ):
+
+        np.testing.assert_array_equal( self.driver.decode( ImageCompression.C8, self.codestreams[0] ), self.images[0] )
+        np.testing.assert_array_equal( self.driver.decode( ImageCompression.C8, self.codestreams[0], region = ( 10, 40, 20, 30 ) ),
+                                       self.images[0][10:30, 40:70] )
+        self.assertEqual( self.driver.decode( ImageCompression.C8, self.codestreams[0], reduce = 1 ).shape, ( 32, 40 ) )
+
+    def test_decode_many( self ):
+
+        for image, decoded in zip( self.images, self.driver.decode_many( ImageCompression.C8, self.codestreams ) ):
+            np.testing.assert_array_equal( decoded, image )
@@ -0,0 +1,106 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import unittest
+
+#  Terminus Libraries
+from tmns.nitf.fhdr import ( HL_END,
+                             HL_START,
+                             File_Header )
+from tmns.nitf.imsubhdr import ( Field as IMGSUB_Field,
+                                 Image_Subheader )
+from tmns.nitf.utils import Buffer_Reader
+
+#  Unit-Test Utilities
+from legacy_header_parser import ( parse_file_header,
+                                   parse_image_subheader )
+from nitf_builder import ( build_image_subheader,
+                           build_nitf,
+                           build_tre )
+
+
+def entry_list( data ):
+    '''
+    Entries in order as ( field, bytes, value ).
+    '''
+    return [ ( data[idx]['field'], bytes( data[idx]['data'].data ), data[idx]['data'].value() ) for idx in sorted( data ) ]
+
+
+def tre_records( tres ):
+    return list( getattr( tres, 'records', tres ) )
+
+
+class TEST_parse_plan_Parity(unittest.TestCase):
+    '''
+    The `Field_Run` parse plans give the same fields as the field-by-field parsers they replaced.
+    '''
+    def setUp( self ):
+
+        tres = build_tre( 'TSTTRA', b'alpha' ) + build_tre( 'TSTTRB', b'0123456789' )
+
+        self.subheaders = { 'single band':   build_image_subheader( 64, 32 ),
+                            'pixel bands':   build_image_subheader( 64, 32, nbands = 3, imode = 'P' ),
+                            'xbands':        build_image_subheader( 64, 32, nbands = 12, imode = 'S' ),
+                            'compressed':    build_image_subheader( 64, 32, ic = 'C8', comrat = 'N001' ),
+                            'comments':      build_image_subheader( 64, 32, comments = [ 'First', 'Second', 'Third' ] ),
+                            'luts':          build_image_subheader( 64, 32, nbands = 2, irep = 'RGB/LUT',
+                                                                    luts = [ [ bytes( range( 4 ) ), bytes( range( 4, 8 ) ) ], [] ] ),
+                            'tres':          build_image_subheader( 64, 32, udid = tres, ixshd = tres ) }
+
+        images = [ ( subheader, b'' ) for subheader in self.subheaders.values() ]
+        nitf   = build_nitf( images   = images,
+                             graphics = [ ( b'S' * 10, b'g' * 5 ) ],
+                             texts    = [ ( b'T' * 12, b'text' ) ],
+                             des      = [ ( b'D' * 20, b'des' ) ],
+                             xhd      = tres )
+        self.file_header = nitf[:int( nitf[HL_START:HL_END] )]
+
+    def test_file_header( self ):
+
+        data, udhd, xhd = parse_file_header( self.file_header )
+        header = File_Header.parse_buffer( self.file_header )
+
+        self.assertEqual( entry_list( header.data ), entry_list( data ) )
+        self.assertEqual( tre_records( header.udhd ), udhd )
+        self.assertEqual( tre_records( header.xhd ), xhd )
+        self.assertEqual( len(xhd), 2 )
+
+    def test_image_subheader( self ):
+
+        for name, buffer in self.subheaders.items():
+            with self.subTest( name ):
+
+                data, udid, ixshd = parse_image_subheader( buffer )
+                subheader = Image_Subheader.parse_buffer( buffer )
+
+                self.assertEqual( entry_list( subheader.data ), entry_list( data ) )
+                self.assertEqual( tre_records( subheader.udid ), udid )
+                self.assertEqual( tre_records( subheader.ixshd ), ixshd )
+
+    def test_overflow( self ):
+        '''
+        UDIDL counts the 3 byte UDOFL, which is the start of UDID at every
+        length.  The field-by-field parser read UDOFL as a field of its own
+        when UDIDL was 99999, then read UDIDL more bytes, 3 past the end of
+        the section.  This is the one case where the parse plan differs.
+        '''
+        tre       = build_tre( 'TSTTRE', b'x' * ( 99999 - 3 - 11 ) )
+        buffer    = build_image_subheader( 64, 32, udid = tre, ixshd = tre )
+        reader    = Buffer_Reader( buffer )
+        subheader = Image_Subheader.parse_reader( reader )
+
+        self.assertEqual( reader.remaining(), 0 )
+        self.assertEqual( subheader.get( IMGSUB_Field.UDIDL )['data'].value(), 99999 )
+        self.assertEqual( subheader.get( IMGSUB_Field.IXSHDL )['data'].value(), 99999 )
+        self.assertEqual( tre_records( subheader.udid ), [ ( b'TSTTRE', b'99985', b'x' * 99985 ) ] )
+        self.assertEqual( tre_records( subheader.ixshd ), tre_records( subheader.udid ) )
+        self.assertNotIn( IMGSUB_Field.UDOFL, [ entry['field'] for entry in subheader.data.values() ] )
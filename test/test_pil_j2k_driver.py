@@ -0,0 +1,124 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import io
+import os
+import struct
+import tempfile
+import unittest
+
+import numpy as np
+
+#  Pillow
+from PIL import Image
+
+#  Terminus Libraries
+from tmns.nitf.core import load_nitf
+from tmns.nitf.enums import ImageCompression
+from tmns.nitf.image import pil_j2k_driver
+from tmns.nitf.image.factory import Driver_Factory
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           write_nitf )
+
+
+def encode_j2k( image, **kwargs ):
+    '''
+    Losslessly encode an image as a raw JPEG 2000 codestream.
+    '''
+    output = io.BytesIO()
+    Image.fromarray( image ).save( output, format = 'JPEG2000', no_jp2 = True, **kwargs )
+    return output.getvalue()
+
+
+@unittest.skipUnless( pil_j2k_driver.is_available(), 'Pillow was built without OpenJPEG' )
+class TEST_pil_j2k_driver_Pillow_J2K_Driver(unittest.TestCase):
+
+    def setUp( self ):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pathname = os.path.join( self.temp_dir.name, 'j2k.ntf' )
+        self.factory  = Driver_Factory.default()
+
+    def tearDown( self ):
+        self.temp_dir.cleanup()
+
+    def test_default_driver( self ):
+
+        self.assertIsInstance( self.factory.decode_drivers[ImageCompression.C8], pil_j2k_driver.Pillow_J2K_Driver )
+
+    def test_decode( self ):
+
+        rng = np.random.default_rng( 4 )
+        images = [ rng.integers( 0, 255, ( 40, 50 ), dtype = np.uint8 ),
+                   rng.integers( 0, 255, ( 40, 50, 3 ), dtype = np.uint8 ),
+                   rng.integers( 0, 4096, ( 40, 50 ) ).astype( np.uint16 ) ]
+
+        for image in images:
+            nbands = 1 if image.ndim == 2 else image.shape[2]
+            subheader = build_image_subheader( 40, 50, nbands = nbands, imode = 'P' if nbands > 1 else 'B',
+                                               nbpp = 8 * image.itemsize, ic = 'C8', comrat = 'N001' )
+            write_nitf( self.pathname, images = [ ( subheader, encode_j2k( image ) ) ] )
+
+            for kwargs in [ {}, { 'use_mmap': True }, { 'metadata_only': True } ]:
+                with self.subTest( shape = image.shape, dtype = image.dtype, kwargs = kwargs ):
+                    nitf = load_nitf( self.pathname, img_factory = self.factory, **kwargs )
+                    output = nitf.get_image()
+                    self.assertEqual( output.dtype, image.dtype )
+                    np.testing.assert_array_equal( output, image )
+                    nitf.close()
+
+    def test_masked( self ):
+
+        image = np.arange( 40 * 50, dtype = np.uint16 ).reshape( 40, 50 ).astype( np.uint8 )
+
+        #  A mask table without block or pad masks, followed by the codestream
+        data = struct.pack( '>IHHH', 10, 0, 0, 0 ) + encode_j2k( image )
+        subheader = build_image_subheader( 40, 50, ic = 'M8', comrat = 'N001' )
+        write_nitf( self.pathname, images = [ ( subheader, data ) ] )
+
+        nitf = load_nitf( self.pathname, img_factory = self.factory )
+        np.testing.assert_array_equal( nitf.get_image(), image )
+
+    def test_region_and_reduce( self ):
+
+        rng = np.random.default_rng( 5 )
+        image = rng.integers( 0, 255, ( 40, 50, 3 ), dtype = np.uint8 )
+        codestream = encode_j2k( image, tile_size = ( 16, 16 ) )
+
+        subheader = build_image_subheader( 40, 50, nbands = 3, imode = 'P', ic = 'C8', comrat = 'N001' )
+        write_nitf( self.pathname, images = [ ( subheader, codestream ) ] )
+        segment = load_nitf( self.pathname, img_factory = self.factory, metadata_only = True ).image_segments[0]
+
+        for window in [ ( 0, 0, 40, 50 ), ( 5, 7, 10, 20 ), ( 17, 33, 23, 17 ) ]:
+            row, col, height, width = window
+            with self.subTest( window = window ):
+                np.testing.assert_array_equal( segment.read_window( *window ), image[row:(row + height), col:(col + width)] )
+                np.testing.assert_array_equal( segment.read_window( *window, bands = [ 2 ] ), image[row:(row + height), col:(col + width), 2] )
+
+        #  Only the intersecting tiles are kept, and the others decode as zeros
+        partial = pil_j2k_driver.Pillow_J2K_Driver.open( pil_j2k_driver.select_tiles( codestream, ( 5, 7, 10, 5 ) ) )
+        partial = np.asarray( partial )
+        np.testing.assert_array_equal( partial[:16, :16], image[:16, :16] )
+        self.assertFalse( partial[16:, :].any() or partial[:, 16:].any() )
+
+        #  Reduced resolution matches Pillow's own reduction of the codestream
+        expected = pil_j2k_driver.Pillow_J2K_Driver.open( codestream )
+        expected.reduce = 1
+        expected.load()
+        expected = np.asarray( expected )
+
+        thumbnail = segment.get_image( reduce = 1 )
+        self.assertEqual( thumbnail.shape, ( 20, 25, 3 ) )
+        np.testing.assert_array_equal( thumbnail, expected )
+        np.testing.assert_array_equal( segment.read_window( 8, 10, 16, 20, reduce = 1 ), expected[4:12, 5:15] )
@@ -0,0 +1,151 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import os
+import struct
+import tempfile
+import unittest
+
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf.core import load_nitf
+from tmns.nitf.enums import ImageCompression
+from tmns.nitf.image.factory import Driver_Factory
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           write_nitf )
+
+
+def encode_blocks( image, imode, nppbv, nppbh, dtype ):
+    '''
+    Encode a (rows, cols, bands) image as NITF blocks, one block at a time.
+    '''
+    nrows, ncols, nbands = image.shape
+    nbpc = -(-nrows // nppbv)
+    nbpr = -(-ncols // nppbh)
+
+    padded = np.zeros( ( nbpc * nppbv, nbpr * nppbh, nbands ), dtype = image.dtype )
+    padded[:nrows, :ncols] = image
+
+    output = b''
+    planes = range( nbands ) if imode == 'S' else [ None ]
+    for plane in planes:
+        for block_row in range( nbpc ):
+            for block_col in range( nbpr ):
+                block = padded[(block_row * nppbv):((block_row + 1) * nppbv), (block_col * nppbh):((block_col + 1) * nppbh)]
+                if imode == 'S':
+                    block = block[:, :, plane]
+                elif imode == 'B':
+                    block = block.transpose( 2, 0, 1 )
+                elif imode == 'R':
+                    block = block.transpose( 0, 2, 1 )
+                output += np.ascontiguousarray( block ).astype( dtype ).tobytes()
+    return output, nbpr, nbpc
+
+
+class TEST_raw_driver_Raw_Driver(unittest.TestCase):
+
+    def setUp( self ):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pathname = os.path.join( self.temp_dir.name, 'raw.ntf' )
+        self.factory  = Driver_Factory.default()
+
+    def tearDown( self ):
+        self.temp_dir.cleanup()
+
+    def load( self, subheader, data, **kwargs ):
+
+        write_nitf( self.pathname, images = [ ( subheader, data ) ] )
+        return load_nitf( self.pathname, img_factory = self.factory, **kwargs )
+
+    def test_modes( self ):
+
+        rng = np.random.default_rng( 1 )
+        image = rng.integers( 0, 60000, ( 5, 7, 3 ) ).astype( np.uint16 )
+
+        for imode in [ 'B', 'P', 'R', 'S' ]:
+            data, nbpr, nbpc = encode_blocks( image, imode, 3, 3, '>u2' )
+            subheader = build_image_subheader( 5, 7, nbands = 3, imode = imode, nbpr = nbpr, nbpc = nbpc,
+                                               nppbh = 3, nppbv = 3, nbpp = 16 )
+            with self.subTest( imode = imode ):
+                np.testing.assert_array_equal( self.load( subheader, data ).get_image(), image )
+
+    def test_pixel_types( self ):
+
+        rng = np.random.default_rng( 2 )
+        for pvtype, nbpp, dtype in [ ( 'SI', 32, '>i4' ), ( 'R', 32, '>f4' ), ( 'C', 64, '>c8' ) ]:
+
+            image = rng.normal( size = ( 4, 6, 1 ) ).astype( dtype ) * 1000
+            if pvtype == 'C':
+                image = image + 1j * image
+            image = image.astype( dtype )
+
+            subheader = build_image_subheader( 4, 6, nbpp = nbpp, pvtype = pvtype )
+            with self.subTest( pvtype = pvtype ):
+                np.testing.assert_array_equal( self.load( subheader, image.tobytes() ).get_image(), image[:, :, 0] )
+
+    def test_bit_packed( self ):
+
+        #  12-bit pixels, packed two to three bytes
+        values = np.array( [ [ 0xABC, 0x123, 0xFFF ], [ 0x000, 0x800, 0x7FF ] ] )
+        bits   = ''.join( f'{value:012b}' for value in values.ravel() )
+        data   = int( bits, 2 ).to_bytes( len(bits) // 8, 'big' )
+
+        subheader = build_image_subheader( 2, 3, nbpp = 12 )
+        np.testing.assert_array_equal( self.load( subheader, data ).get_image(), values )
+
+        #  Bi-level pixels in two blocks, each padded to a byte
+        values = np.array( [ [ 1, 0, 1 ], [ 1, 1, 0 ] ] )
+        data   = bytes( [ 0b10111000, 0b10111000 ] )
+
+        subheader = build_image_subheader( 2, 6, nbpp = 1, pvtype = 'B', nbpr = 2, nppbh = 3 )
+        np.testing.assert_array_equal( self.load( subheader, data ).get_image(), np.hstack( [ values, values ] ) )
+
+    def test_zero_copy( self ):
+
+        image = np.arange( 4 * 5 * 3, dtype = np.uint8 ).reshape( 4, 5, 3 )
+        for imode in [ 'B', 'P', 'R', 'S' ]:
+
+            data, _, _ = encode_blocks( image, imode, 4, 5, '>u1' )
+            nitf = self.load( build_image_subheader( 4, 5, nbands = 3, imode = imode ), data, use_mmap = True )
+            with self.subTest( imode = imode ):
+                output = nitf.get_image()
+                np.testing.assert_array_equal( output, image )
+                self.assertTrue( np.shares_memory( output, np.frombuffer( nitf.image_segments[0].buffer, dtype = np.uint8 ) ) )
+            del output
+            nitf.close()
+
+    def test_masked( self ):
+
+        #  2x2 blocks of 2x2 pixels, where block (0, 1) has no data
+        image = np.arange( 16, dtype = np.uint8 ).reshape( 4, 4, 1 ) + 1
+        data, nbpr, nbpc = encode_blocks( image, 'B', 2, 2, '>u1' )
+        blocks = [ data[(idx * 4):((idx + 1) * 4)] for idx in range( 4 ) ]
+
+        mask  = struct.pack( '>IHHHB', 0, 4, 0, 8, 0xEE )
+        mask += struct.pack( '>IIII', 0, 0xFFFFFFFF, 4, 8 )
+        mask  = struct.pack( '>I', len(mask) ) + mask[4:]
+        data  = mask + blocks[0] + blocks[2] + blocks[3]
+
+        subheader = build_image_subheader( 4, 4, ic = 'NM', nbpr = 2, nbpc = 2, nppbh = 2, nppbv = 2 )
+        expected = image[:, :, 0].copy()
+        expected[0:2, 2:4] = 0xEE
+        np.testing.assert_array_equal( self.load( subheader, data ).get_image(), expected )
+
+    def test_requires_subheader( self ):
+
+        with self.assertRaises( ValueError ):
+            self.factory.decode( ImageCompression.NC, bytes( 4 ) )
+
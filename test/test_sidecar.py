@@ -0,0 +1,92 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+#  Terminus Libraries
+from tmns.nitf.core import load_nitf
+from tmns.nitf.fhdr import File_Header
+from tmns.nitf.sidecar import ( Sidecar,
+                                sidecar_path )
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           build_tre,
+                           write_nitf )
+
+
+class TEST_sidecar_Sidecar(unittest.TestCase):
+
+    def setUp( self ):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pathname = os.path.join( self.temp_dir.name, 'sample.ntf' )
+
+        #  A 4x6 image in 2x3 blocks of 2x2 pixels, and a compressed image with no block table
+        self.pixels = bytes( range( 24 * 3 ) )
+        images = [ ( build_image_subheader( 4, 6, nbands = 3, imode = 'P', nbpr = 3, nbpc = 2, nppbh = 2, nppbv = 2,
+                                            ixshd = build_tre( 'BLOCKA', b'0' * 123 ) ), self.pixels ),
+                   ( build_image_subheader( 2, 2, ic = 'C8', comrat = 'N001' ), bytes( 10 ) ) ]
+        write_nitf( self.pathname, images = images )
+
+    def tearDown( self ):
+        self.temp_dir.cleanup()
+
+    def test_round_trip( self ):
+
+        nitf  = load_nitf( self.pathname )
+        index = Sidecar.from_container( self.pathname, nitf )
+        other = Sidecar.from_bytes( index.to_bytes() )
+
+        self.assertEqual( other.header_bytes, index.header_bytes )
+        self.assertEqual( other.subheader_bytes, index.subheader_bytes )
+        self.assertEqual( [ repr( entry ) for entry in other.directory ], [ repr( entry ) for entry in nitf.segment_directory ] )
+        self.assertEqual( other.block_tables[0].shape, ( 1, 2, 3 ) )
+        self.assertEqual( other.block_tables[0].ravel().tolist(), [ 0, 12, 24, 36, 48, 60 ] )
+        self.assertIsNone( other.block_tables[1] )
+
+        with self.assertRaises( ValueError ):
+            Sidecar.from_bytes( b'NOTASIDECAR' + bytes( 64 ) )
+
+    def test_load_with_sidecar( self ):
+
+        cold = load_nitf( self.pathname, sidecar = True )
+        self.assertTrue( os.path.exists( sidecar_path( self.pathname ) ) )
+
+        #  A warm open never walks the NITF
+        with mock.patch.object( File_Header, 'parse_binary', side_effect = AssertionError( 'Walked the file' ) ):
+            warm = load_nitf( self.pathname, sidecar = True )
+            self.assertEqual( warm.as_kvp(), cold.as_kvp() )
+            self.assertEqual( warm.image_segments[0].buffer, self.pixels )
+            self.assertEqual( warm.image_segments[0].block_offsets.shape, ( 1, 2, 3 ) )
+
+            meta = load_nitf( self.pathname, sidecar = True, metadata_only = True )
+            self.assertEqual( meta.image_segments[0].get_buffer(), self.pixels )
+
+        #  A changed file makes the sidecar stale, so it is rebuilt
+        stat = os.stat( self.pathname )
+        os.utime( self.pathname, ns = ( stat.st_atime_ns, stat.st_mtime_ns + 1000 ) )
+        load_nitf( self.pathname, sidecar = True )
+        self.assertTrue( Sidecar.read( sidecar_path( self.pathname ) ).is_current( os.stat( self.pathname ) ) )
+
+    def test_write_failure( self ):
+
+        index = Sidecar.from_container( self.pathname, load_nitf( self.pathname ) )
+        with mock.patch.object( Sidecar, 'to_bytes', side_effect = OSError( 'Disk full' ) ):
+            with self.assertRaises( OSError ):
+                index.write( sidecar_path( self.pathname ) )
+
+        #  Neither the sidecar nor its temp file is left behind
+        self.assertEqual( os.listdir( self.temp_dir.name ), [ 'sample.ntf' ] )
@@ -0,0 +1,218 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import os
+import struct
+import tempfile
+import unittest
+
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf.core import load_nitf
+from tmns.nitf.enums import ImageCompression
+from tmns.nitf.image.factory import Driver_Factory
+from tmns.nitf.image.rpf import RPF_Locations
+from tmns.nitf.image.vq_driver import ( VQ_Driver,
+                                        unpack_codes )
+
+#  Unit-Test Utilities
+from nitf_builder import ( build_image_subheader,
+                           build_tre,
+                           build_nitf )
+
+
+def build_lookup_subsection( tables ):
+    '''
+    Compression lookup subsection for tables shaped (kernel rows, codes, kernel columns).
+    '''
+    nlookups, ncodes, nvalues = tables.shape
+    records_length = nlookups * 14
+
+    output = struct.pack( '>IH', 6, 14 )
+    for idx in range( nlookups ):
+        output += struct.pack( '>HIHHI', idx + 1, ncodes, nvalues, 8, 6 + records_length + idx * ncodes * nvalues )
+    return output + tables.tobytes()
+
+
+def build_colormap_subsection( colors ):
+    '''
+    Colormap subsection with one color table of RGBM elements.
+    '''
+    ncolors, element_length = colors.shape
+    return struct.pack( '>IH', 6, 17 ) + struct.pack( '>HIBHII', 2, ncolors, element_length, 4, 23, 0 ) + colors.tobytes()
+
+
+def build_rpf_frame( subheader_args, components, image_components, tre_offset = 0, image_offset = 0, tail = b'' ):
+    '''
+    Build an RPF frame whose RPFIMG TRE starts with a location section
+    followed by `components`, and whose image data is `image_components`,
+    each a list of (component ID, bytes).  The location section locates
+    itself as component 129.
+    '''
+    nrecords = 1 + len(components) + len(image_components)
+    location = 14 + nrecords * 10
+
+    records = [ ( 129, location, tre_offset ) ]
+    offset  = tre_offset + location
+    for component, data in components:
+        records.append( ( component, len(data), offset ) )
+        offset += len(data)
+
+    offset = image_offset
+    for component, data in image_components:
+        records.append( ( component, len(data), offset ) )
+        offset += len(data)
+
+    cedata  = struct.pack( '>HIHHI', location, 14, nrecords, 10, sum( record[1] for record in records ) )
+    cedata += b''.join( struct.pack( '>HII', *record ) for record in records )
+    cedata += b''.join( data for _, data in components )
+
+    subheader = build_image_subheader( **subheader_args, ixshd = build_tre( 'RPFIMG', cedata ) + tail )
+    data      = b''.join( data for _, data in image_components )
+    return build_nitf( images = [ ( subheader, data ) ] ), len(data)
+
+
+def pack_codes( codes ):
+    '''
+    Pack pairs of 12-bit codes into three bytes each.
+    '''
+    output = bytearray()
+    for first, second in zip( codes[0::2], codes[1::2] ):
+        output += bytes( [ first >> 4, ( ( first & 0x0F ) << 4 ) | ( second >> 8 ), second & 0xFF ] )
+    return bytes( output )
+
+
+class TEST_vq_driver_VQ_Driver(unittest.TestCase):
+
+    def setUp( self ):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pathname = os.path.join( self.temp_dir.name, 'vq.ntf' )
+
+        #  3x3 blocks of 16x16 pixels, each 4x4 codes of 4x4 kernels
+        rng = np.random.default_rng( 21 )
+        self.tables = rng.integers( 0, 216, ( 4, 4096, 4 ) ).astype( np.uint8 )
+        self.codes  = rng.integers( 0, 4096, ( 3, 3, 4, 4 ) ).astype( np.uint16 )
+        self.colors = rng.integers( 0, 256, ( 216, 4 ) ).astype( np.uint8 )
+
+        #  Expand code by code, as the reference
+        self.expected = np.zeros( ( 48, 48 ), dtype = np.uint8 )
+        for block_row, block_col, code_row, code_col in np.ndindex( self.codes.shape ):
+            row = block_row * 16 + code_row * 4
+            col = block_col * 16 + code_col * 4
+            for kernel_row in range( 4 ):
+                self.expected[row + kernel_row, col:(col + 4)] = self.tables[kernel_row, self.codes[block_row, block_col, code_row, code_col]]
+
+        #  Compression and color/grayscale sections are in RPFIMG, as in CADRG frames
+        self.components = [ ( 131, struct.pack( '>HHH', 1, 4, 0 ) ),
+                            ( 132, build_lookup_subsection( self.tables ) ),
+                            ( 134, struct.pack( '>BB12s', 1, 0, b' ' * 12 ) ),
+                            ( 135, build_colormap_subsection( self.colors ) ) ]
+
+        self.blocks = [ pack_codes( self.codes[block_row, block_col].ravel().tolist() )
+                        for block_row, block_col in np.ndindex( 3, 3 ) ]
+
+    def tearDown( self ):
+        self.temp_dir.cleanup()
+
+    def write( self, ic, image_components, tail = b'' ):
+        '''
+        Write the frame, then write it again with the file offsets of the
+        RPFIMG data and the image data, which do not change its layout.
+        '''
+        args = { 'nrows': 45, 'ncols': 42, 'ic': ic, 'nbpr': 3, 'nbpc': 3, 'nppbh': 16, 'nppbv': 16, 'irep': 'RGB/LUT' }
+
+        buffer, length = build_rpf_frame( args, self.components, image_components, tail = tail )
+        tre_offset     = buffer.index( b'RPFIMG' ) + 11
+        image_offset   = len(buffer) - length
+
+        buffer, _ = build_rpf_frame( args, self.components, image_components, tre_offset, image_offset, tail )
+        with open( self.pathname, 'wb' ) as fout:
+            fout.write( buffer )
+
+    def load( self, ic, image_components, **kwargs ):
+
+        self.write( ic, image_components, **kwargs )
+        return load_nitf( self.pathname, img_factory = Driver_Factory.default() )
+
+    def test_unpack_codes( self ):
+
+        codes = np.array( [ 0x123, 0xABC, 0xFFF, 0x001 ] )
+        packed = np.frombuffer( pack_codes( codes.tolist() ), dtype = np.uint8 )
+        np.testing.assert_array_equal( unpack_codes( packed ), codes )
+        np.testing.assert_array_equal( unpack_codes( np.stack( [ packed, packed ] ) ), np.stack( [ codes, codes ] ) )
+
+    def test_decode( self ):
+
+        nitf = self.load( 'C4', [ ( 140, b''.join( self.blocks ) ) ], tail = build_tre( 'TSTTRE', b'x' * 20 ) )
+        np.testing.assert_array_equal( nitf.get_image(), self.expected[:45, :42] )
+
+    def test_projection( self ):
+        '''
+        RPFIMG is kept by every projection of a C4 image, and the TREs
+        skipped after it still count towards its file offset.
+        '''
+        self.write( 'C4', [ ( 140, b''.join( self.blocks ) ) ], tail = build_tre( 'TSTTRE', b'x' * 20 ) )
+
+        for tres in ( [ 'RPFIMG' ], [ 'BLOCKA' ], [] ):
+            with self.subTest( tres = tres ):
+
+                nitf = load_nitf( self.pathname, img_factory = Driver_Factory.default(), tres = tres )
+                self.assertEqual( nitf.image_segments[0].subheader.ixshd.tags(), [ 'RPFIMG' ] )
+                np.testing.assert_array_equal( nitf.get_image(), self.expected[:45, :42] )
+
+    def test_location_record( self ):
+
+        #  Without the image data offset, RPFIMG locates itself
+        segment = self.load( 'C4', [ ( 140, b''.join( self.blocks ) ) ] ).image_segments[0]
+        locations = RPF_Locations.from_subheader( segment.subheader )
+        self.assertEqual( locations.image_offset, segment.offset )
+
+        image = VQ_Driver().decode( ImageCompression.C4, segment.get_buffer(), segment.subheader )
+        np.testing.assert_array_equal( image, self.expected[:45, :42] )
+
+    def test_masked( self ):
+
+        #  Blocks are stored in reverse, and the center block has no data
+        offsets = [ 0xFFFFFFFF ] * 9
+        blocks  = b''
+        for idx in reversed( range( 9 ) ):
+            if idx != 4:
+                offsets[idx] = len(blocks)
+                blocks += self.blocks[idx]
+
+        #  The mask subsection is a mask table without IMDATOFF, with offsets from the spatial data
+        mask = struct.pack( '>HHHB', 4, 0, 8, 200 ) + struct.pack( '>9I', *offsets )
+
+        self.expected[16:32, 16:32] = 200
+        nitf = self.load( 'M4', [ ( 138, mask ), ( 140, blocks ) ] )
+        np.testing.assert_array_equal( nitf.get_image(), self.expected[:45, :42] )
+
+    def test_colormap( self ):
+
+        segment = self.load( 'C4', [ ( 140, b''.join( self.blocks ) ) ] ).image_segments[0]
+        driver  = VQ_Driver( { 'apply_colormap': True } )
+        image   = driver.decode( ImageCompression.C4, segment.get_buffer(), segment.subheader, data_offset = segment.offset )
+        np.testing.assert_array_equal( image, self.colors[self.expected[:45, :42], :3] )
+
+    def test_invalid( self ):
+
+        with self.assertRaises( ValueError ):
+            self.load( 'C4', [ ( 140, b''.join( self.blocks[:8] ) ) ] ).get_image()
+
+        #  Frames without RPFIMG have no located sections
+        subheader = build_image_subheader( 45, 42, ic = 'C4', nbpr = 3, nbpc = 3, nppbh = 16, nppbv = 16 )
+        with open( self.pathname, 'wb' ) as fout:
+            fout.write( build_nitf( images = [ ( subheader, b''.join( self.blocks ) ) ] ) )
+        with self.assertRaises( ValueError ):
+            load_nitf( self.pathname, img_factory = Driver_Factory.default() ).get_image()
@@ -0,0 +1,298 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Asyncio-native NITF loading.
+
+All I/O goes through an `Async_Reader`, which reads byte ranges at absolute
+offsets.  Local files use `Thread_File_Reader`, which offloads `os.pread` to
+a thread pool.  Other sources, such as object stores, can subclass `Async_Reader`.
+'''
+
+#  Python Libraries
+import asyncio
+import logging
+import os
+
+#  Terminus Libraries
+from tmns.nitf.base       import NITF_Container
+from tmns.nitf.enums      import Segment_Type
+from tmns.nitf.fhdr       import ( File_Header,
+                                   HL_END,
+                                   HL_START )
+from tmns.nitf.imgseg     import Image_Segment
+from tmns.nitf.imsubhdr   import Image_Subheader
+from tmns.nitf.parse_plan import Projection
+from tmns.nitf.segdir     import Segment_Directory
+from tmns.nitf.tre        import TRE_Factory
+
+
+class Async_Reader:
+    '''
+    Interface for reading byte ranges from a NITF without blocking the event loop.
+    '''
+    async def size( self ):
+        raise NotImplementedError()
+
+    async def read( self, offset, length ):
+        '''
+        Read exactly `length` bytes starting at `offset`.  Fewer bytes are only
+        returned at the end of the file.
+        '''
+        raise NotImplementedError()
+
+    async def close( self ):
+        pass
+
+    async def __aenter__( self ):
+        return self
+
+    async def __aexit__( self, exc_type, exc_value, traceback ):
+        await self.close()
+
+
+class Thread_File_Reader(Async_Reader):
+    '''
+    Reads a local file with `os.pread` calls run in an executor.
+
+    Positional reads do not share a file offset, so concurrent reads from the
+    same file are safe.  `executor` defaults to the event loop's executor.
+    '''
+    def __init__( self, pathname, executor = None ):
+
+        self.pathname = pathname
+        self.executor = executor
+        self.fd       = None
+
+    async def open( self ):
+
+        if self.fd is None:
+            loop = asyncio.get_running_loop()
+            self.fd = await loop.run_in_executor( self.executor, os.open, self.pathname, os.O_RDONLY )
+        return self
+
+    async def __aenter__( self ):
+        return await self.open()
+
+    async def size( self ):
+
+        await self.open()
+        loop = asyncio.get_running_loop()
+        stat = await loop.run_in_executor( self.executor, os.fstat, self.fd )
+        return stat.st_size
+
+    async def read( self, offset, length ):
+
+        await self.open()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor( self.executor, self._pread, offset, length )
+
+    def _pread( self, offset, length ):
+
+        #  pread may return fewer bytes than requested, so keep reading until done
+        output = os.pread( self.fd, length, offset )
+        while 0 < len(output) < length:
+            block = os.pread( self.fd, length - len(output), offset + len(output) )
+            if len(block) == 0:
+                break
+            output += block
+        return output
+
+    async def close( self ):
+
+        if self.fd is not None:
+            os.close( self.fd )
+            self.fd = None
+
+
+async def load_nitf_async( pathname = None,
+                           reader = None,
+                           logger = None,
+                           img_factory = None,
+                           tre_factory = None,
+                           metadata_only: bool = False,
+                           fields: list = None,
+                           tres: list = None,
+                           semaphore = None ):
+    '''
+    Load a NITF without blocking the event loop.
+
+    Reads go through `reader` if provided, otherwise a `Thread_File_Reader`
+    is opened on `pathname` and closed once the load completes.  Image data
+    is read unless `metadata_only` is set, in which case it is read from
+    `pathname` on demand.  `fields` and `tres` behave as in `load_nitf`.
+
+    If a `semaphore` is provided, it is held for the duration of the load, so
+    callers can share one limit across many loads.
+    '''
+    if semaphore is None:
+        return await _load_nitf_async( pathname, reader, logger, img_factory, tre_factory, metadata_only, fields, tres )
+
+    async with semaphore:
+        return await _load_nitf_async( pathname, reader, logger, img_factory, tre_factory, metadata_only, fields, tres )
+
+
+async def _load_nitf_async( pathname, reader, logger, img_factory, tre_factory, metadata_only, fields, tres ):
+
+    if reader is None:
+        if pathname is None:
+            raise ValueError( 'Either a pathname or a reader is required' )
+
+        #  A missing file raises FileNotFoundError from the open, which runs in the executor
+        async with Thread_File_Reader( pathname ) as file_reader:
+            return await _parse_nitf_async( file_reader, pathname, logger, img_factory, tre_factory, metadata_only, fields, tres )
+
+    return await _parse_nitf_async( reader, pathname, logger, img_factory, tre_factory, metadata_only, fields, tres )
+
+
+async def _parse_nitf_async( reader, pathname, logger, img_factory, tre_factory, metadata_only, fields, tres ):
+
+    #  Setup logger, if not already set
+    if logger == None:
+        logger = logging.getLogger( 'tmns.nitf.aio:load_nitf_async' )
+
+    #  Setup TRE factory, if not already set
+    if tre_factory == None:
+        tre_factory = TRE_Factory.default()
+
+    projection = None
+    if fields is not None or tres is not None:
+        projection = Projection( fields = fields,
+                                 tres   = tres )
+
+    #  Check file size
+    fsize = await reader.size()
+    if fsize < 10:
+        raise Exception( f'Image is not large enough. Size: {fsize}' )
+
+    #  Read the file header in two calls, first to find its length then the rest
+    prefix = await reader.read( 0, HL_END )
+    if len(prefix) != HL_END:
+        raise Exception( f'Reached end of file before header length. Bytes Read: {len(prefix)}' )
+
+    header_length = int( prefix[HL_START:HL_END] )
+    remainder = await reader.read( HL_END, header_length - HL_END )
+    if len(remainder) != header_length - HL_END:
+        raise Exception( f'Reached end of file before end of header. Bytes Read: {HL_END + len(remainder)}, Header Length: {header_length}' )
+
+    fhdr = File_Header.parse_buffer( prefix + remainder,
+                                     logger      = logger,
+                                     tre_factory = tre_factory,
+                                     projection  = projection )
+
+    fhdr_errors = fhdr.validate( file_size = fsize )
+    if len(fhdr_errors) > 0:
+        error_str = f'FHDR Errors: {len(fhdr_errors)}\n'
+        for x in range( len(fhdr_errors) ):
+            error_str += f'{fhdr_errors[x]}\n'
+        logger.error( error_str )
+
+    #  Issue the reads for every image segment at once
+    directory = Segment_Directory.from_file_header( fhdr )
+    entries = directory.segments( Segment_Type.IMAGE )
+
+    requests = [ reader.read( entry.subheader_offset, entry.subheader_length ) for entry in entries ]
+    if not metadata_only:
+        requests += [ reader.read( entry.data_offset, entry.data_length ) for entry in entries ]
+    blocks = await asyncio.gather( *requests )
+
+    image_segments = []
+    for idx, entry in enumerate( entries ):
+
+        img_subheader = Image_Subheader.parse_buffer( blocks[idx],
+                                                      logger      = logger,
+                                                      tre_factory = tre_factory,
+                                                      projection  = projection )
+
+        errors = img_subheader.validate()
+        if len(errors) > 0:
+            error_str = f'Image Subheader {idx} Errors: {len(errors)}\n'
+            for x in range( len(errors) ):
+                error_str += f'{errors[x]}\n'
+            logger.error( error_str )
+
+        image_buffer = None
+        if not metadata_only:
+            image_buffer = blocks[len(entries) + idx]
+            if len(image_buffer) != entry.data_length:
+                raise Exception( f'Reached end of file before end of image segment {idx}. Bytes Read: {len(image_buffer)}, Expected: {entry.data_length}' )
+
+        image_segments.append( Image_Segment( subheader = img_subheader,
+                                              buffer    = image_buffer,
+                                              factory   = img_factory,
+                                              offset    = entry.data_offset,
+                                              length    = entry.data_length,
+                                              pathname  = pathname ) )
+
+    return NITF_Container( file_header       = fhdr,
+                           image_segments    = image_segments,
+                           segment_directory = directory )
+
+
+async def load_nitfs_async( paths,
+                            concurrency: int = 64,
+                            ordered: bool = False,
+                            **kwargs ):
+    '''
+    Load many NITF files, yielding `(pathname, result)` pairs, where `result`
+    is the `NITF_Container` or the exception raised while loading that file.
+
+    No more than `concurrency` files are loaded or waiting to be consumed at
+    once, so memory stays bounded regardless of the number of paths.  If
+    `ordered` is set, results follow the order of `paths`, otherwise they are
+    yielded as they complete.  Other keyword arguments are passed to `load_nitf_async`.
+    '''
+    if concurrency < 1:
+        raise ValueError( f'Concurrency must be at least 1. Concurrency: {concurrency}' )
+
+    if kwargs.get( 'tre_factory' ) is None:
+        kwargs['tre_factory'] = TRE_Factory.default()
+
+    #  A caller-provided semaphore shares its limit with other loads
+    semaphore = kwargs.pop( 'semaphore', None )
+    if semaphore is None:
+        semaphore = asyncio.Semaphore( concurrency )
+
+    #  Tasks in the order of `paths`.  A slot is only freed once its result is yielded.
+    pending = []
+    paths = iter( paths )
+    end_of_paths = object()
+
+    try:
+        while True:
+
+            while len(pending) < concurrency:
+                pathname = next( paths, end_of_paths )
+                if pathname is end_of_paths:
+                    break
+                task = asyncio.create_task( load_nitf_async( pathname, semaphore = semaphore, **kwargs ) )
+                pending.append( ( pathname, task ) )
+
+            if len(pending) == 0:
+                return
+
+            if ordered:
+                pathname, task = pending[0]
+                await asyncio.wait( [ task ] )
+            else:
+                done, _ = await asyncio.wait( [ item[1] for item in pending ],
+                                              return_when = asyncio.FIRST_COMPLETED )
+                pathname, task = next( item for item in pending if item[1] in done )
+            pending.remove( ( pathname, task ) )
+
+            if task.exception() is not None:
+                yield pathname, task.exception()
+            else:
+                yield pathname, task.result()
+
+    finally:
+        #  Don't leave loads running if the caller stops early
+        for _, task in pending:
+            task.cancel()
@@ -14,7 +14,7 @@ import logging
 
 #  Terminus Libraries
 from tmns.core.apps import run, ArgumentParser, configure_logging
-from tmns.nitf.core import load_nitf
+from tmns.nitf.core import load_nitfs
 from tmns.nitf.image.factory import Driver_Factory
 from tmns.nitf.tre  import TRE_Factory
 from tmns.nitf.apps.tmns_nitf_info.plotly import render_html
@@ -40,8 +40,20 @@ def parse_command_line():
                          default = 'dash',
                          help = 'Set the rendering viz mode' )
     
+    parser.add_argument( '-j', '--workers',
+                         dest = 'workers',
+                         default = 1,
+                         type = int,
+                         help = 'Number of NITF files to load in parallel' )
+
+    parser.add_argument( '--mode',
+                         dest = 'mode',
+                         default = 'thread',
+                         choices = [ 'thread', 'process' ],
+                         help = 'Load files with a pool of threads or processes' )
+
     parser.add_argument( dest = 'nitf_paths',
-                         action = 'append',
+                         nargs = '+',
                          default = [],
                          help = 'List of NITF images to parse.' )
 
@@ -64,12 +76,17 @@ def main():
     img_factory = Driver_Factory.default()
     logger.debug( img_factory )
 
-    #  Process each NITF in sequence
-    for nitf_path in cmd_args.nitf_paths:
+    #  Load the NITFs in parallel, but render them in the order given
+    for nitf_path, nitf_data in load_nitfs( cmd_args.nitf_paths,
+                                            workers     = cmd_args.workers,
+                                            mode        = cmd_args.mode,
+                                            ordered     = True,
+                                            tre_factory = tre_factory,
+                                            img_factory = img_factory ):
 
-        nitf_data = load_nitf( nitf_path, 
-                               tre_factory = tre_factory,
-                               img_factory = img_factory )
+        if isinstance( nitf_data, Exception ):
+            logger.error( f'Unable to load {nitf_path}: {nitf_data}' )
+            continue
 
         render_html( nitf_data,
                      logger = logger )
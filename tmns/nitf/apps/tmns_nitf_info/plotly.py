@@ -32,11 +32,8 @@ def render_html( nitf_data, logger = None ):
     if logger == None:
         logger = logging.getLogger( 'tmns_nitf_info.plotly:render_html' )
 
-    print('a')
-    metadata = nitf_data.as_kvp()
-    print('b')
+    metadata = nitf_data.as_mapping()
     image    = nitf_data.get_image()
-    print('c')
     
     #  Create primary subplot
     fig = sp.make_subplots( rows = 2, cols = 1,
@@ -45,8 +42,7 @@ def render_html( nitf_data, logger = None ):
                             row_heights=[0.3,0.7] )
 
     fig.add_trace( go.Table( header = dict( values = ['Key', 'Value'] ),
-                             cells  = dict( values = [ list(metadata.keys()),
-                                                       list(metadata.values()) ] ) ),
+                             cells  = dict( values = list( zip( *metadata.items() ) ) ) ),
                   row = 1, col = 1 )
     
     if len(image.shape) == 2 or image.shape[2] == 1:
@@ -9,18 +9,56 @@
 #**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
 #
 
+#  Terminus Libraries
+from tmns.nitf.mapping import NITF_Mapping
+from tmns.nitf.segdir  import Segment_Directory
+
 
 class NITF_Container:
 
-    def __init__(self, file_header, image_segments ):
+    def __init__(self, file_header, image_segments, mapping = None, segment_directory = None ):
         
         self.file_header    = file_header
         self.image_segments = image_segments
+        self.mapping        = mapping
+
+        #  Offsets of every segment, computed from the file header if not provided
+        if segment_directory is None:
+            segment_directory = Segment_Directory.from_file_header( file_header )
+        self.segment_directory = segment_directory
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.close()
+
+    def close( self ):
+        '''
+        Release the image segment buffers and the memory-mapping, if one is owned.
 
-    def get_image( self, img_seg = 0 ):
+        Arrays created as views over a mapped segment must be released first,
+        otherwise the mapping will refuse to close with a `BufferError`.
+        '''
+        for segment in self.image_segments:
+            segment.release()
 
-        return self.image_segments[img_seg].get_image()
+        if self.mapping is not None:
+            self.mapping.close()
+            self.mapping = None
+
+    def get_image( self, img_seg = 0, reduce = 0 ):
+
+        return self.image_segments[img_seg].get_image( reduce = reduce )
     
+    def as_mapping( self ):
+        '''
+        Read-only view with the keys of `as_kvp()`, such as
+        `image_segment.0.ixshd.BLOCKA.FRFC_LOC`.  Values are looked up on
+        access instead of flattening every header and TRE.
+        '''
+        return NITF_Mapping( self )
+
     def as_kvp( self ):
 
         data = {}
@@ -34,5 +72,3 @@ class NITF_Container:
                 data[f'image_segment.{idx}.{k}'] = kvp[k]
                 
         return data
-
-    
\ No newline at end of file
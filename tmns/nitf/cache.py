@@ -0,0 +1,270 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+from itertools import repeat
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+#  Terminus Libraries
+from tmns.nitf.fhdr        import ( Field as FHDR_Field,
+                                    File_Header )
+from tmns.nitf.field_types import ( Field_Entry,
+                                    NITF_Character_Set )
+from tmns.nitf.imsubhdr    import ( Field as IMGSUB_Field,
+                                    Image_Subheader )
+from tmns.nitf.tre         import TRE_Factory
+from tmns.nitf.tres.base   import TRE_List
+
+
+#  Bump whenever the stored layout changes, which invalidates existing caches
+CACHE_VERSION = 2
+
+#  Seconds between updates of an entry's access time, for least-recently-used eviction
+ACCESS_RESOLUTION = 10
+
+#  Fields are stored by their position in the enum
+FHDR_MEMBERS   = list( FHDR_Field )
+IMGSUB_MEMBERS = list( IMGSUB_Field )
+FHDR_POSITIONS   = { field: pos for pos, field in enumerate( FHDR_MEMBERS ) }
+IMGSUB_POSITIONS = { field: pos for pos, field in enumerate( IMGSUB_MEMBERS ) }
+
+
+def encode_header( header, positions, extensions ):
+    '''
+    Flatten a header into plain values which pickle and load quickly.
+
+    The raw bytes of every field are concatenated into one buffer, with
+    lists of the enum position, offset and length of each field.  TRE
+    sections are stored as their (tag, length, data) records and offsets.
+    '''
+    raw     = bytearray()
+    fields  = []
+    starts  = []
+    lengths = []
+    for entry in header.data.values():
+
+        if entry.is_decoded() and not isinstance( entry.data, NITF_Character_Set ):
+            raise TypeError( f'Unable to cache field {entry.field.name}. Type: {type(entry.data)}' )
+        field_bytes = entry.raw()
+
+        fields.append( positions[entry.field] )
+        starts.append( len(raw) )
+        lengths.append( len(field_bytes) )
+        raw += field_bytes
+
+    records = []
+    for tre_list in extensions:
+        if isinstance( tre_list, TRE_List ):
+            records.append( ( tre_list.records, tre_list.offsets ) )
+        elif len(tre_list) == 0:
+            records.append( ( [], [] ) )
+        else:
+            raise TypeError( f'Unable to cache TREs. Type: {type(tre_list)}' )
+
+    return ( bytes( raw ), ( fields, starts, lengths ), records )
+
+
+def decode_header( header_type, members, encoded, tre_factory ):
+    '''
+    Rebuild a header from `encode_header`.  Fields stay undecoded until accessed.
+    '''
+    raw, ( positions, starts, lengths ), records = encoded
+
+    fields = map( members.__getitem__, positions )
+    data = dict( enumerate( map( Field_Entry, fields, repeat( None ), repeat( raw ), starts, lengths ) ) )
+
+    extensions = [ TRE_List( tre_records, tre_factory, offsets ) if len(tre_records) > 0 else []
+                   for tre_records, offsets in records ]
+    return header_type( data, *extensions )
+
+
+class Header_Cache:
+    '''
+    On-disk cache of parsed NITF headers, stored in SQLite.
+
+    Entries are keyed by the absolute path, size and modification time of
+    the file, so any change to the file is a miss.  Each entry holds the raw
+    bytes and layout of the file header and image subheaders, plus the
+    segment directory, so a hit rebuilds the headers without parsing them.
+    Once the stored entries exceed `max_bytes`, the least recently used are evicted.
+
+    The cache can be shared between threads, and between processes which
+    open the same database.
+
+    Entries are pickled, and unpickling can run arbitrary code, so the cache
+    file must be trusted.  Keep it where only trusted users can write, and
+    never open a cache file from another source.
+    '''
+    def __init__( self, pathname, max_bytes = 256 * 1024 * 1024 ):
+
+        self.pathname  = pathname
+        self.max_bytes = max_bytes
+        self.lock      = threading.Lock()
+        self.connect()
+
+    def connect( self ):
+
+        self.db = sqlite3.connect( self.pathname,
+                                   timeout           = 30,
+                                   check_same_thread = False,
+                                   isolation_level   = None )
+        self.db.execute( 'PRAGMA journal_mode=WAL' )
+
+        #  Entries pickled by another version can't be trusted
+        version = self.db.execute( 'PRAGMA user_version' ).fetchone()[0]
+        if version != CACHE_VERSION:
+            self.db.execute( 'DROP TABLE IF EXISTS headers' )
+            self.db.execute( f'PRAGMA user_version={CACHE_VERSION}' )
+
+        self.db.execute( '''CREATE TABLE IF NOT EXISTS headers ( path        TEXT PRIMARY KEY,
+                                                                 size        INTEGER NOT NULL,
+                                                                 mtime_ns    INTEGER NOT NULL,
+                                                                 nbytes      INTEGER NOT NULL,
+                                                                 last_access REAL NOT NULL,
+                                                                 payload     BLOB NOT NULL )''' )
+        self.db.execute( 'CREATE INDEX IF NOT EXISTS headers_last_access ON headers ( last_access )' )
+
+    def close( self ):
+
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.close()
+
+    def __getstate__( self ):
+        '''
+        Worker processes reconnect to the database rather than sharing the connection.
+        '''
+        return { 'pathname': self.pathname, 'max_bytes': self.max_bytes }
+
+    def __setstate__( self, state ):
+
+        self.pathname  = state['pathname']
+        self.max_bytes = state['max_bytes']
+        self.lock      = threading.Lock()
+        self.connect()
+
+    def __len__( self ):
+
+        with self.lock:
+            return self.db.execute( 'SELECT COUNT(*) FROM headers' ).fetchone()[0]
+
+    def total_bytes( self ):
+
+        with self.lock:
+            return self.db.execute( 'SELECT COALESCE(SUM(nbytes), 0) FROM headers' ).fetchone()[0]
+
+    @staticmethod
+    def key( pathname, stat = None ):
+        '''
+        Cache key for a file, as (absolute path, size, mtime in nanoseconds).
+        '''
+        if stat is None:
+            stat = os.stat( pathname )
+        return ( os.path.abspath( pathname ), stat.st_size, stat.st_mtime_ns )
+
+    def get( self, pathname, stat = None, tre_factory = None ):
+        '''
+        Get the cached `( file_header, image_subheaders, segment_directory )`, or None on a miss.
+
+        TREs are built on first access with `tre_factory`, or the default factory.
+        '''
+        path, size, mtime_ns = Header_Cache.key( pathname, stat )
+
+        with self.lock:
+            row = self.db.execute( 'SELECT payload, last_access FROM headers WHERE path = ? AND size = ? AND mtime_ns = ?',
+                                   ( path, size, mtime_ns ) ).fetchone()
+            if row is None:
+                return None
+
+            #  Writes cost more than the lookup, so recent hits don't refresh the access time
+            now = time.time()
+            if now - row[1] > ACCESS_RESOLUTION:
+                self.db.execute( 'UPDATE headers SET last_access = ? WHERE path = ?',
+                                 ( now, path ) )
+
+        if tre_factory is None:
+            tre_factory = TRE_Factory.default()
+
+        #  Only safe because the cache file is trusted, see the class notes
+        try:
+            fhdr_encoded, subheaders_encoded, directory = pickle.loads( row[0] )
+            fhdr = decode_header( File_Header, FHDR_MEMBERS, fhdr_encoded, tre_factory )
+            subheaders = [ decode_header( Image_Subheader, IMGSUB_MEMBERS, encoded, tre_factory )
+                           for encoded in subheaders_encoded ]
+        except Exception:
+            self.remove( pathname )
+            return None
+
+        return ( fhdr, subheaders, directory )
+
+    def put( self, pathname, headers, stat = None ):
+        '''
+        Store `( file_header, image_subheaders, segment_directory )` for a file,
+        then evict entries until the cache fits in `max_bytes`.
+        '''
+        path, size, mtime_ns = Header_Cache.key( pathname, stat )
+
+        fhdr, subheaders, directory = headers
+        encoded = ( encode_header( fhdr, FHDR_POSITIONS, [ fhdr.udhd, fhdr.xhd ] ),
+                    [ encode_header( subheader, IMGSUB_POSITIONS, [ subheader.udid, subheader.ixshd ] ) for subheader in subheaders ],
+                    directory )
+        payload = pickle.dumps( encoded, protocol = pickle.HIGHEST_PROTOCOL )
+
+        #  Entries which could never fit are not stored
+        if len(payload) > self.max_bytes:
+            return
+
+        with self.lock:
+            self.db.execute( 'INSERT OR REPLACE INTO headers VALUES ( ?, ?, ?, ?, ?, ? )',
+                             ( path, size, mtime_ns, len(payload), time.time(), payload ) )
+            self.evict_locked()
+
+    def evict( self ):
+
+        with self.lock:
+            self.evict_locked()
+
+    def evict_locked( self ):
+        '''
+        Remove the least recently used entries until the cache fits in `max_bytes`.
+        '''
+        total = self.db.execute( 'SELECT COALESCE(SUM(nbytes), 0) FROM headers' ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        victims = []
+        for path, nbytes in self.db.execute( 'SELECT path, nbytes FROM headers ORDER BY last_access ASC' ):
+            if total <= self.max_bytes:
+                break
+            victims.append( ( path, ) )
+            total -= nbytes
+
+        self.db.executemany( 'DELETE FROM headers WHERE path = ?', victims )
+
+    def remove( self, pathname ):
+
+        with self.lock:
+            self.db.execute( 'DELETE FROM headers WHERE path = ?', ( os.path.abspath( pathname ), ) )
+
+    def clear( self ):
+
+        with self.lock:
+            self.db.execute( 'DELETE FROM headers' )
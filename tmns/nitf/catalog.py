@@ -0,0 +1,282 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+SQLite catalog of the header fields and TREs of a NITF corpus.
+
+Fields are stored one row per value, keyed like `as_kvp()`.  Header
+fields are keyed by their name (`ICAT`), and TRE fields by tag and name
+(`AIMIDB.COUNTRY`), with the section (`ixshd`, `udid`, ...) in its own column.
+Values are stored as stripped text, with raw and binary fields decoded
+rather than written as bytes literals, plus as a number when they parse as
+one, so predicates such as `NROWS>10000` compare numerically.
+'''
+
+#  Python Libraries
+import logging
+import math
+import os
+import re
+import sqlite3
+
+#  Terminus Libraries
+from tmns.nitf.core        import load_nitfs
+from tmns.nitf.field_types import ( IEEE_754_FLOAT,
+                                    UINT32 )
+
+
+#  Segment number used for the file header
+FILE_HEADER_SEGMENT = -1
+
+#  Comparison operators supported by predicates
+OPERATORS = [ '<=', '>=', '!=', '=', '<', '>', 'LIKE' ]
+
+NITF_EXTENSIONS = ( '.ntf', '.nitf', '.nsf', '.r0' )
+
+SCHEMA = [ '''CREATE TABLE IF NOT EXISTS files ( file_id  INTEGER PRIMARY KEY,
+                                                 path     TEXT UNIQUE NOT NULL,
+                                                 size     INTEGER NOT NULL,
+                                                 mtime_ns INTEGER NOT NULL )''',
+           '''CREATE TABLE IF NOT EXISTS fields ( file_id    INTEGER NOT NULL REFERENCES files ( file_id ) ON DELETE CASCADE,
+                                                  segment    INTEGER NOT NULL,
+                                                  section    TEXT NOT NULL,
+                                                  key        TEXT NOT NULL,
+                                                  text_value TEXT,
+                                                  num_value  REAL )''',
+           'CREATE INDEX IF NOT EXISTS fields_text ON fields ( key, text_value, file_id )',
+           'CREATE INDEX IF NOT EXISTS fields_num  ON fields ( key, num_value, file_id )',
+           'CREATE INDEX IF NOT EXISTS fields_file ON fields ( file_id )' ]
+
+
+def to_number( value ):
+    '''
+    Numeric form of a field value, or None if it is not a finite number.
+    '''
+    try:
+        number = float( value )
+    except ValueError:
+        return None
+    if not math.isfinite( number ):
+        return None
+    return number
+
+
+def field_text( value ):
+    '''
+    Text of a field value.  Binary numbers are formatted, and other bytes,
+    such as the data of TREs without their own class, are decoded.
+    '''
+    if isinstance( value, ( UINT32, IEEE_754_FLOAT ) ):
+        return str( value.value() )
+    return bytes( value.data ).decode( 'utf8', errors = 'replace' )
+
+
+def header_values( header, default_section, extensions ):
+    '''
+    Text of each field of a header and its TREs, by (section, key), with
+    the keys of `as_kvp()` split into section and key.  `extensions` holds
+    (section, TRE list) pairs.
+    '''
+    values = {}
+    for entry in header.data.values():
+        values[( default_section, entry['field'].name )] = field_text( entry['data'] )
+
+    for section, tre_list in extensions:
+        if tre_list is None:
+            continue
+        for tre in tre_list:
+            cetag = tre.cetag()
+            for entry in tre.data.values():
+                values[( section, f'{cetag}.{entry["field"].name}' )] = field_text( entry['data'] )
+
+    return values
+
+
+def parse_predicates( text ):
+    '''
+    Parse predicates such as `ICAT=SAR, AIMIDB.COUNTRY='US', NROWS>10000` into
+    a list of (key, operator, value).  Unquoted numbers compare numerically.
+    '''
+    predicates = []
+    pattern = re.compile( r'''^\s*([\w.]+)\s*(<=|>=|!=|=|<|>|\s+LIKE\s+)\s*(?:'([^']*)'|"([^"]*)"|(.*?))\s*$''', re.IGNORECASE )
+    for clause in text.split( ',' ):
+
+        if len(clause.strip()) == 0:
+            continue
+
+        match = pattern.match( clause )
+        if match is None:
+            raise ValueError( f'Unable to parse predicate: {clause}' )
+
+        key, op, single, double, bare = match.groups()
+        op = op.strip().upper()
+        if single is not None:
+            value = single
+        elif double is not None:
+            value = double
+        else:
+            number = to_number( bare )
+            value = bare if number is None else number
+
+        predicates.append( ( key, op, value ) )
+
+    return predicates
+
+
+class Catalog:
+    '''
+    Catalog of NITF headers in a SQLite database.
+    '''
+    def __init__( self, pathname, logger = None ):
+
+        self.pathname = pathname
+        self.logger   = logger
+        if self.logger is None:
+            self.logger = logging.getLogger( 'tmns.nitf.catalog.Catalog' )
+
+        self.db = sqlite3.connect( pathname )
+        self.db.execute( 'PRAGMA foreign_keys=ON' )
+        self.db.execute( 'PRAGMA journal_mode=WAL' )
+        for statement in SCHEMA:
+            self.db.execute( statement )
+        self.db.commit()
+
+    def close( self ):
+
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.close()
+
+    def __len__( self ):
+        return self.db.execute( 'SELECT COUNT(*) FROM files' ).fetchone()[0]
+
+    def ingest( self, root, extensions = NITF_EXTENSIONS, workers = None, **kwargs ):
+        '''
+        Add every NITF under `root`, which may also be a single file.
+
+        Files already in the catalog with the same size and modification time
+        are skipped, and changed files are replaced.  Files are loaded with
+        `load_nitfs` in metadata-only mode, and other keyword arguments are
+        passed to it.  Returns the number of files added.
+        '''
+        if os.path.isfile( root ):
+            paths = [ root ]
+        else:
+            paths = []
+            for dirpath, _, filenames in os.walk( root ):
+                for filename in sorted( filenames ):
+                    if filename.lower().endswith( extensions ):
+                        paths.append( os.path.join( dirpath, filename ) )
+
+        #  Skip files which are unchanged since they were catalogued
+        pending = []
+        stats   = {}
+        for pathname in paths:
+            pathname = os.path.abspath( pathname )
+            stat = os.stat( pathname )
+            row = self.db.execute( 'SELECT size, mtime_ns FROM files WHERE path = ?', ( pathname, ) ).fetchone()
+            if row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+                continue
+            stats[pathname] = stat
+            pending.append( pathname )
+
+        added = 0
+        kwargs['metadata_only'] = True
+        with self.db:
+            for pathname, nitf in load_nitfs( pending, workers = workers, **kwargs ):
+
+                if isinstance( nitf, Exception ):
+                    self.logger.warning( f'Unable to catalog {pathname}: {nitf}' )
+                    continue
+
+                self.add( pathname, nitf, stats[pathname] )
+                added += 1
+
+        return added
+
+    def add( self, pathname, nitf, stat = None ):
+        '''
+        Add or replace a loaded NITF.  Does not commit.
+        '''
+        pathname = os.path.abspath( pathname )
+        if stat is None:
+            stat = os.stat( pathname )
+
+        self.db.execute( 'DELETE FROM files WHERE path = ?', ( pathname, ) )
+        file_id = self.db.execute( 'INSERT INTO files ( path, size, mtime_ns ) VALUES ( ?, ?, ? )',
+                                   ( pathname, stat.st_size, stat.st_mtime_ns ) ).lastrowid
+
+        rows = []
+        fhdr    = nitf.file_header
+        headers = [ ( FILE_HEADER_SEGMENT, header_values( fhdr, 'file_header', [ ( 'udhd', fhdr.udhd ), ( 'xhd', fhdr.xhd ) ] ) ) ]
+        for idx, segment in enumerate( nitf.image_segments ):
+            subheader = segment.subheader
+            headers.append( ( idx, header_values( subheader, 'image_subheader', [ ( 'udid', subheader.udid ), ( 'ixshd', subheader.ixshd ) ] ) ) )
+
+        for segment, values in headers:
+            for ( section, key ), value in values.items():
+                value = value.strip()
+                rows.append( ( file_id, segment, section, key, value, to_number( value ) ) )
+
+        self.db.executemany( 'INSERT INTO fields VALUES ( ?, ?, ?, ?, ?, ? )', rows )
+
+    def remove( self, pathname ):
+
+        with self.db:
+            self.db.execute( 'DELETE FROM files WHERE path = ?', ( os.path.abspath( pathname ), ) )
+
+    def query( self, predicates ):
+        '''
+        Paths of the files matching every predicate.
+
+        `predicates` is either a list of (key, operator, value), or a string
+        for `parse_predicates`.  Numeric values compare against the numeric
+        form of the field, and strings against the stripped text.  Each
+        predicate may be satisfied by any segment of the file.
+        '''
+        if isinstance( predicates, str ):
+            predicates = parse_predicates( predicates )
+
+        if len(predicates) == 0:
+            return [ row[0] for row in self.db.execute( 'SELECT path FROM files ORDER BY path' ) ]
+
+        clauses = []
+        params  = []
+        for key, op, value in predicates:
+
+            op = op.upper()
+            if op == '==':
+                op = '='
+            if op not in OPERATORS:
+                raise ValueError( f'Unsupported operator: {op}. Expected one of {OPERATORS}' )
+
+            column = 'text_value'
+            if isinstance( value, ( int, float ) ) and not isinstance( value, bool ):
+                column = 'num_value'
+
+            clauses.append( f'SELECT file_id FROM fields WHERE key = ? AND {column} {op} ?' )
+            params += [ key, value ]
+
+        sql = f'SELECT path FROM files WHERE file_id IN ( {" INTERSECT ".join( clauses )} ) ORDER BY path'
+        return [ row[0] for row in self.db.execute( sql, params ) ]
+
+    def values( self, pathname, key ):
+        '''
+        Stored values of a key in a file, as (segment, section, text) rows.
+        '''
+        sql = '''SELECT segment, section, text_value FROM fields JOIN files USING ( file_id )
+                 WHERE path = ? AND key = ? ORDER BY segment'''
+        return self.db.execute( sql, ( os.path.abspath( pathname ), key ) ).fetchall()
@@ -0,0 +1,270 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Columnar export of NITF metadata.
+
+Each row is one image segment of one file.  Columns are named like the
+catalog keys: `file_header.<FIELD>` for the file header, `<FIELD>` for the
+image subheader and `<TAG>.<FIELD>` for TREs of the image subheader, or
+`file_header.<TAG>.<FIELD>` for TREs of the file header.  Numeric fields become int64
+or float64, and alphanumeric fields become fixed-width, right-stripped bytes.
+Repeated and variable-length fields are left out.
+'''
+
+#  Python Libraries
+import numpy as np
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+#  Terminus Libraries
+from tmns.nitf.field_types import FieldType
+from tmns.nitf.fhdr        import Field as FHDR_Field
+from tmns.nitf.imsubhdr    import Field as IMGSUB_Field
+
+
+#  Fill values for missing or unparseable numbers
+INT_FILL = np.iinfo( np.int64 ).min
+
+#  Field types stored as numbers, others are stored as bytes
+INT_TYPES   = [ FieldType.BCS_N, FieldType.BCS_NP, FieldType.UINT32 ]
+FLOAT_TYPES = [ FieldType.IEEE_754_FLOAT ]
+
+
+class Column:
+    '''
+    A single output column, which gathers the `Field_Entry` of each row.
+
+    Entries are only read when the array is built.  Binary numbers are
+    decoded per row, while text numbers are converted from their bytes in
+    one pass.
+    '''
+    def __init__( self, name, key, field_type, width ):
+
+        self.name       = name
+        self.key        = key
+        self.field_type = field_type
+        self.width      = width
+        self.entries    = []
+
+    def dtype( self ):
+
+        if self.field_type in INT_TYPES:
+            return np.int64
+        if self.field_type in FLOAT_TYPES:
+            return np.float64
+        return f'S{max( self.width, 1 )}'
+
+    def to_array( self ):
+
+        dtype = self.dtype()
+
+        if self.field_type in ( FieldType.UINT32, FieldType.IEEE_754_FLOAT ):
+            fill = np.nan if dtype == np.float64 else INT_FILL
+            return np.array( [ fill if entry is None else entry['data'].value() for entry in self.entries ], dtype = dtype )
+
+        values = [ None if entry is None else bytes( entry.raw() ) for entry in self.entries ]
+        width  = max( [ self.width ] + [ len(value) for value in values if value is not None ] )
+
+        if dtype == np.int64:
+
+            #  Convert in one pass, falling back per-value for missing, blank or malformed fields
+            if None not in values:
+                try:
+                    return np.array( values, dtype = f'S{max( width, 1 )}' ).astype( np.int64 )
+                except ValueError:
+                    pass
+            return np.array( [ to_int( value ) for value in values ], dtype = dtype )
+
+        return np.array( [ b'' if value is None else value.rstrip( b' ' ) for value in values ], dtype = f'S{max( width, 1 )}' )
+
+
+def to_int( value ):
+
+    try:
+        return int( value )
+    except ( TypeError, ValueError ):
+        return INT_FILL
+
+
+def header_fields( field_enum ):
+    '''
+    Fields of a header which occur at most once and have a fixed length.
+    '''
+    fields = []
+    for field in field_enum:
+        if field.name.endswith( '_N' ) or field.name.endswith( '_N_M' ):
+            continue
+        if field.value[1] <= 0 or field.value[2] == FieldType.TRE:
+            continue
+        fields.append( field )
+    return fields
+
+
+def entries_by_name( header ):
+    '''
+    Entries of a header or TRE by field name.  Only the last of a repeated field is kept.
+    '''
+    return { entry.field.name: entry for entry in header.data.values() }
+
+
+def find_tre( tre_lists, tag ):
+    '''
+    First TRE with a tag in a header's TRE sections, without building the others.
+    '''
+    for tre_list in tre_lists:
+        if tre_list is None or len(tre_list) == 0:
+            continue
+        tags = tre_list.tags()
+        if tag in tags:
+            return tre_list[tags.index( tag )]
+    return None
+
+
+def to_structured_array( nitfs, tres = None ):
+    '''
+    Convert NITFs to a NumPy structured array, with a row per image segment.
+
+    `nitfs` holds `NITF_Container`s, or `(pathname, result)` pairs as
+    yielded by `load_nitfs`, where results which are exceptions are skipped.
+    Files without image segments get one row with a segment of -1.  `tres`
+    is a list of TRE tags whose fields become columns, found in both the
+    file header and the image subheaders.
+    '''
+    fhdr_fields   = header_fields( FHDR_Field )
+    imgsub_fields = header_fields( IMGSUB_Field )
+
+    paths    = []
+    segments = []
+    fhdr_columns   = [ Column( f'file_header.{field.name}', field.name, field.value[2], field.value[1] ) for field in fhdr_fields ]
+    imgsub_columns = [ Column( field.name, field.name, field.value[2], field.value[1] ) for field in imgsub_fields ]
+
+    #  TRE columns are created when the tag is first seen, since each TRE has its own fields
+    tres = [] if tres is None else [ tag.strip() for tag in tres ]
+    tre_keys    = [ ( prefix, tag ) for tag in tres for prefix in ( 'file_header.', '' ) ]
+    tre_columns = { key: None for key in tre_keys }
+    nrows = 0
+
+    for item in nitfs:
+
+        pathname = None
+        if isinstance( item, tuple ):
+            pathname, item = item
+            if isinstance( item, Exception ):
+                continue
+
+        image_segments = item.image_segments
+        if pathname is None and len(image_segments) > 0:
+            pathname = image_segments[0].pathname
+
+        #  Entries are matched to columns by name, which is much cheaper to hash than the enum
+        fhdr_entries = entries_by_name( item.file_header )
+        fhdr_tres    = { tag: find_tre( ( item.file_header.udhd, item.file_header.xhd ), tag ) for tag in tres }
+
+        subheaders = [ segment.subheader for segment in image_segments ]
+        if len(subheaders) == 0:
+            subheaders = [ None ]
+
+        for idx, subheader in enumerate( subheaders ):
+
+            paths.append( b'' if pathname is None else str(pathname).encode('utf8') )
+            segments.append( idx if subheader is not None else -1 )
+
+            for column in fhdr_columns:
+                column.entries.append( fhdr_entries.get( column.key ) )
+
+            imgsub_entries = {} if subheader is None else entries_by_name( subheader )
+            for column in imgsub_columns:
+                column.entries.append( imgsub_entries.get( column.key ) )
+
+            for prefix, tag in tre_keys:
+
+                if prefix == '':
+                    tre = None if subheader is None else find_tre( ( subheader.ixshd, subheader.udid ), tag )
+                else:
+                    tre = fhdr_tres[tag]
+
+                key = ( prefix, tag )
+                if tre is not None and tre_columns[key] is None:
+                    columns = []
+                    for entry in tre.data.values():
+                        if entry.field.name in ( 'CETAG', 'CEL' ):
+                            continue
+                        column = Column( f'{prefix}{tag}.{entry.field.name}', entry.field.name, entry.field.value[2], entry.length )
+                        column.entries = [ None ] * nrows
+                        columns.append( column )
+                    tre_columns[key] = columns
+
+                if tre_columns[key] is not None:
+                    tre_entries = {} if tre is None else entries_by_name( tre )
+                    for column in tre_columns[key]:
+                        column.entries.append( tre_entries.get( column.key ) )
+
+            nrows += 1
+
+    columns = fhdr_columns + imgsub_columns
+    for key in tre_keys:
+        if tre_columns[key] is not None:
+            columns += tre_columns[key]
+
+    arrays = [ column.to_array() for column in columns ]
+
+    path_width = max( [ len(path) for path in paths ] + [ 1 ] )
+    dtype  = [ ( 'path', f'S{path_width}' ), ( 'segment', np.int32 ) ]
+    dtype += [ ( column.name, values.dtype ) for column, values in zip( columns, arrays ) ]
+
+    output = np.zeros( nrows, dtype = dtype )
+    output['path']    = paths
+    output['segment'] = segments
+    for column, values in zip( columns, arrays ):
+        output[column.name] = values
+
+    return output
+
+
+def to_arrow( array ):
+    '''
+    Convert a structured array from `to_structured_array` to a `pyarrow.Table`.
+
+    Byte columns become strings and fill values become nulls.  Requires pyarrow.
+    '''
+    if pyarrow is None:
+        raise ImportError( 'pyarrow is required for Arrow and Parquet output' )
+
+    columns = {}
+    for name in array.dtype.names:
+
+        values = array[name]
+        if values.dtype.kind == 'S':
+            columns[name] = pyarrow.array( np.char.decode( values, 'utf8', errors = 'replace' ) )
+        elif values.dtype == np.int64:
+            columns[name] = pyarrow.array( values, mask = values == INT_FILL )
+        else:
+            columns[name] = pyarrow.array( values )
+
+    return pyarrow.table( columns )
+
+
+def write_parquet( nitfs, pathname, tres = None ):
+    '''
+    Write the metadata of NITFs, or a structured array, to a Parquet file.  Requires pyarrow.
+    '''
+    if pyarrow is None:
+        raise ImportError( 'pyarrow is required for Arrow and Parquet output' )
+
+    array = nitfs
+    if not isinstance( nitfs, np.ndarray ):
+        array = to_structured_array( nitfs, tres = tres )
+
+    pyarrow.parquet.write_table( to_arrow( array ), pathname )
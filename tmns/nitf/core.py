@@ -10,24 +10,28 @@
 #
 
 #  Python Libraries
-from enum import Enum
-import io
+from collections import deque
+import concurrent.futures
 import logging
+import mmap
 import os
 
 #  Terminus libraries
 from tmns.nitf.base import NITF_Container
+from tmns.nitf.enums import Segment_Type
 from tmns.nitf.fhdr import (
-    Field as FHDR_Field,
     File_Header
 )
 from tmns.nitf.imgseg import ( 
     Image_Segment
 )
 from tmns.nitf.imsubhdr import ( 
-    Field as IMGSUB_Field,
     Image_Subheader
 )
+from tmns.nitf.parse_plan import Projection
+from tmns.nitf.segdir import Segment_Directory
+from tmns.nitf.sidecar import ( Sidecar,
+                                sidecar_path )
 
 from tmns.nitf.tre import TRE_Factory
 
@@ -36,8 +40,44 @@ def load_nitf( pathname,
                options: list = [],
                logger = None,
                img_factory = None,
-               tre_factory = None ):
-    
+               tre_factory = None,
+               use_mmap: bool = False,
+               metadata_only: bool = False,
+               fields: list = None,
+               tres: list = None,
+               cache = None,
+               sidecar: bool = False ):
+    '''
+    Load a NITF file.
+
+    If `use_mmap` is set, the file is memory-mapped and each image segment
+    references its bytes through a zero-copy `memoryview` rather than an
+    in-memory copy.  The returned container owns the mapping, so use it as a
+    context manager (or call `close()`) to release it.
+
+    If `metadata_only` is set, only the headers are read and the loader seeks
+    over all segment data.  Image data is then read from disk on demand.
+
+    If `fields` or `tres` are provided, only those header fields and TREs are
+    kept.  `fields` may mix file header and image subheader fields, and `tres`
+    is a list of TRE tags.  Fields needed to locate the segments and decode
+    the pixels are always kept.
+
+    If a `Header_Cache` is provided, the headers are taken from the cache when
+    the file is unchanged, skipping the parse entirely.  Otherwise they are
+    parsed and stored.  Projected loads bypass the cache.
+
+    If `sidecar` is set, the segment table, headers and block offsets are
+    taken from the `.nitfidx` file next to the NITF, read in one call, so
+    the structure of the NITF is never walked.  A missing or stale sidecar
+    is rebuilt after the load.
+    '''
+    #  Only build a projection if the caller asked for one
+    projection = None
+    if fields is not None or tres is not None:
+        projection = Projection( fields = fields,
+                                 tres   = tres )
+
     #  Setup logger, if not already set
     if logger == None:
         logger = logging.getLogger( 'tmns.nitf.core:load_nitf' )
@@ -51,38 +91,196 @@ def load_nitf( pathname,
         raise FileNotFoundError( f'Unable to find NITF {pathname}' )
     
     #  Check file size
-    fsize = os.path.getsize( pathname )
+    stat  = os.stat( pathname )
+    fsize = stat.st_size
     if fsize < 10:
         raise Exception( f'Image is not large enough. Size: {fsize}' )
 
-    #  Open file
-    with open( pathname, 'rb' ) as fin:
+    #  Projections drop fields, so only complete headers are cached
+    if projection is not None:
+        cache = None
+
+    headers = None
+    if cache is not None:
+        headers = cache.get( pathname, stat, tre_factory = tre_factory )
+
+    index = None
+    if sidecar:
+        index = load_sidecar( pathname, stat, logger )
+        if headers is None and index is not None:
+            headers = index.headers( logger      = logger,
+                                     tre_factory = tre_factory,
+                                     projection  = projection )
+
+    #  Known headers with no image data to read don't need the file at all
+    if headers is not None and metadata_only and not use_mmap:
+        nitf = parse_nitf( None,
+                           file_size     = fsize,
+                           logger        = logger,
+                           img_factory   = img_factory,
+                           tre_factory   = tre_factory,
+                           metadata_only = True,
+                           pathname      = pathname,
+                           headers       = headers )
+
+    #  Memory-mapped files keep the mapping open for the life of the container
+    elif use_mmap and not metadata_only:
+        with open( pathname, 'rb' ) as fin:
+            mapping = mmap.mmap( fin.fileno(), 0, access = mmap.ACCESS_READ )
+
+        try:
+            nitf = parse_nitf( mapping,
+                               file_size   = fsize,
+                               logger      = logger,
+                               img_factory = img_factory,
+                               tre_factory = tre_factory,
+                               mapping     = mapping,
+                               pathname    = pathname,
+                               projection  = projection,
+                               headers     = headers )
+        except:
+            mapping.close()
+            raise
+
+    else:
+        #  Open file
+        with open( pathname, 'rb' ) as fin:
+
+            nitf = parse_nitf( fin,
+                               file_size     = fsize,
+                               logger        = logger,
+                               img_factory   = img_factory,
+                               tre_factory   = tre_factory,
+                               metadata_only = metadata_only,
+                               pathname      = pathname,
+                               projection    = projection,
+                               headers       = headers )
+
+    if cache is not None and headers is None:
+        cache.put( pathname,
+                   headers = ( nitf.file_header,
+                               [ segment.subheader for segment in nitf.image_segments ],
+                               nitf.segment_directory ),
+                   stat    = stat )
+
+    if sidecar:
+        if index is None:
+            index = write_sidecar( pathname, nitf, stat, logger )
 
+        if index is not None:
+            for segment, block_offsets, pad_value in zip( nitf.image_segments, index.block_tables, index.pad_values ):
+                segment.block_offsets = block_offsets
+                segment.pad_value     = pad_value
+
+    return nitf
+
+
+def load_sidecar( pathname, stat, logger ):
+    '''
+    Read the sidecar of a NITF, or None if it is missing, stale or unreadable.
+    '''
+    try:
+        index = Sidecar.read( sidecar_path( pathname ) )
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning( f'Ignoring unreadable sidecar for {pathname}: {e}' )
+        return None
+
+    if not index.is_current( stat ):
+        logger.debug( f'Sidecar for {pathname} is stale' )
+        return None
+    return index
+
+
+def write_sidecar( pathname, nitf, stat, logger ):
+    '''
+    Build and write the sidecar of a loaded NITF.  Failures are logged, not
+    raised, since the sidecar is only an accelerator.
+    '''
+    try:
+        index = Sidecar.from_container( pathname, nitf, stat )
+        index.write( sidecar_path( pathname ) )
+        return index
+    except Exception as e:
+        logger.warning( f'Unable to write sidecar for {pathname}: {e}' )
+        return None
+
+
+def parse_nitf( file_handle,
+                file_size,
+                logger = None,
+                img_factory = None,
+                tre_factory = None,
+                mapping = None,
+                metadata_only: bool = False,
+                pathname = None,
+                projection = None,
+                headers = None ):
+    '''
+    Parse a NITF from an open, seekable file handle.
+
+    If `mapping` is provided, the handle must be that `mmap` object.  Image
+    segments will then hold views into the mapping instead of copies.
+
+    Segments are located through the segment directory, so with
+    `metadata_only` set, image data is skipped with `seek` and never read.
+    Graphic, text and data extension segments are never read in either mode.
+
+    If a `Projection` is provided, it is applied to every header.
+
+    If `headers` is provided, as `( file_header, image_subheaders, segment_directory )`
+    from a `Header_Cache`, no headers are parsed and only image data is read.
+    '''
+    #  Setup logger, if not already set
+    if logger == None:
+        logger = logging.getLogger( 'tmns.nitf.core:parse_nitf' )
+
+    #  Setup TRE factory, if not already set
+    if tre_factory == None:
+        tre_factory = TRE_Factory.default()
+
+    #  Headers from a cache are used as-is
+    subheaders = None
+    if headers is not None:
+        fhdr, subheaders, directory = headers
+
+    else:
         #  Read the file header
-        fhdr = File_Header.parse_binary( file_handle = fin,
-                                         tre_factory = tre_factory )
+        fhdr = File_Header.parse_binary( file_handle = file_handle,
+                                         tre_factory = tre_factory,
+                                         projection  = projection )
         logger.debug(fhdr)
 
-        fhdr_errors = fhdr.validate( file_size = fsize )
+        fhdr_errors = fhdr.validate( file_size = file_size )
         if len(fhdr_errors) > 0:
             error_str = f'FHDR Errors: {len(fhdr_errors)}\n'
             for x in range( len(fhdr_errors) ):
                 error_str += f'{fhdr_errors[x]}\n'
             logger.error( error_str )
 
-        #  Read the image subheader
-        image_segments = []
-        numi = fhdr.get( FHDR_Field.NUMI )['data'].value()
-        for idx in range( numi ):
+        #  Locate every segment from the lengths in the file header
+        directory = Segment_Directory.from_file_header( fhdr )
+        logger.debug( directory )
 
-            # Get size of image subheader
-            imgsub_size = fhdr.get( FHDR_Field.LISH_N, index = idx )
+    #  Read the image subheader
+    image_segments = []
+    for entry in directory.segments( Segment_Type.IMAGE ):
 
+        idx = entry.index
+
+        if subheaders is not None:
+            img_subheader = subheaders[idx]
+
+        else:
             #  Parse image subheader
-            img_subheader = Image_Subheader.parse_binary( file_handle = fin,
-                                                          tre_factory = tre_factory )
+            file_handle.seek( entry.subheader_offset )
+            img_subheader = Image_Subheader.parse_binary( file_handle = file_handle,
+                                                          tre_factory = tre_factory,
+                                                          length      = entry.subheader_length,
+                                                          projection  = projection )
             logging.debug( img_subheader )
-            
+
             #  Validate and check for errors
             errors = img_subheader.validate()
             if len(errors) > 0:
@@ -91,16 +289,140 @@ def load_nitf( pathname,
                     error_str += f'{errors[x]}\n'
                 logger.error( error_str )
 
-            #  Parse image segment
-            imgseg_size = fhdr.get( FHDR_Field.LI_N,   index = idx )['data'].value()
-            logger.debug( f'Reading Image Segment {idx+1} at {imgseg_size} bytes' )
-            image_buffer = fin.read( imgseg_size )
+        #  Parse image segment
+        imgseg_size   = entry.data_length
+        imgseg_offset = entry.data_offset
+        logger.debug( f'Reading Image Segment {idx+1} at {imgseg_size} bytes' )
+
+        #  Skipped and mapped segments only need their location.  Mapped
+        #  segments get their views once the walk is complete.
+        image_buffer = None
+        if not metadata_only and mapping is None:
+            file_handle.seek( imgseg_offset )
+            image_buffer = file_handle.read( imgseg_size )
+
+        image_segments.append( Image_Segment( subheader = img_subheader,
+                                              buffer    = image_buffer,
+                                              factory   = img_factory,
+                                              offset    = imgseg_offset,
+                                              length    = imgseg_size,
+                                              pathname  = pathname ) )
+
+    #  Views into the mapping are all sliced from a single top-level view
+    if mapping is not None and not metadata_only:
+        with memoryview( mapping ) as mapping_view:
+            for segment in image_segments:
+                segment.buffer = mapping_view[segment.offset:(segment.offset + segment.length)]
+
+    return NITF_Container( file_header       = fhdr,
+                           image_segments    = image_segments,
+                           mapping           = mapping,
+                           segment_directory = directory )
+
+
+def load_nitfs( paths,
+                workers: int = None,
+                mode: str = 'thread',
+                ordered: bool = False,
+                max_in_flight: int = None,
+                **kwargs ):
+    '''
+    Load many NITF files in parallel.
+
+    Returns a generator of `(pathname, result)` pairs, where `result` is the
+    `NITF_Container`, or the exception raised while loading that file.  Other
+    keyword arguments are passed to `load_nitf`.
+
+    `mode` is either `thread` or `process`.  Threads share the factories and
+    suit I/O-bound loads, while processes spread the parsing across cores.
+    Containers from worker processes are pickled back to the caller, so
+    `use_mmap` is only supported with threads.
+
+    At most `max_in_flight` files (default: twice the workers) are loaded or
+    waiting to be consumed at once, which bounds the memory used by large
+    corpora.  If `ordered` is set, results are yielded in the order of
+    `paths`, otherwise in the order they complete.
+    '''
+    if mode == 'thread':
+        executor_type = concurrent.futures.ThreadPoolExecutor
+
+        #  Build the factories once and share them with every thread
+        if kwargs.get( 'tre_factory' ) is None:
+            kwargs['tre_factory'] = TRE_Factory.default()
+
+    elif mode == 'process':
+        executor_type = concurrent.futures.ProcessPoolExecutor
+
+        if kwargs.get( 'use_mmap', False ):
+            raise ValueError( 'Memory-mapped containers cannot be returned from a worker process' )
+
+    else:
+        raise ValueError( f'Unsupported mode: {mode}. Expected thread or process' )
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError( f'At least one worker is required. Workers: {workers}' )
+
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+    if max_in_flight < 1:
+        raise ValueError( f'At least one file must be in flight. Max In Flight: {max_in_flight}' )
+
+    return _load_nitfs( iter( paths ),
+                        executor_type = executor_type,
+                        workers       = workers,
+                        ordered       = ordered,
+                        max_in_flight = max_in_flight,
+                        kwargs        = kwargs )
+
+
+def _load_nitfs( paths, executor_type, workers, ordered, max_in_flight, kwargs ):
+
+    #  Submitted files as (pathname, future), in the order of `paths`
+    pending = deque()
+    end_of_paths = object()
+
+    with executor_type( max_workers = workers ) as executor:
+        try:
+            while True:
+
+                #  Keep the window full
+                while len(pending) < max_in_flight:
+                    pathname = next( paths, end_of_paths )
+                    if pathname is end_of_paths:
+                        break
+                    pending.append( ( pathname, executor.submit( _load_nitf_task, pathname, kwargs ) ) )
+
+                if len(pending) == 0:
+                    return
+
+                if ordered:
+                    pathname, future = pending.popleft()
+                else:
+                    done, _ = concurrent.futures.wait( [ item[1] for item in pending ],
+                                                       return_when = concurrent.futures.FIRST_COMPLETED )
+                    for item in pending:
+                        if item[1] in done:
+                            break
+                    pending.remove( item )
+                    pathname, future = item
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = e
 
-            image_segments.append( Image_Segment( subheader = img_subheader,
-                                                  buffer    = image_buffer,
-                                                  factory   = img_factory ) )
+                yield pathname, result
 
+        finally:
+            #  Don't load files nobody will consume if the caller stops early
+            for _, future in pending:
+                future.cancel()
 
-        return NITF_Container( file_header    = fhdr,
-                               image_segments = image_segments )
 
+def _load_nitf_task( pathname, kwargs ):
+    '''
+    Worker entry point, defined at module scope so worker processes can unpickle it.
+    '''
+    return load_nitf( pathname, **kwargs )
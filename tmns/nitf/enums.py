@@ -39,4 +39,10 @@ class ImageCompression(Enum):
                 return x
 
 
-    
+class Segment_Type(Enum):
+
+    IMAGE   = 0
+    GRAPHIC = 1
+    TEXT    = 2
+    DES     = 3
+    RES     = 4
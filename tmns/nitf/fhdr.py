@@ -10,7 +10,6 @@
 #
 
 #  Python Libraries
-from collections import deque
 from enum import Enum
 import logging
 
@@ -18,6 +17,12 @@ import logging
 from tmns.nitf.tre   import ( TRE_Base,
                               TRE_Factory )
 from tmns.nitf.field_types import FieldType
+from tmns.nitf.mapping     import Header_Mapping
+from tmns.nitf.parse_plan  import ( Field_Run,
+                                    Projection,
+                                    parse_variable )
+from tmns.nitf.utils       import ( Buffer_Reader,
+                                    Field_Index )
 
 
 class Field(Enum):
@@ -95,23 +100,57 @@ class Field(Enum):
                  Field.NUM_RES, Field.UDHDL,   Field.UDHD,   Field.XHDL,
                  Field.XHD ]
 
+#  Location of the header length (HL), which is always at a fixed offset
+HL_START = sum( fld.value[1] for fld in Field.default_list()[:Field.HL.value[0]] )
+HL_END   = HL_START + Field.HL.value[1]
+
+#  Fields needed to locate the segments, which are kept by every projection
+REQUIRED_FIELDS = frozenset( [ Field.FL,      Field.HL,
+                               Field.NUMI,    Field.LISH_N,  Field.LI_N,
+                               Field.NUMS,    Field.LSSH_N,  Field.LS_N,
+                               Field.NUMX,    Field.NUMT,    Field.LTSH_N,  Field.LT_N,
+                               Field.NUMDES,  Field.LDSH_N,  Field.LD_N,
+                               Field.NUM_RES, Field.LRESH_N, Field.LRE_N,
+                               Field.UDHDL,   Field.XHDL ] )
+
+#  Precompiled parse plan.  Pairs of (run ending in a segment count, run of lengths per segment).
+SEGMENT_RUNS = [ ( Field_Run( Field.default_list()[:(Field.NUMI.value[0] + 1)], REQUIRED_FIELDS ),
+                   Field_Run( [ Field.LISH_N,  Field.LI_N ],  REQUIRED_FIELDS ) ),
+                 ( Field_Run( [ Field.NUMS ],                 REQUIRED_FIELDS ),
+                   Field_Run( [ Field.LSSH_N,  Field.LS_N ],  REQUIRED_FIELDS ) ),
+                 ( Field_Run( [ Field.NUMX, Field.NUMT ],     REQUIRED_FIELDS ),
+                   Field_Run( [ Field.LTSH_N,  Field.LT_N ],  REQUIRED_FIELDS ) ),
+                 ( Field_Run( [ Field.NUMDES ],               REQUIRED_FIELDS ),
+                   Field_Run( [ Field.LDSH_N,  Field.LD_N ],  REQUIRED_FIELDS ) ),
+                 ( Field_Run( [ Field.NUM_RES ],              REQUIRED_FIELDS ),
+                   Field_Run( [ Field.LRESH_N, Field.LRE_N ], REQUIRED_FIELDS ) ) ]
+
+UDHDL_RUN = Field_Run( [ Field.UDHDL ], REQUIRED_FIELDS )
+XHDL_RUN  = Field_Run( [ Field.XHDL ],  REQUIRED_FIELDS )
+
+
 class File_Header:
 
     def __init__( self, data, udhd, xhd ):
-        self.data = data
-        self.udhd = udhd
-        self.xhd  = xhd
+        self.data  = data
+        self.udhd  = udhd
+        self.xhd   = xhd
+        self.index = Field_Index( data )
 
     def get( self, field, index = 0 ):
+        return self.index.get( field, index )
 
-        counter = 0
-        for k in self.data.keys():
-            if self.data[k]['field'] == field:
-                if counter == index:
-                    return self.data[k]
-                else:
-                    counter += 1
-        return None
+    def count( self, field ):
+        '''
+        Number of entries for a repeated field.
+        '''
+        return self.index.count( field )
+
+    def as_mapping(self):
+        '''
+        Read-only view with the keys of `as_kvp()`, whose values are looked up on access.
+        '''
+        return Header_Mapping( self, Field, ( 'udhd', 'xhd' ) )
 
     def as_kvp(self):
 
@@ -173,111 +212,72 @@ class File_Header:
     
     
     @staticmethod
-    def parse_binary( file_handle, logger = None, tre_factory = None ):
+    def parse_binary( file_handle, logger = None, tre_factory = None, projection = None ):
+        '''
+        Read the entire file header in bulk, then parse it from memory.
+
+        The fields up to and including HL are read first to find the header
+        length, then the remainder of the header is read in one call.
+
+        If a `Projection` is provided, only the selected fields and TREs are kept.
+        '''
+        prefix = file_handle.read( HL_END )
+        if len(prefix) != HL_END:
+            raise Exception( f'Reached end of file before header length. Bytes Read: {len(prefix)}' )
+
+        header_length = int( prefix[HL_START:HL_END] )
+        remainder = file_handle.read( header_length - HL_END )
+        if len(remainder) != header_length - HL_END:
+            raise Exception( f'Reached end of file before end of header. Bytes Read: {HL_END + len(remainder)}, Header Length: {header_length}' )
+
+        return File_Header.parse_buffer( prefix + remainder,
+                                         logger      = logger,
+                                         tre_factory = tre_factory,
+                                         projection  = projection )
+
+    @staticmethod
+    def parse_buffer( buffer, logger = None, tre_factory = None, projection = None ):
 
         if logger is None:
-            logger = logging.getLogger( 'tmns.nitf.fhdr.FileHeader.parse_binary' )
+            logger = logging.getLogger( 'tmns.nitf.fhdr.FileHeader.parse_buffer' )
         
         if tre_factory == None:
             tre_factory = TRE_Factory.default()
 
+        if projection is None:
+            projection = Projection()
+
+        reader = Buffer_Reader( buffer )
         data = {}
 
-        #  Read block by block
-        fields = deque(Field.default_list())
-        offset = 0
+        #  Each segment count is followed by a pair of lengths per segment
+        for count_run, lengths_run in SEGMENT_RUNS:
+
+            count = count_run.parse( reader, data, projection.mask( count_run ) )['data'].value()
+            lengths_mask = projection.mask( lengths_run )
+            for _ in range( count ):
+                lengths_run.parse( reader, data, lengths_mask )
+
+        #  User-Defined Header Data, which starts with the 3 byte overflow
         udhd_tres = []
-        xhd_tres  = []
-        while len(fields) > 0:
-
-            add_entry = True
-
-            #  Grab next field
-            field = fields.popleft()
-
-            #  Get field data
-            fld = Field(field).value
-
-            field_pos       = offset
-            field_length    = fld[1]
-            field_type      = fld[2]
-            field_default   = fld[3]
-            field_is_fixed  = fld[4]
-            field_name      = fld[5]
-
-            #  If UDHD, need the UDHDL flag
-            if field_length <= 0 and field == Field.UDHD:
-                field_length = data[offset-2]['data'].value()
-
-            #  If XHD, need the XHDL flag
-            elif field_length <= 0 and field == Field.XHD:
-
-                field_length += data[offset-2]['data'].value()
-                field_length += data[offset-1]['data'].value()
-
-            #  Read a block of data
-            field_data = file_handle.read( field_length )
-            if len(field_data) != field_length:
-                raise Exception( f'Reached end of file before field. Field: {field}' )
-            
-            #  Convert to appropriate type
-            tp = FieldType.to_type( field_type )
-
-            new_field = { 'name': Field(field).name,
-                          'field': field,
-                          'type': tp,
-                          'data': tp(field_data, field_length) }
-
-            #  Number of Image Segments
-            if field == Field.NUMI:
-                numi_value = new_field['data'].value()
-                if numi_value > 0:
-                    for idx in range( numi_value ):
-                        fields.appendleft( Field.LI_N )
-                        fields.appendleft( Field.LISH_N )
-            
-            # Number of Graphic Segments
-            elif field == Field.NUMS:
-                nums_value = new_field['data'].value()
-                if nums_value > 0:
-                    for idx in range( nums_value ):
-                        fields.appendleft( Field.LS_N )
-                        fields.appendleft( Field.LSSH_N )
-            
-            # Number of Text Segments
-            elif field == Field.NUMT:
-                numt_value = new_field['data'].value()
-                if numt_value > 0:
-                    for idx in range( numt_value ):
-                        fields.appendleft( Field.LT_N )
-                        fields.appendleft( Field.LTSH_N )
-            
-            # Number of Data Extension Segments
-            elif field == Field.NUMDES:
-                numdes_value = new_field['data'].value()
-                if numdes_value > 0:
-
-                    for idx in range( numdes_value ):
-                        fields.appendleft( Field.LD_N )
-                        fields.appendleft( Field.LDSH_N )
-            
-            elif field == Field.UDHD:
-                udhd_tres = TRE_Base.parse_binary( new_field['data'].data,
-                                                   factory = tre_factory )
-                add_entry = False
-
-            elif field == Field.XHD:
-                xhd_data = new_field['data'].data[3:]
-                xhd_tres  = TRE_Base.parse_binary( xhd_data,
-                                                   factory = tre_factory )
-                add_entry = False
-
-            #  Finish and add field
-            if add_entry:
-                data[offset] = new_field
-                offset += 1
+        udhdl = UDHDL_RUN.parse( reader, data, projection.mask( UDHDL_RUN ) )['data'].value()
+        if udhdl > 0:
+            udhd = parse_variable( reader, Field.UDHD, udhdl )
+            if projection.keep_tres():
+                udhd_tres = TRE_Base.parse_binary( udhd['data'].data[3:],
+                                                   factory = tre_factory,
+                                                   tags    = projection.tres )
+
+        #  Extended Header Data, which starts with the 3 byte overflow
+        xhd_tres = []
+        xhdl = XHDL_RUN.parse( reader, data, projection.mask( XHDL_RUN ) )['data'].value()
+        if xhdl > 0:
+            xhd = parse_variable( reader, Field.XHD, xhdl )
+            if projection.keep_tres():
+                xhd_tres = TRE_Base.parse_binary( xhd['data'].data[3:],
+                                                  factory = tre_factory,
+                                                  tags    = projection.tres )
 
         return File_Header( data = data,
                             udhd = udhd_tres,
                             xhd  = xhd_tres )
-
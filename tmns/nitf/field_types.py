@@ -63,18 +63,111 @@ class FieldType(Enum):
             return TRE
 
 
-class NITF_Character_Set:
+class Field_Entry:
+    '''
+    A single parsed field.
+
+    Entries are either built from a decoded value, or record where the field
+    is in a shared `buffer` and decode it on first access to `data`.
+
+    Entries used to be 4-key dictionaries, so `entry['name']`, `entry['field']`,
+    `entry['type']` and `entry['data']` are still supported.
+    '''
+    __slots__ = ( 'field', 'buffer', 'start', 'length', '_data' )
+
+    def __init__( self, field, data = None, buffer = None, start = 0, length = 0 ):
+
+        self.field  = field
+        self.buffer = buffer
+        self.start  = start
+        self.length = length
+        self._data  = data
+
+    @property
+    def data(self):
+
+        if self._data is None:
+            tp = FieldType.to_type( self.field.value[2] )
+            self._data = tp( self.buffer[self.start:(self.start + self.length)], self.length )
+            self.buffer = None
+        return self._data
+
+    @property
+    def name(self):
+        return self.field.name
+
+    @property
+    def type(self):
+        return FieldType.to_type( self.field.value[2] )
+
+    def is_decoded(self):
+        return self._data is not None
+
+    def raw(self):
+        '''
+        The field's bytes, without decoding it.
+        '''
+        if self._data is None:
+            return self.buffer[self.start:(self.start + self.length)]
+        return self._data.data
+
+    def keys(self):
+        return ( 'name', 'field', 'type', 'data' )
+
+    def __getitem__( self, key ):
+
+        if key == 'data':
+            return self.data
+        if key == 'field':
+            return self.field
+        if key == 'name':
+            return self.field.name
+        if key == 'type':
+            return self.type
+        raise KeyError( key )
 
-    def value(self):
-        raise NotImplementedError( f'Not implemented for base type. {self}' )
-    
-class BCS_A(NITF_Character_Set):
+    def __repr__(self):
+        if self._data is None:
+            return f'Field_Entry( {self.field.name}, Offset: {self.start}, Length: {self.length} )'
+        return f'Field_Entry( {self.field.name}, {self._data!r} )'
+
+
+#  Marks a value which has not been decoded yet
+_NOT_DECODED = object()
+
+
+class NITF_Character_Set:
+    '''
+    Raw field bytes plus the decoded value, which is computed once on first use.
+    '''
+    __slots__ = ( 'data', 'field_size', '_value' )
 
     def __init__( self, data: bytes, field_size ):
         
         #  Internal data
         self.data = data
         self.field_size = field_size
+        self._value = _NOT_DECODED
+
+    def __getstate__(self):
+        return ( self.data, self.field_size )
+
+    def __setstate__(self, state):
+        self.data, self.field_size = state
+        self._value = _NOT_DECODED
+
+    def value(self):
+
+        if self._value is _NOT_DECODED:
+            self._value = self.decode()
+        return self._value
+
+    def decode(self):
+        raise NotImplementedError( f'Not implemented for base type. {self}' )
+    
+class BCS_A(NITF_Character_Set):
+
+    __slots__ = ()
     
     def __str__(self):
         
@@ -86,16 +179,12 @@ class BCS_A(NITF_Character_Set):
     def __repr__(self):
         return f'BCS_A, Data: [{str(self)}]'
     
-    def value(self):
+    def decode(self):
         return self.data.decode('utf8')
 
 class BCS_N(NITF_Character_Set):
 
-    def __init__( self, data: bytes, field_size ):
-        
-        #  Internal data
-        self.data = data
-        self.field_size = field_size
+    __slots__ = ()
     
     def __str__(self):
         
@@ -107,16 +196,12 @@ class BCS_N(NITF_Character_Set):
     def __repr__(self):
         return f'BCS_N, Data: {str(self)}'
 
-    def value(self):
+    def decode(self):
         return int(self.data.decode('utf8'))
     
 class BCS_NP(NITF_Character_Set):
 
-    def __init__( self, data: bytes, field_size ):
-        
-        #  Internal data
-        self.data = data
-        self.field_size = field_size
+    __slots__ = ()
     
     def __str__(self):
         
@@ -132,16 +217,12 @@ class BCS_NP(NITF_Character_Set):
     def __repr__(self):
         return f'BCS_NP, Data: [{str(self)}]'
     
-    def value(self):
+    def decode(self):
         return int(self.data)
     
 class ECS_A(NITF_Character_Set):
 
-    def __init__( self, data: bytes, field_size ):
-        
-        #  Internal data
-        self.data = data
-        self.field_size = field_size
+    __slots__ = ()
     
     def __str__(self):
         
@@ -153,16 +234,12 @@ class ECS_A(NITF_Character_Set):
     def __repr__(self):
         return f'ECS_A, Data: [{str(self)}]'
     
-    def value(self):
+    def decode(self):
         return self.data.decode('utf8')
 
 class UINT32(NITF_Character_Set):
 
-    def __init__( self, data: bytes, field_size ):
-        
-        #  Internal data
-        self.data = data
-        self.field_size = field_size
+    __slots__ = ()
     
     def __str__(self):
         
@@ -171,17 +248,13 @@ class UINT32(NITF_Character_Set):
     def __repr__(self):
         return f'UINT32, Data: {self.value()}, Len: {self.field_size}'
     
-    def value(self):
+    def decode(self):
         return struct.unpack( 'I', self.data )[0]
     
     
 class UnsignedBinary(NITF_Character_Set):
 
-    def __init__( self, data: bytes, field_size ):
-        
-        #  Internal data
-        self.data = data
-        self.field_size = field_size
+    __slots__ = ()
     
     def __str__(self):
         
@@ -193,16 +266,12 @@ class UnsignedBinary(NITF_Character_Set):
     def __repr__(self):
         return f'UnsignedBinary, Data: [{str(self.value())}], Len: {self.field_size}'
     
-    def value(self):
+    def decode(self):
         return self.data
 
 class IEEE_754_FLOAT(NITF_Character_Set):
 
-    def __init__( self, data: bytes, field_size ):
-
-        #  Internal data
-        self.data = data
-        self.field_size = field_size
+    __slots__ = ()
     
     def __str__(self):
         return str(self.value())
@@ -210,17 +279,13 @@ class IEEE_754_FLOAT(NITF_Character_Set):
     def __repr__(self):
         return f'IEEE_754_FLOAT, Data: {str(self)}'
     
-    def value(self):
+    def decode(self):
         return struct.unpack( 'f', self.data )[0]
 
 
 class TRE(NITF_Character_Set):
 
-    def __init__( self, data: bytes, field_size ):
-        
-        #  Internal data
-        self.data = data
-        self.field_size = field_size
+    __slots__ = ()
     
     def __str__(self):
         
@@ -232,5 +297,5 @@ class TRE(NITF_Character_Set):
     def __repr__(self):
         return f'TRE, Data: {str(self)}'
     
-    def value(self):
+    def decode(self):
         return self.data
\ No newline at end of file
@@ -20,5 +20,8 @@ class Driver_Base:
     def encode( self, code, image ):
         raise NotImplementedError( 'Not implemented in base class' )
     
-    def decode( self, code, buffer ):
+    def decode( self, code, buffer, subheader = None ):
+        '''
+        Decode image data.  The subheader gives the geometry and pixel type for drivers which need them.
+        '''
         raise NotImplementedError( 'Not implemented in base class' )
\ No newline at end of file
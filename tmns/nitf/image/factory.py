@@ -13,8 +13,12 @@
 
 
 #  Terminus Libraries
-from tmns.nitf.enums import ImageCompression
-from tmns.nitf.image.opj_driver import OPJ_Driver
+from tmns.nitf.enums              import ImageCompression
+from tmns.nitf.image              import ( jpeg_driver,
+                                           pil_j2k_driver )
+from tmns.nitf.image.opj_driver   import OPJ_Driver
+from tmns.nitf.image.raw_driver   import Raw_Driver
+from tmns.nitf.image.vq_driver    import VQ_Driver
 
 class Driver_Factory:
 
@@ -31,9 +35,12 @@ class Driver_Factory:
         if encode_driver != None:
             self.encode_drivers[code] = encode_driver
 
-    def decode( self, code, buffer ):
-
-        return self.decode_drivers[code].decode( code, buffer )
+    def decode( self, code, buffer, subheader = None, **kwargs ):
+        '''
+        Decode with the driver for a code.  Keyword arguments are options of
+        the driver, such as `reduce` and `region` for JPEG 2000.
+        '''
+        return self.decode_drivers[code].decode( code, buffer, subheader, **kwargs )
 
     
     @staticmethod
@@ -41,7 +48,26 @@ class Driver_Factory:
 
         factory = Driver_Factory()
 
-        factory.register_driver( ImageCompression.C8, OPJ_Driver(), OPJ_Driver() )
+        #  JPEG 2000 is decoded in memory when Pillow has OpenJPEG, otherwise with the command-line tools
+        if pil_j2k_driver.is_available():
+            j2k_driver = pil_j2k_driver.Pillow_J2K_Driver()
+            factory.register_driver( ImageCompression.C8, j2k_driver, OPJ_Driver() )
+            factory.register_driver( ImageCompression.M8, j2k_driver )
+        else:
+            opj_driver = OPJ_Driver()
+            factory.register_driver( ImageCompression.C8, opj_driver, opj_driver )
+            factory.register_driver( ImageCompression.M8, opj_driver )
+
+        #  Blocked JPEG shares one driver, and so one thread pool
+        if jpeg_driver.is_available():
+            blocked_jpeg = jpeg_driver.JPEG_Driver()
+            factory.register_driver( ImageCompression.C3, blocked_jpeg )
+            factory.register_driver( ImageCompression.M3, blocked_jpeg )
+
+        factory.register_driver( ImageCompression.C4, VQ_Driver() )
+        factory.register_driver( ImageCompression.M4, VQ_Driver() )
+        factory.register_driver( ImageCompression.NC, Raw_Driver() )
+        factory.register_driver( ImageCompression.NM, Raw_Driver() )
 
         return factory
 
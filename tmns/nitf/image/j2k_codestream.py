@@ -0,0 +1,418 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Scanner for JPEG 2000 codestreams, which reads the main header and locates
+every tile-part without decoding.
+
+Only the main header markers are parsed (SIZ, COD, QCD and TLM).  When TLM
+markers are present the tile-part table is built from them alone, otherwise
+each SOT marker is visited, which reads 12 bytes per tile-part.
+
+The JPEG 2000 drivers share the rest of the module: `strip_mask()` finds
+the codestream of `C8` and `M8` image data, `trim_image()` trims a decoded
+image, and `decode_window()` decodes only the tiles of a window.
+'''
+
+#  Python Libraries
+import struct
+
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf.enums        import ImageCompression
+from tmns.nitf.image.layout import Image_Layout
+from tmns.nitf.image.mask   import Mask_Table
+
+
+#  Codestream markers
+SOC = 0xFF4F
+SIZ = 0xFF51
+COD = 0xFF52
+QCD = 0xFF5C
+TLM = 0xFF55
+PLM = 0xFF57
+SOT = 0xFF90
+EOC = 0xFFD9
+
+#  Rsiz, Xsiz, Ysiz, XOsiz, YOsiz, XTsiz, YTsiz, XTOsiz, YTOsiz and Csiz, after Lsiz
+SIZ_STRUCT = struct.Struct( '>HIIIIIIIIH' )
+
+#  Scod, progression order, layers, multiple component transform, levels,
+#  code-block width and height, code-block style and wavelet transform
+COD_STRUCT = struct.Struct( '>BBHBBBBBB' )
+
+#  Lsot, Isot, Psot, TPsot and TNsot, after the marker
+SOT_STRUCT = struct.Struct( '>HHIBB' )
+
+TILE_PART_DTYPE = np.dtype( [ ( 'tile',   np.uint16 ),
+                              ( 'part',   np.uint8 ),
+                              ( 'offset', np.uint64 ),
+                              ( 'length', np.uint64 ) ] )
+
+PROGRESSION_ORDERS = [ 'LRCP', 'RLCP', 'RPCL', 'PCRL', 'CPRL' ]
+
+
+class Codestream:
+    '''
+    Main header and tile-part table of a JPEG 2000 codestream.
+
+    `tile_parts` is a NumPy array of (tile, part, offset, length), with
+    offsets from the start of the codestream.  `header_length` is the size
+    of the main header, from SOC up to the first SOT.
+    '''
+    def __init__( self, header_length, siz, components, cod, qcd_style, guard_bits, tile_parts, has_tlm ):
+
+        self.header_length = header_length
+        self.rsiz, self.xsiz, self.ysiz, self.xosiz, self.yosiz, self.xtsiz, self.ytsiz, self.xtosiz, self.ytosiz = siz
+        self.components    = components
+        self.qcd_style     = qcd_style
+        self.guard_bits    = guard_bits
+        self.tile_parts    = tile_parts
+        self.has_tlm       = has_tlm
+
+        self.progression, self.layers, self.mct, self.levels, self.cblk_width, self.cblk_height, self.reversible = cod
+
+    def __repr__(self):
+        return ( f'Codestream( {self.nrows()}x{self.ncols()}x{self.nbands()}, Bits: {self.components[0][0]}, '
+                 f'Tiles: {self.tile_rows()}x{self.tile_cols()} of {self.ytsiz}x{self.xtsiz}, '
+                 f'Levels: {self.levels}, Layers: {self.layers}, Progression: {self.progression}, '
+                 f'Tile-Parts: {len(self.tile_parts)}, TLM: {self.has_tlm} )' )
+
+    def nrows( self ):
+        return self.ysiz - self.yosiz
+
+    def ncols( self ):
+        return self.xsiz - self.xosiz
+
+    def nbands( self ):
+        return len(self.components)
+
+    def tile_rows( self ):
+        return -(-( self.ysiz - self.ytosiz ) // self.ytsiz)
+
+    def tile_cols( self ):
+        return -(-( self.xsiz - self.xtosiz ) // self.xtsiz)
+
+    def tiles_in_region( self, row, col, height, width ):
+        '''
+        Indices of the tiles which intersect a region, given from the image origin.
+        '''
+        x0 = self.xosiz + col
+        y0 = self.yosiz + row
+        x1 = min( x0 + width, self.xsiz )
+        y1 = min( y0 + height, self.ysiz )
+
+        tile_rows = np.arange( ( y0 - self.ytosiz ) // self.ytsiz, ( y1 - 1 - self.ytosiz ) // self.ytsiz + 1 )
+        tile_cols = np.arange( ( x0 - self.xtosiz ) // self.xtsiz, ( x1 - 1 - self.xtosiz ) // self.xtsiz + 1 )
+        return ( tile_rows[:, None] * self.tile_cols() + tile_cols[None, :] ).ravel()
+
+    def tile_bounds( self, tile ):
+        '''
+        (top, left, bottom, right) of a tile on the reference grid, clipped to the image.
+        '''
+        tile_row, tile_col = divmod( tile, self.tile_cols() )
+        return ( max( self.ytosiz + tile_row * self.ytsiz, self.yosiz ),
+                 max( self.xtosiz + tile_col * self.xtsiz, self.xosiz ),
+                 min( self.ytosiz + ( tile_row + 1 ) * self.ytsiz, self.ysiz ),
+                 min( self.xtosiz + ( tile_col + 1 ) * self.xtsiz, self.xsiz ) )
+
+    def main_header( self, read ):
+        '''
+        The main header without TLM and PLM markers, whose tile-part and
+        packet lengths no longer hold once tile-parts are left out.
+        '''
+        header = read( 0, self.header_length )
+        output = bytearray( header[:2] )
+        offset = 2
+        while offset < len(header):
+            marker, length = struct.unpack_from( '>HH', header, offset )
+            if marker not in ( TLM, PLM ):
+                output += header[offset:(offset + 2 + length)]
+            offset += 2 + length
+        return output
+
+    def extract( self, read, tiles ):
+        '''
+        Build a codestream holding the main header and only the tile-parts
+        of `tiles`.  `read( offset, length )` reads from the original.
+        Tiles which are left out decode as zeros.
+        '''
+        selected = self.tile_parts[np.isin( self.tile_parts['tile'], tiles )]
+
+        output = self.main_header( read )
+        for offset, length in zip( selected['offset'].tolist(), selected['length'].tolist() ):
+            output += read( offset, length )
+        output += struct.pack( '>H', EOC )
+        return bytes( output )
+
+    def extract_area( self, read, tiles, top, left, bottom, right ):
+        '''
+        Build a codestream of `tiles`, whose image area is only (top, left,
+        bottom, right) on the reference grid.  A decoder then allocates the
+        area rather than the whole image.  The area must start within its
+        first tile, and the tiles are renumbered on the smaller tile grid.
+        '''
+        tile_row0 = ( top - self.ytosiz ) // self.ytsiz
+        tile_col0 = ( left - self.xtosiz ) // self.xtsiz
+        grid_top  = self.ytosiz + tile_row0 * self.ytsiz
+        grid_left = self.xtosiz + tile_col0 * self.xtsiz
+        tile_cols = -(-( right - grid_left ) // self.xtsiz)
+
+        #  SIZ directly follows SOC
+        output = self.main_header( read )
+        SIZ_STRUCT.pack_into( output, 6,
+                              self.rsiz, right, bottom, left, top, self.xtsiz, self.ytsiz,
+                              grid_left, grid_top, len(self.components) )
+
+        selected = self.tile_parts[np.isin( self.tile_parts['tile'], tiles )]
+        for tile, offset, length in zip( selected['tile'].tolist(), selected['offset'].tolist(), selected['length'].tolist() ):
+            tile_row, tile_col = divmod( tile, self.tile_cols() )
+            part = bytearray( read( offset, length ) )
+            struct.pack_into( '>H', part, 4, ( tile_row - tile_row0 ) * tile_cols + tile_col - tile_col0 )
+            output += part
+        output += struct.pack( '>H', EOC )
+        return bytes( output )
+
+    def dtype( self ):
+        '''
+        NumPy type which holds the samples of the first component.
+        '''
+        bits, signed, _, _ = self.components[0]
+        size = 1 if bits <= 8 else 2 if bits <= 16 else 4
+        return np.dtype( f'{"i" if signed else "u"}{size}' )
+
+    @staticmethod
+    def scan( read, size ):
+        '''
+        Scan a codestream of `size` bytes with a `read( offset, length )` function.
+        '''
+        if struct.unpack( '>H', read( 0, 2 ) )[0] != SOC:
+            raise ValueError( 'Data is not a JPEG 2000 codestream' )
+
+        siz = components = cod = None
+        qcd_style = guard_bits = None
+        tlm = []
+
+        #  The main header runs from SOC to the first SOT
+        offset = 2
+        while True:
+
+            marker, length = struct.unpack( '>HH', read( offset, 4 ) )
+            if marker == SOT:
+                break
+
+            if marker in ( SIZ, COD, QCD, TLM ):
+                body = read( offset + 4, length - 2 )
+
+                if marker == SIZ:
+                    values = SIZ_STRUCT.unpack_from( body, 0 )
+                    siz    = values[:9]
+                    components = []
+                    for idx in range( values[9] ):
+                        ssiz, xrsiz, yrsiz = struct.unpack_from( '>BBB', body, SIZ_STRUCT.size + 3 * idx )
+                        components.append( ( ( ssiz & 0x7F ) + 1, bool( ssiz & 0x80 ), xrsiz, yrsiz ) )
+
+                elif marker == COD:
+                    scod, order, layers, mct, levels, xcb, ycb, _, transform = COD_STRUCT.unpack_from( body, 0 )
+                    cod = ( PROGRESSION_ORDERS[order] if order < len(PROGRESSION_ORDERS) else str(order),
+                            layers,
+                            mct,
+                            levels,
+                            1 << ( xcb + 2 ),
+                            1 << ( ycb + 2 ),
+                            transform == 1 )
+
+                elif marker == QCD:
+                    qcd_style  = body[0] & 0x1F
+                    guard_bits = body[0] >> 5
+
+                else:
+                    tlm.append( body )
+
+            offset += 2 + length
+
+        if siz is None or cod is None:
+            raise ValueError( 'Codestream is missing its SIZ or COD marker' )
+
+        header_length = offset
+        if len(tlm) > 0:
+            tile_parts = Codestream.parse_tlm( tlm, header_length )
+        else:
+            tile_parts = Codestream.walk_tile_parts( read, header_length, size )
+
+        return Codestream( header_length = header_length,
+                           siz           = siz,
+                           components    = components,
+                           cod           = cod,
+                           qcd_style     = qcd_style,
+                           guard_bits    = guard_bits,
+                           tile_parts    = tile_parts,
+                           has_tlm       = len(tlm) > 0 )
+
+    @staticmethod
+    def parse_tlm( segments, header_length ):
+        '''
+        Build the tile-part table from TLM marker segments, in Ztlm order.
+        '''
+        tiles   = []
+        lengths = []
+        table   = np.zeros( 0, dtype = TILE_PART_DTYPE )
+        for body in sorted( segments, key = lambda body: body[0] ):
+
+            stlm = body[1]
+            tile_size   = ( stlm >> 4 ) & 0x3
+            length_size = 4 if stlm & 0x40 else 2
+            entry_size  = tile_size + length_size
+
+            for entry in range( 2, len(body) - entry_size + 1, entry_size ):
+                if tile_size == 0:
+                    tiles.append( len(tiles) )
+                else:
+                    tiles.append( int.from_bytes( body[entry:(entry + tile_size)], 'big' ) )
+                lengths.append( int.from_bytes( body[(entry + tile_size):(entry + entry_size)], 'big' ) )
+
+        if len(tiles) == 0:
+            return table
+
+        table = np.zeros( len(tiles), dtype = TILE_PART_DTYPE )
+        table['tile']   = tiles
+        table['length'] = lengths
+        table['offset'] = header_length + np.concatenate( [ [ 0 ], np.cumsum( lengths[:-1], dtype = np.uint64 ) ] ).astype( np.uint64 )
+
+        #  Parts are numbered in order within each tile
+        parts = {}
+        for idx, tile in enumerate( tiles ):
+            table['part'][idx] = parts.get( tile, 0 )
+            parts[tile] = parts.get( tile, 0 ) + 1
+
+        return table
+
+    @staticmethod
+    def walk_tile_parts( read, offset, size ):
+        '''
+        Build the tile-part table by visiting each SOT marker.
+        '''
+        rows = []
+        while offset + 2 + SOT_STRUCT.size <= size:
+
+            data = read( offset, 2 + SOT_STRUCT.size )
+            if struct.unpack_from( '>H', data, 0 )[0] != SOT:
+                break
+
+            _, isot, psot, tpsot, _ = SOT_STRUCT.unpack_from( data, 2 )
+
+            #  Psot of zero means the tile-part runs to the EOC marker
+            if psot == 0:
+                psot = size - offset - 2
+
+            rows.append( ( isot, tpsot, offset, psot ) )
+            offset += psot
+
+        return np.array( rows, dtype = TILE_PART_DTYPE )
+
+
+def strip_mask( code, buffer, subheader = None ):
+    '''
+    Split `C8` or `M8` image data into its layout, which is None without a
+    subheader, and its codestream.  Masked images start with a mask table,
+    which is skipped.
+    '''
+    layout = None
+    if subheader is not None:
+        layout = Image_Layout.from_subheader( subheader )
+
+    if code == ImageCompression.M8:
+        if layout is None:
+            raise ValueError( 'M8 decoding requires the image subheader' )
+        buffer = buffer[Mask_Table.parse( buffer, layout ).imdatoff:]
+
+    return layout, buffer
+
+
+def trim_image( pixels, layout, reduce ):
+    '''
+    Trim a decoded image to the image size at the reduced resolution.
+    '''
+    if layout is None:
+        return pixels
+    scale = 1 << reduce
+    return pixels[:(-(-layout.nrows // scale)), :(-(-layout.ncols // scale))]
+
+
+def decode_window( buffer, region, reduce, decode, area = 'tile' ):
+    '''
+    Decode a window (row, column, height, width) of a codestream, given
+    from the image origin at full resolution, with each dimension divided by
+    `2 ** reduce`.  `decode( data )` decodes a codestream at the reduced
+    resolution.  Tiles without data are left as zeros.
+
+    `area` sets what each decode covers, which is copied into an output
+    the size of the window:
+
+    - `tile`:   Each tile which intersects the window on its own, as a
+                codestream whose image is only that tile, so memory is
+                bounded by the window and one tile.
+    - `window`: All of the intersecting tiles at once, as an image of
+                just those tiles, with a single decode.
+    - `origin`: All of the intersecting tiles at once, as an image from
+                the original origin to the end of the window, for decoders
+                which cannot handle an image away from the origin.
+    '''
+    def read( offset, length ):
+        return buffer[offset:(offset + length)]
+
+    codestream = Codestream.scan( read, len(buffer) )
+    scale = 1 << reduce
+    row, col, height, width = region
+
+    #  Window on the reduced reference grid
+    top    = ( codestream.yosiz + row ) // scale
+    left   = ( codestream.xosiz + col ) // scale
+    bottom = -(-( codestream.yosiz + row + height ) // scale)
+    right  = -(-( codestream.xosiz + col + width ) // scale)
+
+    present = set( codestream.tile_parts['tile'].tolist() )
+    tiles   = [ tile for tile in codestream.tiles_in_region( row, col, height, width ).tolist() if tile in present ]
+    bounds  = np.array( [ codestream.tile_bounds( tile ) for tile in tiles ], dtype = np.int64 ).reshape( -1, 4 )
+
+    #  Areas as (tiles, top, left, bottom, right) on the full-resolution grid
+    if area == 'tile':
+        areas = [ ( [ tile ], *tile_bounds ) for tile, tile_bounds in zip( tiles, bounds.tolist() ) ]
+    elif area not in ( 'window', 'origin' ):
+        raise ValueError( f'Unsupported decode area: {area}. Expected tile, window or origin' )
+    elif len(tiles) == 0:
+        areas = []
+    elif area == 'window':
+        areas = [ ( tiles, int( bounds[:, 0].min() ), int( bounds[:, 1].min() ), int( bounds[:, 2].max() ), int( bounds[:, 3].max() ) ) ]
+    else:
+        areas = [ ( tiles, codestream.yosiz, codestream.xosiz, int( bounds[:, 2].max() ), int( bounds[:, 3].max() ) ) ]
+
+    output = np.zeros( ( bottom - top, right - left, codestream.nbands() ), dtype = codestream.dtype() )
+    for area_tiles, area_top, area_left, area_bottom, area_right in areas:
+
+        pixels = decode( codestream.extract_area( read, area_tiles, area_top, area_left, area_bottom, area_right ) )
+        if pixels.ndim == 2:
+            pixels = pixels[:, :, None]
+
+        area_top  = -(-area_top // scale)
+        area_left = -(-area_left // scale)
+
+        row0 = max( top, area_top )
+        row1 = min( bottom, area_top + pixels.shape[0] )
+        col0 = max( left, area_left )
+        col1 = min( right, area_left + pixels.shape[1] )
+        if row1 > row0 and col1 > col0:
+            output[(row0 - top):(row1 - top), (col0 - left):(col1 - left)] = pixels[(row0 - area_top):(row1 - area_top),
+                                                                                    (col0 - area_left):(col1 - area_left)]
+
+    if output.shape[2] == 1:
+        output = output[:, :, 0]
+    return output
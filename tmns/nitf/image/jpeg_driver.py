@@ -0,0 +1,244 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+from concurrent.futures import ThreadPoolExecutor
+import io
+import os
+import re
+import threading
+
+import numpy as np
+
+#  Pillow
+from PIL import features
+from PIL import JpegImagePlugin
+
+#  Terminus Libraries
+from tmns.nitf.enums             import ImageCompression
+from tmns.nitf.image.driver_base import Driver_Base
+from tmns.nitf.image.layout      import ( EMPTY_BLOCK,
+                                          Image_Layout )
+from tmns.nitf.image.mask        import Mask_Table
+
+
+#  JPEG markers
+SOI = 0xD8
+EOI = 0xD9
+SOS = 0xDA
+
+#  Markers which are not followed by a segment length
+STANDALONE_MARKERS = set( [ 0x01, SOI, EOI ] + list( range( 0xD0, 0xD8 ) ) )
+
+#  The next marker after entropy-coded data, which never holds 0xFF followed
+#  by anything other than a stuffed zero or a restart marker
+NEXT_MARKER = re.compile( rb'\xff[^\x00\xd0-\xd7\xff]' )
+
+START_OF_IMAGE = re.compile( rb'\xff\xd8' )
+
+
+def is_available():
+    '''
+    True if Pillow was built with libjpeg.
+    '''
+    return features.check( 'jpg' )
+
+
+def find_streams( buffer, offset = 0, count = None ):
+    '''
+    Locate JPEG streams stored back to back, starting at `offset`, as a list
+    of (offset, length).  Streams are found by walking their marker segments,
+    so JPEG markers inside application segments do not split a stream.
+    '''
+    streams = []
+    end = len(buffer)
+    while count is None or len(streams) < count:
+
+        match = START_OF_IMAGE.search( buffer, offset )
+        if match is None:
+            break
+        start = match.start()
+        pos   = start + 2
+
+        while True:
+
+            #  Skip fill bytes before the marker
+            while pos < end and buffer[pos] == 0xFF and pos + 1 < end and buffer[pos + 1] == 0xFF:
+                pos += 1
+            if pos + 2 > end or buffer[pos] != 0xFF:
+                raise ValueError( f'JPEG stream at offset {start} is truncated or corrupt' )
+
+            marker = buffer[pos + 1]
+            if marker == EOI:
+                pos += 2
+                break
+            if marker in STANDALONE_MARKERS:
+                pos += 2
+                continue
+
+            pos += 2 + ( ( buffer[pos + 2] << 8 ) | buffer[pos + 3] )
+
+            #  Entropy-coded data follows the scan header
+            if marker == SOS:
+                match = NEXT_MARKER.search( buffer, pos )
+                if match is None:
+                    raise ValueError( f'JPEG stream at offset {start} has no end of image marker' )
+                pos = match.start()
+
+        streams.append( ( start, pos - start ) )
+        offset = pos
+
+    return streams
+
+
+class JPEG_Driver(Driver_Base):
+    '''
+    Blocked JPEG (`C3`, `M3`) decoder using Pillow.
+
+    Each block is a complete JPEG stream.  With IMODE `S` each band is its
+    own set of single-component blocks, otherwise every block holds all of
+    the bands.  Blocks are decoded concurrently on a thread pool, since
+    Pillow releases the GIL while decoding, and each is written straight
+    into its place in one preallocated array.  Images are returned as (rows,
+    columns, bands), or (rows, columns) for single-band images.  YCbCr
+    blocks are returned as RGB, and Pillow only supports 8-bit samples.
+
+    `C3` blocks are found by walking the JPEG markers.  `M3` blocks are
+    located by the mask table, and blocks without data take the pad value.
+
+    Config keys, see `default_config()`:
+
+    - `max_workers`: Number of blocks decoded at once.
+    '''
+    def __init__( self, config: dict = None ):
+
+        self.config = self.default_config()
+        if config is not None:
+            self.config.update( config )
+
+        self.executor = None
+        self.lock     = threading.Lock()
+
+    def __getstate__( self ):
+        '''
+        Only the config is pickled, since locks and threads cannot be, so
+        factories holding the driver can be sent to worker processes.
+        '''
+        return { 'config': self.config }
+
+    def __setstate__( self, state ):
+        self.__init__( state['config'] )
+
+    def encode( self, code, image ):
+        raise NotImplementedError( 'JPEG encoding is not implemented' )
+
+    def decode( self, code, buffer, subheader = None ):
+
+        if subheader is None:
+            raise ValueError( f'{code.name} decoding requires the image subheader' )
+
+        layout = Image_Layout.from_subheader( subheader )
+        shape  = ( layout.band_planes(), layout.nbpc, layout.nbpr )
+
+        fill = 0
+        if code == ImageCompression.M3:
+            mask = Mask_Table.parse( buffer, layout )
+            if mask.pad_value() is not None:
+                fill = mask.pad_value()
+            blocks = self.masked_blocks( buffer, mask, shape )
+        else:
+            blocks = find_streams( buffer, 0, layout.block_count() )
+            if len(blocks) != layout.block_count():
+                raise ValueError( f'Found {len(blocks)} JPEG blocks, expected {layout.block_count()}' )
+            blocks = [ index + block for index, block in zip( np.ndindex( shape ), blocks ) ]
+
+        image = np.full( ( layout.nbpc * layout.nppbv, layout.nbpr * layout.nppbh, layout.nbands ),
+                         fill,
+                         dtype = np.uint8 )
+
+        def decode_block( block ):
+            plane, block_row, block_col, offset, length = block
+            self.decode_block( layout, buffer[offset:(offset + length)], image, plane, block_row, block_col )
+
+        if self.config['max_workers'] > 1 and len(blocks) > 1:
+            for _ in self.get_executor().map( decode_block, blocks ):
+                pass
+        else:
+            for block in blocks:
+                decode_block( block )
+
+        image = image[:layout.nrows, :layout.ncols]
+        if image.shape[2] == 1:
+            image = image[:, :, 0]
+        return image
+
+    def decode_block( self, layout, data, image, plane, block_row, block_col ):
+        '''
+        Decode one JPEG stream into its block of the output image.
+        '''
+        block = JpegImagePlugin.JpegImageFile( io.BytesIO( data ) )
+        block.load()
+        pixels = np.asarray( block )
+        if pixels.ndim == 2:
+            pixels = pixels[:, :, None]
+
+        bands = 1 if layout.imode == 'S' else layout.nbands
+        if pixels.shape != ( layout.nppbv, layout.nppbh, bands ):
+            raise ValueError( f'JPEG block ({block_row}, {block_col}) has shape {pixels.shape}, '
+                              f'expected {( layout.nppbv, layout.nppbh, bands )}' )
+
+        row = block_row * layout.nppbv
+        col = block_col * layout.nppbh
+        image[row:(row + layout.nppbv),
+              col:(col + layout.nppbh),
+              (plane * bands):((plane + 1) * bands)] = pixels
+
+    @staticmethod
+    def masked_blocks( buffer, mask, shape ):
+        '''
+        Blocks of a masked image as (plane, block row, block column, offset, length).
+        '''
+        if mask.block_offsets is None:
+            streams = find_streams( buffer, mask.imdatoff, int( np.prod( shape ) ) )
+            return [ index + stream for index, stream in zip( np.ndindex( shape ), streams ) ]
+
+        #  Each block runs up to the next one in the file, and the last to the end of the data
+        offsets = mask.block_offsets.ravel()
+        present = np.flatnonzero( offsets != EMPTY_BLOCK )
+        starts  = offsets[present].astype( np.int64 ) + mask.imdatoff
+        ordered = np.sort( np.unique( starts ) )
+        ends    = np.append( ordered[1:], len(buffer) )
+        ends    = ends[np.searchsorted( ordered, starts )]
+
+        return [ np.unravel_index( index, shape ) + ( start, end - start )
+                 for index, start, end in zip( present.tolist(), starts.tolist(), ends.tolist() ) ]
+
+    def get_executor( self ):
+
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor( max_workers = self.config['max_workers'],
+                                                    thread_name_prefix = 'jpeg_decode' )
+            return self.executor
+
+    def close( self ):
+        '''
+        Stop the worker threads.
+        '''
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+
+    @staticmethod
+    def default_config():
+        config = { 'max_workers': os.cpu_count() or 1 }
+        return config
@@ -0,0 +1,117 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf.enums    import ImageCompression
+from tmns.nitf.imsubhdr import Field as IM_Field
+
+
+#  Marks a block with no data in a block offset table
+EMPTY_BLOCK = np.iinfo( np.uint64 ).max
+
+#  Codes whose image data starts with a mask table
+MASKED_CODES = [ ImageCompression.M1, ImageCompression.M3, ImageCompression.M4, ImageCompression.M5,
+                 ImageCompression.M6, ImageCompression.M7, ImageCompression.M8, ImageCompression.NM ]
+
+
+class Image_Layout:
+    '''
+    Geometry and blocking of an image segment, taken from its subheader.
+
+    Blocks are numbered row-major.  With IMODE `S` every band is stored as
+    its own set of blocks, so tables are indexed by (band, block row, block
+    column).  Other modes have a single band plane.
+    '''
+    def __init__( self, nrows, ncols, nbands, nbpp, pvtype, imode, nbpr, nbpc, nppbh, nppbv, code ):
+
+        self.nrows  = nrows
+        self.ncols  = ncols
+        self.nbands = nbands
+        self.nbpp   = nbpp
+        self.pvtype = pvtype
+        self.imode  = imode
+        self.nbpr   = nbpr
+        self.nbpc   = nbpc
+        self.code   = code
+
+        #  A blocking of zero means the block spans the image
+        self.nppbh = nppbh if nppbh > 0 else ncols
+        self.nppbv = nppbv if nppbv > 0 else nrows
+
+    def __repr__(self):
+        return ( f'Image_Layout( {self.nrows}x{self.ncols}x{self.nbands}, NBPP: {self.nbpp}, '
+                 f'IMODE: {self.imode}, Blocks: {self.nbpc}x{self.nbpr} of {self.nppbv}x{self.nppbh}, '
+                 f'IC: {self.code.name if self.code is not None else None} )' )
+
+    @staticmethod
+    def from_subheader( subheader ):
+
+        def value( field ):
+            return subheader.get( field )['data'].value()
+
+        nbands = value( IM_Field.NBANDS )
+        if nbands == 0:
+            nbands = value( IM_Field.XBANDS )
+
+        return Image_Layout( nrows  = value( IM_Field.NROWS ),
+                             ncols  = value( IM_Field.NCOLS ),
+                             nbands = nbands,
+                             nbpp   = value( IM_Field.NBPP ),
+                             pvtype = value( IM_Field.PVTYPE ).strip(),
+                             imode  = value( IM_Field.IMODE ).strip(),
+                             nbpr   = value( IM_Field.NBPR ),
+                             nbpc   = value( IM_Field.NBPC ),
+                             nppbh  = value( IM_Field.NPPBH ),
+                             nppbv  = value( IM_Field.NPPBV ),
+                             code   = ImageCompression.from_str( value( IM_Field.IC ).strip() ) )
+
+    def is_masked( self ):
+        return self.code in MASKED_CODES
+
+    def is_uncompressed( self ):
+        return self.code in ( ImageCompression.NC, ImageCompression.NM )
+
+    def band_planes( self ):
+        '''
+        Number of separate sets of blocks, which is the band count for IMODE S.
+        '''
+        return self.nbands if self.imode == 'S' else 1
+
+    def block_count( self ):
+        return self.band_planes() * self.nbpc * self.nbpr
+
+    def block_bytes( self ):
+        '''
+        Size of one uncompressed block, per band plane.
+        '''
+        bands = 1 if self.imode == 'S' else self.nbands
+        return ( self.nppbh * self.nppbv * bands * self.nbpp + 7 ) // 8
+
+    def packed_offsets( self ):
+        '''
+        Offsets of uncompressed blocks stored back to back, shaped
+        (band planes, block rows, block columns).
+        '''
+        offsets = np.arange( self.block_count(), dtype = np.uint64 ) * np.uint64( self.block_bytes() )
+        return offsets.reshape( self.band_planes(), self.nbpc, self.nbpr )
+
+    def block_offsets( self ):
+        '''
+        Offset of each block from the start of the image data, shaped
+        (band planes, block rows, block columns).  Only known for
+        uncompressed, unmasked images, otherwise None.
+        '''
+        if self.code != ImageCompression.NC:
+            return None
+        return self.packed_offsets()
@@ -0,0 +1,144 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import struct
+
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf.image.layout import EMPTY_BLOCK
+
+
+#  IMDATOFF, BMRLNTH, TMRLNTH and TPXCDLNTH
+MASK_PREAMBLE = struct.Struct( '>IHHH' )
+
+#  BMRLNTH, TMRLNTH and TPXCDLNTH, which start RPF mask subsections
+MASK_RECORD_LENGTHS = struct.Struct( '>HHH' )
+
+#  Offset of a block which is not recorded in a mask
+MISSING_BLOCK = 0xFFFFFFFF
+
+
+class Mask_Table:
+    '''
+    Image data mask table, which starts the image data of masked (`M*`, `NM`) images.
+
+    Block offsets are relative to the start of the blocked image data, which
+    is `imdatoff` bytes into the segment, and shaped like
+    `Image_Layout.block_offsets()`.  Blocks without data are `EMPTY_BLOCK`.
+    `block_offsets` is None when the table has no block mask, in which case
+    every block is present.  `pad_offsets` is the same for pad pixel masks.
+    '''
+    def __init__( self, imdatoff, bmrlnth, tmrlnth, tpxcdlnth, tpxcd, block_offsets, pad_offsets ):
+
+        self.imdatoff      = imdatoff
+        self.bmrlnth       = bmrlnth
+        self.tmrlnth       = tmrlnth
+        self.tpxcdlnth     = tpxcdlnth
+        self.tpxcd         = tpxcd
+        self.block_offsets = block_offsets
+        self.pad_offsets   = pad_offsets
+
+    def __repr__(self):
+        return ( f'Mask_Table( IMDATOFF: {self.imdatoff}, BMRLNTH: {self.bmrlnth}, '
+                 f'TMRLNTH: {self.tmrlnth}, TPXCDLNTH: {self.tpxcdlnth} )' )
+
+    @staticmethod
+    def parse( buffer, layout, offset = 0, imdatoff = None ):
+        '''
+        Parse the mask table at the start of a masked image's data.
+
+        RPF mask subsections are the same table without IMDATOFF, and are
+        parsed by passing the table's `offset` and the `imdatoff` the block
+        offsets are relative to.
+        '''
+        if imdatoff is None:
+            if len(buffer) < offset + MASK_PREAMBLE.size:
+                raise ValueError( f'Image data is too small for a mask table. Size: {len(buffer)}' )
+            imdatoff = int.from_bytes( buffer[offset:(offset + 4)], 'big' )
+            offset += 4
+
+        if len(buffer) < offset + MASK_RECORD_LENGTHS.size:
+            raise ValueError( f'Image data is too small for a mask table. Size: {len(buffer)}' )
+
+        bmrlnth, tmrlnth, tpxcdlnth = MASK_RECORD_LENGTHS.unpack_from( buffer, offset )
+        offset += MASK_RECORD_LENGTHS.size
+
+        tpxcd = None
+        if tpxcdlnth > 0:
+            code_bytes = ( tpxcdlnth + 7 ) // 8
+            tpxcd = bytes( buffer[offset:(offset + code_bytes)] )
+            offset += code_bytes
+
+        shape = ( layout.band_planes(), layout.nbpc, layout.nbpr )
+        count = layout.block_count()
+
+        def read_offsets( record_length ):
+            nonlocal offset
+            if record_length == 0:
+                return None
+            if record_length != 4:
+                raise ValueError( f'Unsupported mask record length: {record_length}' )
+
+            values = np.frombuffer( buffer, dtype = '>u4', count = count, offset = offset )
+            offset += 4 * count
+
+            offsets = values.astype( np.uint64 )
+            offsets[values == MISSING_BLOCK] = EMPTY_BLOCK
+            return offsets.reshape( shape )
+
+        block_offsets = read_offsets( bmrlnth )
+        pad_offsets   = read_offsets( tmrlnth )
+
+        return Mask_Table( imdatoff      = imdatoff,
+                           bmrlnth       = bmrlnth,
+                           tmrlnth       = tmrlnth,
+                           tpxcdlnth     = tpxcdlnth,
+                           tpxcd         = tpxcd,
+                           block_offsets = block_offsets,
+                           pad_offsets   = pad_offsets )
+
+    @staticmethod
+    def read( read, layout ):
+        '''
+        Read the mask table with a `read( offset, length )` function over the
+        image data.  IMDATOFF is the table size, so only the table is read.
+        '''
+        imdatoff = int.from_bytes( read( 0, 4 ), 'big' )
+        if imdatoff < MASK_PREAMBLE.size:
+            raise ValueError( f'Invalid mask table. IMDATOFF: {imdatoff}' )
+        return Mask_Table.parse( read( 0, imdatoff ), layout )
+
+    def data_offsets( self, layout ):
+        '''
+        Block offsets from the start of the image data, including the mask
+        table, or None if they are not recorded and cannot be computed.
+        '''
+        if self.block_offsets is None:
+            if not layout.is_uncompressed():
+                return None
+            offsets = layout.packed_offsets()
+        else:
+            offsets = self.block_offsets.copy()
+
+        present = offsets != EMPTY_BLOCK
+        offsets[present] += np.uint64( self.imdatoff )
+        return offsets
+
+    def pad_value( self ):
+        '''
+        The transparent (pad) pixel code as an integer, or None if there is
+        none.  The code is stored in the low-order bits of TPXCD.
+        '''
+        if self.tpxcd is None:
+            return None
+        return int.from_bytes( self.tpxcd, 'big' )
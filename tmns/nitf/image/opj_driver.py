@@ -10,58 +10,181 @@
 #
 
 #  Python Libraries
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import os
-import random
-import sys
+import shutil
+import subprocess
 import tempfile
+import threading
 
-#  Pillow
-from skimage import io
-
-import matplotlib
-from matplotlib import pyplot as plt
+import numpy as np
 
 #  Terminus Libraries
-from tmns.nitf.image.driver_base import Driver_Base
+from tmns.nitf.image.driver_base    import Driver_Base
+from tmns.nitf.image.j2k_codestream import ( Codestream,
+                                             decode_window,
+                                             strip_mask,
+                                             trim_image )
+
+
+def is_available( executable = 'opj_decompress' ):
+    '''
+    True if the OpenJPEG command-line decoder is on the path.
+    '''
+    return shutil.which( executable ) is not None
 
 
 class OPJ_Driver(Driver_Base):
+    '''
+    JPEG 2000 (`C8`, `M8`) decoder using the OpenJPEG `opj_decompress` tool.
 
+    `opj_decompress` only reads and writes named files and decodes one image
+    per run, so each decode is a process of its own.  Files are written to
+    memory-backed storage (`/dev/shm`) where it exists, and the output is
+    raw little-endian planes, which are read with `np.fromfile` instead of
+    an image library.  At most `max_workers` processes run at once, both
+    across threads calling `decode` and within `decode_many`, and a failed
+    run raises `RuntimeError` with the tool's error output.
+
+    Config keys, see `default_config()`:
+
+    - `executable`:  Path or name of `opj_decompress`.
+    - `tempdir`:     Directory for the codestream and decoded planes.
+    - `max_workers`: Number of concurrent decodes.
+    - `threads`:     Threads per decode, passed as `-threads`, or None.
+    - `timeout`:     Seconds before a decode is abandoned, or None.
+    '''
     def __init__( self, config: dict = None ):
-        self.config = config
+
+        self.config = self.default_config()
+        if config is not None:
+            self.config.update( config )
+
+        self.slots    = threading.BoundedSemaphore( self.config['max_workers'] )
+        self.executor = None
+        self.lock     = threading.Lock()
+
+    def __getstate__( self ):
+        '''
+        Only the config is pickled, since locks and threads cannot be, so
+        factories holding the driver can be sent to worker processes.
+        '''
+        return { 'config': self.config }
+
+    def __setstate__( self, state ):
+        self.__init__( state['config'] )
 
     def encode( self, code, image ):
         pass
 
-    def decode( self, code, buffer ):
+    def decode( self, code, buffer, subheader = None, reduce = 0, region = None ):
+        '''
+        Decode a codestream.  `reduce` and `region` behave as they do for
+        `Pillow_J2K_Driver`, except that the tiles of a region are decoded
+        together, by one process, as an image of only those tiles.
+        '''
+        layout, buffer = strip_mask( code, buffer, subheader )
+
+        def decode_codestream( data ):
+            codestream = Codestream.scan( lambda offset, length: data[offset:(offset + length)], len(data) )
+            with self.slots:
+                return self.run( data, codestream, reduce )
+
+        if region is not None:
+            return decode_window( buffer, region, reduce, decode_codestream, area = 'window' )
+
+        return trim_image( decode_codestream( buffer ), layout, reduce )
 
-        #  Write the buffer to disk
-        tempdir  = tempfile.gettempdir()
-        temp_j2k = f'{hashlib.sha256(random.randbytes(50)).hexdigest()}.j2k'
-        codestream_path = os.path.join( tempdir, temp_j2k )
+    def decode_many( self, code, buffers, subheaders = None, **kwargs ):
+        '''
+        Decode several codestreams concurrently, returning images in order.
+        '''
+        if subheaders is None:
+            subheaders = [ None ] * len(buffers)
 
-        with open( codestream_path, 'wb' ) as fout:
-            fout.write( buffer )
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor( max_workers = self.config['max_workers'],
+                                                    thread_name_prefix = 'opj_decompress' )
 
-        #  Create System Call to Convert using OpenJPG
-        temp_png = f'{hashlib.sha256(random.randbytes(50)).hexdigest()}.png'
-        png_path = os.path.join( tempdir, temp_png )
+        futures = [ self.executor.submit( self.decode, code, buffer, subheader, **kwargs )
+                    for buffer, subheader in zip( buffers, subheaders ) ]
+        return [ future.result() for future in futures ]
 
-        #print( f'\nCodestream: {codestream_path}\nPNG: {png_path}' )
-        os.system( f'opj_decompress -i {codestream_path} -o {png_path}' )
-        
-        #  Open the new image
-        image = io.imread( png_path, plugin="pil" )
-        
-        #  Delete everything
-        os.remove( codestream_path )
-        os.remove( png_path )
+    def close( self ):
+        '''
+        Stop the worker threads used by `decode_many`.
+        '''
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
 
-        return image
+    def run( self, buffer, codestream, reduce ):
+        '''
+        Run `opj_decompress` on a codestream and read its planes as (rows, cols, bands).
+        '''
+        with tempfile.TemporaryDirectory( dir = self.config['tempdir'], prefix = 'opj_' ) as tempdir:
+
+            input_path  = os.path.join( tempdir, 'input.j2k' )
+            output_path = os.path.join( tempdir, 'output.rawl' )
+            with open( input_path, 'wb' ) as fout:
+                fout.write( buffer )
+
+            command = [ self.config['executable'], '-i', input_path, '-o', output_path ]
+            if reduce > 0:
+                command += [ '-r', str(reduce) ]
+            if self.config['threads'] is not None:
+                command += [ '-threads', str(self.config['threads']) ]
+
+            try:
+                result = subprocess.run( command,
+                                         stdin          = subprocess.DEVNULL,
+                                         capture_output = True,
+                                         timeout        = self.config['timeout'] )
+            except subprocess.TimeoutExpired:
+                raise RuntimeError( f'opj_decompress timed out after {self.config["timeout"]} seconds' )
+
+            if result.returncode != 0 or not os.path.exists( output_path ):
+                message = ( result.stderr or result.stdout ).decode( 'utf8', errors = 'replace' ).strip()
+                raise RuntimeError( f'opj_decompress failed with status {result.returncode}: {message}' )
+
+            return self.read_planes( output_path, codestream, reduce )
+
+    @staticmethod
+    def read_planes( pathname, codestream, reduce ):
+        '''
+        Read the raw planes written by `opj_decompress`, one component after
+        another with 8-bit samples in one byte and deeper ones in two.
+        '''
+        scale  = 1 << reduce
+        nrows  = -(-codestream.ysiz // scale) - -(-codestream.yosiz // scale)
+        ncols  = -(-codestream.xsiz // scale) - -(-codestream.xosiz // scale)
+        bits, signed, _, _ = codestream.components[0]
+
+        if bits > 16:
+            raise ValueError( f'opj_decompress cannot write raw {bits}-bit samples' )
+        dtype = np.dtype( ( 'i' if signed else 'u' ) + ( '1' if bits <= 8 else '2' ) ).newbyteorder( '<' )
+
+        count  = nrows * ncols * codestream.nbands()
+        planes = np.fromfile( pathname, dtype = dtype, count = count )
+        if planes.size != count:
+            raise RuntimeError( f'opj_decompress wrote {planes.size} samples, expected {count}' )
+
+        image = planes.reshape( codestream.nbands(), nrows, ncols ).transpose( 1, 2, 0 )
+        if image.shape[2] == 1:
+            image = image[:, :, 0]
+        return np.ascontiguousarray( image ).astype( dtype.newbyteorder( '=' ), copy = False )
 
     @staticmethod
     def default_config():
-        config = { 'tempdir': tempfile.gettempdir() }
+
+        #  Memory-backed storage keeps the temporary files off the disk
+        tempdir = '/dev/shm' if os.path.isdir( '/dev/shm' ) and os.access( '/dev/shm', os.W_OK ) else tempfile.gettempdir()
+
+        config = { 'executable':  'opj_decompress',
+                   'tempdir':     tempdir,
+                   'max_workers': os.cpu_count() or 1,
+                   'threads':     None,
+                   'timeout':     None }
         return config
-    
@@ -0,0 +1,105 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import io
+
+import numpy as np
+
+#  Pillow
+from PIL import features
+from PIL import Jpeg2KImagePlugin
+
+#  Terminus Libraries
+from tmns.nitf.image.driver_base    import Driver_Base
+from tmns.nitf.image.j2k_codestream import ( Codestream,
+                                             decode_window,
+                                             strip_mask,
+                                             trim_image )
+
+
+def is_available():
+    '''
+    True if Pillow was built with OpenJPEG.
+    '''
+    return features.check( 'jpg_2000' )
+
+
+class Pillow_J2K_Driver(Driver_Base):
+    '''
+    JPEG 2000 (`C8`, `M8`) decoder using Pillow's OpenJPEG plugin.
+
+    The codestream is decoded in memory, without temporary files or a
+    subprocess.  Images are returned as (rows, columns, bands), or (rows,
+    columns) for single-band images.  Pillow supports 1, 3 and 4 components.
+    '''
+    def __init__( self, config: dict = None ):
+        self.config = config
+
+    def encode( self, code, image ):
+        raise NotImplementedError( 'JPEG 2000 encoding is not implemented' )
+
+    def decode( self, code, buffer, subheader = None, reduce = 0, region = None ):
+        '''
+        Decode a codestream.
+
+        `reduce` discards that many wavelet resolution levels, dividing each
+        dimension by `2 ** reduce`.  `region` is (row, column, height, width)
+        at full resolution, and only the tiles which intersect it are
+        decoded.  The result covers the region at the reduced resolution.
+
+        At full resolution tiles are decoded one at a time, so only the
+        region and a tile are allocated.  Pillow cannot reduce an image
+        which does not start at the origin, so reduced regions are decoded
+        as an image from the origin to the end of the region.
+        '''
+        layout, buffer = strip_mask( code, buffer, subheader )
+
+        if region is not None:
+            return decode_window( buffer,
+                                  region,
+                                  reduce,
+                                  lambda data: self.decode_codestream( data, reduce ),
+                                  area = 'tile' if reduce == 0 else 'origin' )
+
+        return trim_image( self.decode_codestream( buffer, reduce ), layout, reduce )
+
+    def decode_codestream( self, buffer, reduce ):
+        '''
+        Decode a whole codestream at the reduced resolution.
+        '''
+        image = self.open( buffer )
+        image.reduce = reduce
+        image.load()
+        return np.asarray( image )
+
+    @staticmethod
+    def open( buffer ):
+        '''
+        Open a codestream held in memory.
+
+        The plugin is used directly, rather than `Image.open`, since its
+        decompression bomb limit is far below the size of many NITF images.
+        '''
+        return Jpeg2KImagePlugin.Jpeg2KImageFile( io.BytesIO( buffer ) )
+
+
+def select_tiles( buffer, region ):
+    '''
+    Build a codestream with only the tiles which intersect a region, given
+    as (row, column, height, width) from the image origin.  Tiles which are
+    left out decode as zeros, and are never entropy decoded.
+    '''
+    def read( offset, length ):
+        return buffer[offset:(offset + length)]
+
+    codestream = Codestream.scan( read, len(buffer) )
+    return codestream.extract( read, codestream.tiles_in_region( *region ) )
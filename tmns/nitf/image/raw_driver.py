@@ -0,0 +1,249 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf.enums             import ImageCompression
+from tmns.nitf.image.driver_base import Driver_Base
+from tmns.nitf.image.layout      import ( EMPTY_BLOCK,
+                                          Image_Layout )
+from tmns.nitf.image.mask        import Mask_Table
+
+
+#  Byte-aligned pixel types, by PVTYPE and NBPP.  NITF pixels are big-endian.
+PIXEL_TYPES = { ( 'INT', 8 ):  '>u1',
+                ( 'INT', 16 ): '>u2',
+                ( 'INT', 32 ): '>u4',
+                ( 'INT', 64 ): '>u8',
+                ( 'SI',  8 ):  '>i1',
+                ( 'SI',  16 ): '>i2',
+                ( 'SI',  32 ): '>i4',
+                ( 'SI',  64 ): '>i8',
+                ( 'R',   32 ): '>f4',
+                ( 'R',   64 ): '>f8',
+                ( 'C',   64 ): '>c8',
+                ( 'C',  128 ): '>c16' }
+
+
+def pixel_dtype( pvtype, nbpp ):
+    '''
+    NumPy type of byte-aligned pixels, or None if pixels are bit-packed.
+    '''
+    dtype = PIXEL_TYPES.get( ( pvtype, nbpp ) )
+    if dtype is not None:
+        return np.dtype( dtype )
+
+    if pvtype in ( 'INT', 'SI', 'B' ) and nbpp < 32:
+        return None
+    raise ValueError( f'Unsupported pixel type. PVTYPE: {pvtype}, NBPP: {nbpp}' )
+
+
+def unpacked_dtype( pvtype, nbpp ):
+    '''
+    NumPy type used for bit-packed pixels once they are unpacked.
+    '''
+    for bits, unsigned, signed in ( ( 8, np.uint8, np.int8 ), ( 16, np.uint16, np.int16 ), ( 32, np.uint32, np.int32 ) ):
+        if nbpp <= bits:
+            return np.dtype( signed if pvtype == 'SI' else unsigned )
+
+
+def unpack_pixels( buffer, offset, count, pvtype, nbpp ):
+    '''
+    Unpack `count` pixels of `nbpp` bits, which are stored most significant bit first.
+    '''
+    nbytes = ( count * nbpp + 7 ) // 8
+    packed = np.frombuffer( buffer, dtype = np.uint8, count = nbytes, offset = offset )
+    bits   = np.unpackbits( packed )[:(count * nbpp)].reshape( count, nbpp )
+
+    weights = np.left_shift( np.uint32( 1 ), np.arange( nbpp - 1, -1, -1, dtype = np.uint32 ) )
+    values  = bits.dot( weights ).astype( np.int64 )
+
+    #  Sign-extend two's complement values
+    if pvtype == 'SI':
+        values[values >= ( 1 << ( nbpp - 1 ) )] -= 1 << nbpp
+
+    return values.astype( unpacked_dtype( pvtype, nbpp ) )
+
+
+class Raw_Driver(Driver_Base):
+    '''
+    Decoder for uncompressed (`NC`) and uncompressed masked (`NM`) images.
+
+    Images are returned as (rows, columns, bands), or (rows, columns) for
+    single-band images.  Byte-aligned pixels are read with `np.frombuffer`,
+    so a single-block image is a view of the segment buffer with the file's
+    big-endian type, which for a memory-mapped file means no copy at all.
+    Multi-block and masked images are assembled with one copy, and bit-packed
+    pixels are unpacked to the smallest integer type which holds them.
+    '''
+    def __init__( self, config: dict = None ):
+        self.config = config
+
+    def encode( self, code, image ):
+        raise NotImplementedError( 'Uncompressed encoding is not implemented' )
+
+    def decode( self, code, buffer, subheader = None ):
+
+        if subheader is None:
+            raise ValueError( f'{code.name} decoding requires the image subheader' )
+
+        layout = Image_Layout.from_subheader( subheader )
+        return self.decode_layout( layout, buffer )
+
+    def decode_layout( self, layout, buffer ):
+
+        #  Masked images start with a table of block offsets
+        base    = 0
+        offsets = None
+        fill    = 0
+        if layout.code == ImageCompression.NM:
+            mask    = Mask_Table.parse( buffer, layout )
+            base    = mask.imdatoff
+            offsets = mask.block_offsets
+            if mask.pad_value() is not None:
+                fill = mask.pad_value()
+
+        dtype = pixel_dtype( layout.pvtype, layout.nbpp )
+        if dtype is not None and offsets is None:
+            image = self.decode_packed( layout, buffer, base, dtype )
+        else:
+            if offsets is None:
+                offsets = layout.packed_offsets()
+            image = self.decode_blocks( layout, buffer, base, offsets, fill )
+
+        image = image[:layout.nrows, :layout.ncols]
+        if image.shape[2] == 1:
+            image = image[:, :, 0]
+        return image
+
+    def decode_packed( self, layout, buffer, base, dtype ):
+        '''
+        Decode byte-aligned blocks stored back to back, as a view where the blocking allows.
+        '''
+        planes = layout.band_planes()
+        shape  = ( planes, layout.nbpc, layout.nbpr ) + self.block_shape( layout )
+        count  = int( np.prod( shape ) )
+
+        blocks = np.frombuffer( buffer, dtype = dtype, count = count, offset = base ).reshape( shape )
+        blocks = self.to_pixel_order( layout, blocks )
+
+        #  (planes, block rows, block cols, rows, cols, bands) to (rows, cols, bands)
+        blocks = blocks.transpose( 1, 3, 2, 4, 0, 5 )
+        return blocks.reshape( layout.nbpc * layout.nppbv,
+                               layout.nbpr * layout.nppbh,
+                               planes * blocks.shape[5] )
+
+    def decode_blocks( self, layout, buffer, base, offsets, fill ):
+        '''
+        Decode each block into a new image, filling blocks which have no data.
+        '''
+        dtype = pixel_dtype( layout.pvtype, layout.nbpp )
+        if dtype is None:
+            dtype = unpacked_dtype( layout.pvtype, layout.nbpp )
+
+        bands = 1 if layout.imode == 'S' else layout.nbands
+        image = np.full( ( layout.nbpc * layout.nppbv, layout.nbpr * layout.nppbh, layout.nbands ),
+                         fill,
+                         dtype = dtype.newbyteorder( '=' ) )
+
+        for plane, block_row, block_col in np.ndindex( offsets.shape ):
+
+            offset = offsets[plane, block_row, block_col]
+            if offset == EMPTY_BLOCK:
+                continue
+
+            row = block_row * layout.nppbv
+            col = block_col * layout.nppbh
+            image[row:(row + layout.nppbv),
+                  col:(col + layout.nppbh),
+                  (plane * bands):((plane + 1) * bands)] = self.decode_block( layout, buffer, base + int( offset ) )
+
+        return image
+
+    def decode_block( self, layout, buffer, offset ):
+        '''
+        Decode the block at an offset into the buffer, as (rows, cols, bands) in the block.
+        '''
+        shape = self.block_shape( layout )
+        count = int( np.prod( shape ) )
+
+        dtype = pixel_dtype( layout.pvtype, layout.nbpp )
+        if dtype is None:
+            block = unpack_pixels( buffer, offset, count, layout.pvtype, layout.nbpp )
+        else:
+            block = np.frombuffer( buffer, dtype = dtype, count = count, offset = offset )
+
+        return self.to_pixel_order( layout, block.reshape( shape ) )
+
+    def read_block_rows( self, layout, read, offset, row0, row1, bands ):
+        '''
+        Read rows `row0` to `row1` of the stored bands `bands` of a block,
+        as (rows, cols, bands).  `read( offset, length )` returns bytes of
+        the image data, and `offset` is where the block starts.
+
+        Rows of byte-aligned blocks are contiguous within each band, so only
+        the requested rows are read.  Bit-packed blocks are read whole.
+        '''
+        dtype = pixel_dtype( layout.pvtype, layout.nbpp )
+        if dtype is None:
+            block = self.decode_block( layout, read( offset, layout.block_bytes() ), 0 )
+            return block[row0:row1, :, bands]
+
+        nrows = row1 - row0
+        stored_bands = 1 if layout.imode == 'S' else layout.nbands
+
+        #  Pixel and row interleaved rows hold every band
+        if layout.imode in ( 'P', 'R' ):
+            row_bytes = layout.nppbh * stored_bands * dtype.itemsize
+            rows = np.frombuffer( read( offset + row0 * row_bytes, nrows * row_bytes ), dtype = dtype )
+            if layout.imode == 'P':
+                rows = rows.reshape( nrows, layout.nppbh, stored_bands )
+            else:
+                rows = rows.reshape( nrows, stored_bands, layout.nppbh ).transpose( 0, 2, 1 )
+            return rows[:, :, bands]
+
+        #  Band sequential blocks are read one band at a time
+        row_bytes  = layout.nppbh * dtype.itemsize
+        band_bytes = layout.nppbv * row_bytes
+        output = np.empty( ( nrows, layout.nppbh, len(bands) ), dtype = dtype )
+        for idx, band in enumerate( bands ):
+            data = read( offset + band * band_bytes + row0 * row_bytes, nrows * row_bytes )
+            output[:, :, idx] = np.frombuffer( data, dtype = dtype ).reshape( nrows, layout.nppbh )
+        return output
+
+    @staticmethod
+    def block_shape( layout ):
+        '''
+        Shape of a block as it is stored, which depends on IMODE.
+        '''
+        bands = 1 if layout.imode == 'S' else layout.nbands
+        if layout.imode == 'P':
+            return ( layout.nppbv, layout.nppbh, bands )
+        if layout.imode == 'R':
+            return ( layout.nppbv, bands, layout.nppbh )
+        if layout.imode in ( 'B', 'S' ):
+            return ( bands, layout.nppbv, layout.nppbh )
+        raise ValueError( f'Unsupported IMODE: {layout.imode}' )
+
+    @staticmethod
+    def to_pixel_order( layout, blocks ):
+        '''
+        Reorder the last three axes of stored blocks to (rows, cols, bands), without copying.
+        '''
+        axes = list( range( blocks.ndim - 3 ) )
+        rows, cols, bands = blocks.ndim - 3, blocks.ndim - 2, blocks.ndim - 1
+        if layout.imode == 'P':
+            return blocks
+        if layout.imode == 'R':
+            return blocks.transpose( axes + [ rows, bands, cols ] )
+        return blocks.transpose( axes + [ cols, bands, rows ] )
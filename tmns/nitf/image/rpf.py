@@ -0,0 +1,214 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Raster Product Format (MIL-STD-2411) location tables, as used by CIB and CADRG frames.
+
+The RPFIMG TRE of an image subheader's extended data starts with a
+location section, which gives the length and absolute file offset of each
+component of the frame:
+
+    location section            >HIHHI  section length, offset of the records from the
+                                        start of the section, record count, record length
+                                        (10), aggregate length of the components
+        one record per component  >HII  component ID, length, file offset
+
+Components are held either by the rest of the RPFIMG data or by the image
+data, and are read from whichever of the two they fall in, so the file
+itself is not needed.
+'''
+
+#  Python Libraries
+import struct
+
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf.imsubhdr import Field as IM_Field
+
+
+#  Section length, component location table offset, record count, record length and aggregate length
+LOCATION_SECTION = struct.Struct( '>HIHHI' )
+
+#  Component ID, length and file offset
+LOCATION_RECORD = struct.Struct( '>HII' )
+
+#  Component IDs
+LOCATION_HEADER_SECTION       = 128
+LOCATION_LOCATION_SECTION     = 129
+LOCATION_COVERAGE_SECTION     = 130
+LOCATION_COMPRESSION_SECTION  = 131
+LOCATION_COMPRESSION_LOOKUP   = 132
+LOCATION_COMPRESSION_PARAMS   = 133
+LOCATION_COLORGRAY_SECTION    = 134
+LOCATION_COLORMAP_SUBSECTION  = 135
+LOCATION_IMAGE_DESCRIPTION    = 136
+LOCATION_IMAGE_DISPLAY_PARAMS = 137
+LOCATION_MASK_SUBSECTION      = 138
+LOCATION_COLOR_CONVERTER      = 139
+LOCATION_SPATIAL_DATA         = 140
+
+#  Colormap offset records, color converter offset records and external color/grayscale filename
+COLORGRAY_SECTION = struct.Struct( '>BB12s' )
+
+#  Colormap offset table offset and colormap offset record length
+COLORMAP_SUBSECTION = struct.Struct( '>IH' )
+
+#  Table ID, number of records, element length, histogram record length, table offset and histogram offset
+COLORMAP_RECORD = struct.Struct( '>HIBHII' )
+
+#  Length of a TRE's CETAG and CEL
+TRE_PREFIX_LENGTH = 11
+
+
+class RPF_Locations:
+    '''
+    Component locations of an RPF frame, by component ID, as (length, file
+    offset), with the file offsets of the RPFIMG data and the image data.
+    '''
+    def __init__( self, components, tre_data, tre_offset, image_offset ):
+
+        self.components   = components
+        self.tre_data     = tre_data
+        self.tre_offset   = tre_offset
+        self.image_offset = image_offset
+
+    def __repr__(self):
+        return ( f'RPF_Locations( Components: {sorted( self.components )}, '
+                 f'RPFIMG: {self.tre_offset}, Image Data: {self.image_offset} )' )
+
+    def __contains__( self, component ):
+        return component in self.components
+
+    def offset( self, component ):
+        '''
+        File offset of a component, or None if it is not located.
+        '''
+        if component not in self.components:
+            return None
+        return self.components[component][1]
+
+    def resolve( self, offset, buffer ):
+        '''
+        The RPFIMG data or image data `buffer` holding a file offset, and
+        the offset within it.
+        '''
+        if self.tre_offset <= offset < self.tre_offset + len(self.tre_data):
+            return self.tre_data, offset - self.tre_offset
+        if self.image_offset <= offset < self.image_offset + len(buffer):
+            return buffer, offset - self.image_offset
+        raise ValueError( f'RPF file offset {offset} is outside the RPFIMG TRE and the image data' )
+
+    def component( self, component, buffer ):
+        '''
+        The buffer holding a component and its offset within it.
+        '''
+        if component not in self.components:
+            raise ValueError( f'RPF component {component} is not located by RPFIMG' )
+        return self.resolve( self.components[component][1], buffer )
+
+    @staticmethod
+    def parse( cedata, tail_length = 0, image_offset = None ):
+        '''
+        Parse the location section at the start of the RPFIMG data.
+        `tail_length` is the length of the TREs following RPFIMG in the
+        subheader, which runs up to the image data at `image_offset`.
+
+        The file offsets of the two are anchored by the image data offset if
+        it is known, otherwise by the location section's own record.
+        '''
+        if len(cedata) < LOCATION_SECTION.size:
+            raise ValueError( f'RPFIMG is too small for a location section. Size: {len(cedata)}' )
+
+        _, records_offset, nrecords, record_length, _ = LOCATION_SECTION.unpack_from( cedata, 0 )
+        if record_length < LOCATION_RECORD.size:
+            raise ValueError( f'Invalid RPF location record length: {record_length}' )
+        if records_offset + nrecords * record_length > len(cedata):
+            raise ValueError( 'RPF location records run past the end of RPFIMG' )
+
+        components = {}
+        for idx in range( nrecords ):
+            component, length, offset = LOCATION_RECORD.unpack_from( cedata, records_offset + idx * record_length )
+            components[component] = ( length, offset )
+
+        #  The image data follows the subheader, whose last TREs follow RPFIMG
+        if image_offset is not None:
+            tre_offset = image_offset - tail_length - len(cedata)
+        elif LOCATION_LOCATION_SECTION in components:
+            tre_offset   = components[LOCATION_LOCATION_SECTION][1]
+            image_offset = tre_offset + len(cedata) + tail_length
+        else:
+            raise ValueError( 'RPF locations need the image data offset or a location section record' )
+
+        return RPF_Locations( components   = components,
+                              tre_data     = cedata,
+                              tre_offset   = tre_offset,
+                              image_offset = image_offset )
+
+    @staticmethod
+    def from_subheader( subheader, image_offset = None ):
+        '''
+        Locations from the RPFIMG TRE of an image subheader's extended data,
+        or None if it has none.  Only the tag, length and data of the TREs
+        are used, so RPFIMG does not need a TRE class.
+
+        The data after RPFIMG is measured from IXSHDL and where RPFIMG
+        starts in the extended data, since a projection may have skipped
+        the TREs which follow it.
+        '''
+        ixshd = subheader.ixshd
+        if not hasattr( ixshd, 'records' ):
+            return None
+
+        tags = ixshd.tags()
+        if 'RPFIMG' not in tags:
+            return None
+
+        idx    = tags.index( 'RPFIMG' )
+        cedata = ixshd.records[idx][2]
+
+        #  IXSHDL counts the 3 byte overflow which starts the extended data
+        ixshdl = subheader.get( IM_Field.IXSHDL )['data'].value()
+        tail   = ixshdl - 3 - ( ixshd.offsets[idx] + TRE_PREFIX_LENGTH + len(cedata) )
+        if tail < 0:
+            raise ValueError( f'RPFIMG runs past the end of the extended subheader data. IXSHDL: {ixshdl}' )
+
+        return RPF_Locations.parse( cedata, tail, image_offset )
+
+
+def read_colormaps( locations, buffer ):
+    '''
+    Color tables of the colormap subsection, as arrays of (colors, element
+    length), in the order of their offset records.  Empty if the frame has
+    no color/grayscale section.
+    '''
+    if LOCATION_COLORGRAY_SECTION not in locations or LOCATION_COLORMAP_SUBSECTION not in locations:
+        return []
+
+    data, offset = locations.component( LOCATION_COLORGRAY_SECTION, buffer )
+    nrecords, _, _ = COLORGRAY_SECTION.unpack_from( data, offset )
+
+    subsection = locations.offset( LOCATION_COLORMAP_SUBSECTION )
+    data, offset = locations.resolve( subsection, buffer )
+    records_offset, record_length = COLORMAP_SUBSECTION.unpack_from( data, offset )
+    if record_length < COLORMAP_RECORD.size:
+        raise ValueError( f'Invalid RPF colormap record length: {record_length}' )
+
+    colormaps = []
+    for idx in range( nrecords ):
+
+        _, ncolors, element_length, _, table_offset, _ = COLORMAP_RECORD.unpack_from( data, offset + records_offset + idx * record_length )
+
+        #  Table offsets are from the start of the colormap subsection
+        table, start = locations.resolve( subsection + table_offset, buffer )
+        colors = np.frombuffer( table, dtype = np.uint8, count = ncolors * element_length, offset = start )
+        colormaps.append( colors.reshape( ncolors, element_length ) )
+
+    return colormaps
@@ -0,0 +1,268 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Vector quantization (`C4`, `M4`) decoder, as used by CIB and CADRG.
+
+The sections of a frame are found through the location section of its
+RPFIMG TRE, as MIL-STD-2411 and MIL-STD-188-199 specify, see `rpf`:
+
+    compression section          (131)  >HHH   algorithm (1 is VQ), lookup records, parameter records
+    compression lookup subsection (132)  >IH    offset of the records (6), record length (14)
+        one record per kernel row         >HIHHI table ID, codes, values per code, bits per value,
+                                                 table offset from the start of the subsection
+        lookup tables                            codes x values per code, 8-bit values
+    color/grayscale section      (134)  colormap subsection (135) with the color tables
+    mask subsection              (138)  a mask table without IMDATOFF
+    spatial data subsection      (140)  the blocks
+
+Each lookup table gives one row of every kernel, so with the usual four
+tables of 4096 codes and four values, each code expands to 4x4 pixels.
+Blocks hold 12-bit codes, two to every three bytes, one row of kernels
+after another.  Unmasked blocks are stored back to back from the start of
+the spatial data, and masked block offsets are from the start of it.  `M4`
+images without a mask subsection use the mask table of the image data.
+
+Compression parameter records are not read.
+'''
+
+#  Python Libraries
+import struct
+
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf.enums             import ImageCompression
+from tmns.nitf.image.driver_base import Driver_Base
+from tmns.nitf.image.layout      import ( EMPTY_BLOCK,
+                                          Image_Layout )
+from tmns.nitf.image.mask        import Mask_Table
+from tmns.nitf.image.rpf         import ( LOCATION_COMPRESSION_LOOKUP,
+                                          LOCATION_COMPRESSION_SECTION,
+                                          LOCATION_MASK_SUBSECTION,
+                                          LOCATION_SPATIAL_DATA,
+                                          RPF_Locations,
+                                          read_colormaps )
+
+
+#  Compression algorithm ID, lookup offset records and parameter offset records
+COMPRESSION_SECTION = struct.Struct( '>HHH' )
+
+#  Offset of the lookup offset records and their length
+LOOKUP_SUBSECTION = struct.Struct( '>IH' )
+
+#  Table ID, number of codes, values per code, bits per value and table offset
+LOOKUP_RECORD = struct.Struct( '>HIHHI' )
+
+VQ_ALGORITHM = 1
+
+CODE_BITS = 12
+
+
+class VQ_Codebook:
+    '''
+    Lookup tables of a VQ image, as an array of (kernel rows, codes, kernel columns).
+    '''
+    def __init__( self, tables ):
+        self.tables = tables
+
+    def __repr__(self):
+        return f'VQ_Codebook( Codes: {self.tables.shape[1]}, Kernel: {self.kernel_rows()}x{self.kernel_cols()} )'
+
+    def kernel_rows( self ):
+        return self.tables.shape[0]
+
+    def kernel_cols( self ):
+        return self.tables.shape[2]
+
+    @staticmethod
+    def parse( locations, buffer ):
+        '''
+        Parse the compression section and lookup subsection located by
+        RPFIMG, reading them from the RPFIMG data or the image `buffer`.
+        '''
+        data, offset = locations.component( LOCATION_COMPRESSION_SECTION, buffer )
+        algorithm, nlookups, _ = COMPRESSION_SECTION.unpack_from( data, offset )
+        if algorithm != VQ_ALGORITHM:
+            raise ValueError( f'Unsupported compression algorithm ID: {algorithm}' )
+        if nlookups == 0:
+            raise ValueError( 'VQ compression section has no lookup tables' )
+
+        subsection = locations.offset( LOCATION_COMPRESSION_LOOKUP )
+        data, offset = locations.component( LOCATION_COMPRESSION_LOOKUP, buffer )
+        records_offset, record_length = LOOKUP_SUBSECTION.unpack_from( data, offset )
+        if record_length < LOOKUP_RECORD.size:
+            raise ValueError( f'Invalid VQ lookup record length: {record_length}' )
+
+        tables = []
+        for idx in range( nlookups ):
+
+            _, ncodes, nvalues, bits, table_offset = LOOKUP_RECORD.unpack_from( data, offset + records_offset + idx * record_length )
+            if bits != 8:
+                raise ValueError( f'Unsupported VQ lookup value length: {bits} bits' )
+
+            #  Table offsets are from the start of the lookup subsection
+            table, start = locations.resolve( subsection + table_offset, buffer )
+            if start + ncodes * nvalues > len(table):
+                raise ValueError( f'VQ lookup table {idx} runs past the end of its data' )
+            table = np.frombuffer( table, dtype = np.uint8, count = ncodes * nvalues, offset = start )
+            tables.append( table.reshape( ncodes, nvalues ) )
+
+        if len( set( table.shape for table in tables ) ) != 1:
+            raise ValueError( 'VQ lookup tables differ in size' )
+
+        return VQ_Codebook( tables = np.stack( tables ) )
+
+    def expand( self, codes ):
+        '''
+        Expand codes shaped (..., code rows, code columns) to pixels shaped
+        (..., code rows x kernel rows, code columns x kernel columns).
+        '''
+        kernels = self.tables[:, codes]
+        ndim    = codes.ndim
+
+        #  (kernel rows, ..., code rows, code cols, kernel cols) to (..., code rows, kernel rows, code cols, kernel cols)
+        order   = list( range( 1, ndim - 1 ) ) + [ ndim - 1, 0, ndim, ndim + 1 ]
+        kernels = kernels.transpose( order )
+        return kernels.reshape( codes.shape[:-2] + ( codes.shape[-2] * self.kernel_rows(),
+                                                     codes.shape[-1] * self.kernel_cols() ) )
+
+
+def unpack_codes( data ):
+    '''
+    Unpack 12-bit codes, two to every three bytes, from an array of bytes
+    whose last axis is a multiple of three long.
+    '''
+    data   = data.reshape( data.shape[:-1] + ( -1, 3 ) ).astype( np.uint16 )
+    codes  = np.empty( data.shape[:-1] + ( 2, ), dtype = np.uint16 )
+    codes[..., 0] = ( data[..., 0] << 4 ) | ( data[..., 1] >> 4 )
+    codes[..., 1] = ( ( data[..., 1] & 0x0F ) << 8 ) | data[..., 2]
+    return codes.reshape( data.shape[:-2] + ( -1, ) )
+
+
+class VQ_Driver(Driver_Base):
+    '''
+    Vector quantized (`C4`, `M4`) decoder.
+
+    Every block is unpacked and expanded at once with NumPy indexing into
+    the codebook, then written into one preallocated image, so there are no
+    loops over pixels or blocks.  Blocks without data take the pad value.
+    Images are single band, and by default the values are indices into the
+    frame's color table.
+
+    RPFIMG locates sections by file offset, so `decode` takes the file
+    offset of the image data as `data_offset`.  Without it the offsets are
+    anchored by the location section's own record.
+
+    Config keys, see `default_config()`:
+
+    - `apply_colormap`: Return the colors of the first color table instead
+                        of indices, as (rows, columns, 3) for color tables
+                        and (rows, columns) for grayscale.
+    '''
+    def __init__( self, config: dict = None ):
+
+        self.config = self.default_config()
+        if config is not None:
+            self.config.update( config )
+
+    def encode( self, code, image ):
+        raise NotImplementedError( 'VQ encoding is not implemented' )
+
+    def decode( self, code, buffer, subheader = None, data_offset = None ):
+
+        if subheader is None:
+            raise ValueError( f'{code.name} decoding requires the image subheader' )
+
+        layout = Image_Layout.from_subheader( subheader )
+        if layout.nbands != 1:
+            raise ValueError( f'VQ images have a single band, not {layout.nbands}' )
+
+        locations = RPF_Locations.from_subheader( subheader, data_offset )
+        if locations is None:
+            raise ValueError( f'{code.name} decoding requires the RPFIMG TRE to locate the compression sections' )
+
+        codebook = VQ_Codebook.parse( locations, buffer )
+        if layout.nppbv % codebook.kernel_rows() != 0 or layout.nppbh % codebook.kernel_cols() != 0:
+            raise ValueError( f'Blocks of {layout.nppbv}x{layout.nppbh} are not whole {codebook.kernel_rows()}x{codebook.kernel_cols()} kernels' )
+
+        code_rows   = layout.nppbv // codebook.kernel_rows()
+        code_cols   = layout.nppbh // codebook.kernel_cols()
+        block_bytes = ( code_rows * code_cols * CODE_BITS + 7 ) // 8
+        if ( code_rows * code_cols ) % 2 != 0:
+            raise ValueError( 'VQ blocks must hold an even number of codes' )
+
+        #  Spatial data is located by RPFIMG, or starts the image data
+        spatial, base = buffer, 0
+        if LOCATION_SPATIAL_DATA in locations:
+            spatial, base = locations.component( LOCATION_SPATIAL_DATA, buffer )
+
+        #  Masks are an RPF mask subsection, or the image data's mask table
+        mask = None
+        if LOCATION_MASK_SUBSECTION in locations:
+            data, offset = locations.component( LOCATION_MASK_SUBSECTION, buffer )
+            mask = Mask_Table.parse( data, layout, offset = offset, imdatoff = 0 )
+        elif code == ImageCompression.M4:
+            mask = Mask_Table.parse( buffer, layout )
+            spatial, base = buffer, mask.imdatoff
+
+        offsets = None
+        fill    = 0
+        if mask is not None:
+            offsets = mask.block_offsets
+            if mask.pad_value() is not None:
+                fill = mask.pad_value()
+
+        if offsets is None:
+            offsets = np.arange( layout.block_count(), dtype = np.uint64 ) * np.uint64( block_bytes )
+        offsets = offsets.reshape( layout.nbpc, layout.nbpr )
+
+        #  Gather the bytes of every block which has data
+        block_rows, block_cols = np.nonzero( offsets != EMPTY_BLOCK )
+        starts = offsets[block_rows, block_cols].astype( np.int64 ) + base
+        data   = np.frombuffer( spatial, dtype = np.uint8 )
+        if len(starts) > 0 and int( starts.max() ) + block_bytes > len(data):
+            raise ValueError( 'VQ block data runs past the end of the image data' )
+        blocks = data[starts[:, None] + np.arange( block_bytes )]
+
+        codes  = unpack_codes( blocks ).reshape( -1, code_rows, code_cols )
+        pixels = codebook.expand( codes )
+
+        image = np.full( ( layout.nbpc * layout.nppbv, layout.nbpr * layout.nppbh ), fill, dtype = np.uint8 )
+        tiled = image.reshape( layout.nbpc, layout.nppbv, layout.nbpr, layout.nppbh ).transpose( 0, 2, 1, 3 )
+        tiled[block_rows, block_cols] = pixels
+
+        image = image[:layout.nrows, :layout.ncols]
+        if self.config['apply_colormap']:
+            image = self.apply_colormap( image, read_colormaps( locations, buffer ) )
+        return image
+
+    @staticmethod
+    def apply_colormap( image, colormaps ):
+        '''
+        Look up each index in the first color table.  Color elements are
+        RGB followed by a monochrome value, and grayscale elements one value.
+        Indices past the table, such as a transparent pad code, become 0.
+        '''
+        if len(colormaps) == 0:
+            raise ValueError( 'VQ image has no color table' )
+
+        colors = colormaps[0][:, :1] if colormaps[0].shape[1] == 1 else colormaps[0][:, :3]
+        colors = np.concatenate( [ colors, np.zeros( ( 256 - min( len(colors), 256 ), colors.shape[1] ), dtype = np.uint8 ) ] )[:256]
+
+        output = colors[image]
+        if output.shape[2] == 1:
+            output = output[:, :, 0]
+        return output
+
+    @staticmethod
+    def default_config():
+        config = { 'apply_colormap': False }
+        return config
@@ -10,33 +10,303 @@
 #
 
 #  Python Libraries
+from contextlib import contextmanager
 
+import numpy as np
 
 #  Terminus Libraries
-from tmns.nitf.enums    import ImageCompression
-from tmns.nitf.imsubhdr import ( Field as IM_Field )
+from tmns.nitf.enums                import ImageCompression
+from tmns.nitf.image.j2k_codestream import Codestream
+from tmns.nitf.image.layout         import ( EMPTY_BLOCK,
+                                             Image_Layout )
+from tmns.nitf.image.mask           import Mask_Table
+from tmns.nitf.image.raw_driver     import ( Raw_Driver,
+                                             pixel_dtype,
+                                             unpacked_dtype )
+from tmns.nitf.imsubhdr             import ( Field as IM_Field )
 
 class Image_Segment:
 
     def __init__( self, subheader = None, 
                         buffer    = None,
-                        factory   = None  ):
+                        factory   = None,
+                        offset    = None,
+                        length    = None,
+                        pathname  = None,
+                        block_offsets = None,
+                        pad_value     = None ):
         '''
         Constructor for Image Segment
+
+        `offset` and `length` locate the image data within the file.  The
+        `buffer` is either a `bytes` copy or a `memoryview` into a memory-mapped file.
+        If no buffer was loaded, the data is read from `pathname` on demand.
+        `block_offsets` is the block offset table and `pad_value` the fill for
+        empty blocks, as stored in a sidecar, if known.
         '''
         self.subheader = subheader
         self.buffer    = buffer
         self.factory   = factory
+        self.offset    = offset
+        self.length    = length
+        self.pathname  = pathname
+        self.block_offsets = block_offsets
+        self.pad_value     = pad_value
+        self.layout        = None
+        self.mask          = None
+        self.codestream    = None
+
+    def release( self ):
+        '''
+        Drop the image buffer, releasing it if it is a view into a memory-mapped file.
+        '''
+        if isinstance( self.buffer, memoryview ):
+            self.buffer.release()
+        self.buffer = None
+
+    def get_buffer( self ):
+        '''
+        Get the image data, reading it from disk if it was not loaded with the headers.
+        '''
+        if self.buffer is not None:
+            return self.buffer
+
+        if self.pathname is None or self.offset is None:
+            raise Exception( 'Image segment has no buffer and no file location' )
+
+        with open( self.pathname, 'rb' ) as fin:
+            fin.seek( self.offset )
+            return fin.read( self.length )
+
+    @contextmanager
+    def open_data( self ):
+        '''
+        Yield a `read( offset, length )` function over the image data, which
+        slices the buffer if one is loaded, otherwise reads from the file.
+        '''
+        if self.buffer is not None:
+            yield lambda offset, length: self.buffer[offset:(offset + length)]
+            return
+
+        if self.pathname is None or self.offset is None:
+            raise Exception( 'Image segment has no buffer and no file location' )
+
+        with open( self.pathname, 'rb' ) as fin:
+
+            def read( offset, length ):
+                fin.seek( self.offset + offset )
+                return fin.read( length )
+
+            yield read
+
+    def get_layout( self ):
+
+        if self.layout is None:
+            self.layout = Image_Layout.from_subheader( self.subheader )
+        return self.layout
+
+    def get_mask( self ):
+        '''
+        Mask table of a masked image, or None if the image is not masked.
+        Only the table itself is read.
+        '''
+        layout = self.get_layout()
+        if self.mask is None and layout.is_masked():
+            with self.open_data() as read:
+                self.mask = Mask_Table.read( read, layout )
+        return self.mask
+
+    def get_block_offsets( self ):
+        '''
+        Offset of each block from the start of the image data, shaped (band
+        planes, block rows, block columns), with `EMPTY_BLOCK` for blocks
+        without data.  None if the offsets are not known without decoding.
+        '''
+        if self.block_offsets is None:
+            layout = self.get_layout()
+            if layout.is_masked():
+                self.block_offsets = self.get_mask().data_offsets( layout )
+            else:
+                self.block_offsets = layout.block_offsets()
+        return self.block_offsets
+
+    def get_pad_value( self ):
+        '''
+        Value of pixels in empty blocks, which is the pad pixel code of a masked image, otherwise 0.
+        '''
+        if self.pad_value is None:
+            mask = self.get_mask()
+            if mask is None or mask.pad_value() is None:
+                self.pad_value = 0
+            else:
+                self.pad_value = mask.pad_value()
+        return self.pad_value
+
+    def codestream_offset( self ):
+        '''
+        Offset of the JPEG 2000 codestream, which follows the mask table of M8 images.
+        '''
+        if self.get_layout().code == ImageCompression.M8:
+            return self.get_mask().imdatoff
+        return 0
+
+    def get_codestream( self ):
+        '''
+        Main header and tile-part table of a JPEG 2000 image, scanned
+        without decoding.  Only the header and tile-part markers are read.
+        '''
+        layout = self.get_layout()
+        if layout.code not in ( ImageCompression.C8, ImageCompression.M8 ):
+            raise ValueError( f'Image is not JPEG 2000. IC: {layout.code.name}' )
+
+        if self.codestream is None:
+            base = self.codestream_offset()
+            size = len(self.buffer) if self.buffer is not None else self.length
+            with self.open_data() as read:
+                self.codestream = Codestream.scan( lambda offset, length: read( base + offset, length ), size - base )
+        return self.codestream
+
+    def read_block( self, block_row, block_col ):
+        '''
+        Read a single block, as (NPPBV, NPPBH, bands), or (NPPBV, NPPBH) for
+        single-band images.  Blocks on the right and bottom edges keep their
+        padding.  Only the block is read from the file.
+        '''
+        layout = self.get_layout()
+        if not ( 0 <= block_row < layout.nbpc and 0 <= block_col < layout.nbpr ):
+            raise IndexError( f'Block ({block_row}, {block_col}) is outside the {layout.nbpc}x{layout.nbpr} blocks' )
+
+        return self.read_region( block_row * layout.nppbv,
+                                 block_col * layout.nppbh,
+                                 layout.nppbv,
+                                 layout.nppbh,
+                                 None )
+
+    def read_window( self, row, col, height, width, bands = None, reduce = 0 ):
+        '''
+        Read a window of the image, as (height, width, bands), or (height,
+        width) if only one band is read.  `bands` selects and orders bands.
+        `reduce` divides the resolution by `2 ** reduce`.
+
+        For uncompressed images only the blocks which intersect the window
+        are read, and for byte-aligned pixels only the rows of those blocks
+        within the window.  JPEG 2000 images only read and decode the
+        intersecting tiles, and discard wavelet levels rather than decimating.
+        '''
+        layout = self.get_layout()
+        if row < 0 or col < 0 or height <= 0 or width <= 0 or row + height > layout.nrows or col + width > layout.ncols:
+            raise ValueError( f'Window ({row}, {col}, {height}, {width}) is outside the {layout.nrows}x{layout.ncols} image' )
+
+        if layout.code in ( ImageCompression.C8, ImageCompression.M8 ):
+
+            if self.factory is None:
+                raise Exception( 'Image segment has no driver factory' )
+
+            #  Only the main header and the tile-parts of the window are read
+            codestream = self.get_codestream()
+            base = self.codestream_offset()
+            with self.open_data() as read:
+                data = codestream.extract( lambda offset, length: read( base + offset, length ),
+                                           codestream.tiles_in_region( row, col, height, width ) )
+
+            output = self.factory.decode( ImageCompression.C8,
+                                          data,
+                                          self.subheader,
+                                          reduce = reduce,
+                                          region = ( row, col, height, width ) )
+            if bands is not None:
+                if output.ndim == 2:
+                    output = output[:, :, None]
+                output = output[:, :, list( bands )]
+                if output.shape[2] == 1:
+                    output = output[:, :, 0]
+            return output
+
+        output = self.read_region( row, col, height, width, bands )
+        if reduce > 0:
+            output = output[::(1 << reduce), ::(1 << reduce)]
+        return output
+
+    def read_region( self, row, col, height, width, bands ):
+
+        layout  = self.get_layout()
+        if not layout.is_uncompressed():
+            raise NotImplementedError( f'Window reads are not supported for IC {layout.code.name}' )
+
+        offsets = self.get_block_offsets()
+        if offsets is None:
+            raise NotImplementedError( f'Block offsets are unknown for IC {layout.code.name}' )
+        driver  = Raw_Driver()
+
+        bands = list( range( layout.nbands ) ) if bands is None else list( bands )
+        dtype = pixel_dtype( layout.pvtype, layout.nbpp )
+        if dtype is None:
+            dtype = unpacked_dtype( layout.pvtype, layout.nbpp )
+        output = np.full( ( height, width, len(bands) ), self.get_pad_value(), dtype = dtype.newbyteorder( '=' ) )
+
+        with self.open_data() as read:
+            for block_row in range( row // layout.nppbv, ( row + height - 1 ) // layout.nppbv + 1 ):
+
+                #  Rows of the window within the block
+                top  = block_row * layout.nppbv
+                row0 = max( row, top ) - top
+                row1 = min( row + height, top + layout.nppbv ) - top
+
+                for block_col in range( col // layout.nppbh, ( col + width - 1 ) // layout.nppbh + 1 ):
+
+                    left = block_col * layout.nppbh
+                    col0 = max( col, left ) - left
+                    col1 = min( col + width, left + layout.nppbh ) - left
+                    target = ( slice( top + row0 - row, top + row1 - row ),
+                               slice( left + col0 - col, left + col1 - col ) )
+
+                    #  With IMODE S each band is its own set of blocks
+                    if layout.imode == 'S':
+                        reads = [ ( band, [ 0 ], [ idx ] ) for idx, band in enumerate( bands ) ]
+                    else:
+                        reads = [ ( 0, bands, list( range( len(bands) ) ) ) ]
+
+                    for plane, stored_bands, output_bands in reads:
+
+                        #  Empty blocks are left as fill, without any I/O
+                        offset = offsets[plane, block_row, block_col]
+                        if offset == EMPTY_BLOCK:
+                            continue
+
+                        offset = int( offset )
+                        pixels = driver.read_block_rows( layout, read, offset, row0, row1, stored_bands )
+                        output[target + ( output_bands, )] = pixels[:, col0:col1]
+
+        if output.shape[2] == 1:
+            output = output[:, :, 0]
+        return output
 
     def as_kvp(self):
         return self.subheader.as_kvp()
-    
-    def get_image( self ):
 
+    def as_mapping(self):
+        return self.subheader.as_mapping()
+    
+    def get_image( self, reduce = 0 ):
+        '''
+        Decode the image.  `reduce` divides the resolution by `2 ** reduce`,
+        by discarding resolution levels of JPEG 2000 images and decimating others.
+        '''
         #  Get the image code
         code = ImageCompression[self.subheader.get( IM_Field.IC )['data'].value()]
         
         if self.factory != None:
-            return self.factory.decode( code, self.buffer )
+            if reduce > 0 and code in ( ImageCompression.C8, ImageCompression.M8 ):
+                return self.factory.decode( code, self.get_buffer(), self.subheader, reduce = reduce )
+
+            #  RPF frames locate their VQ sections by file offset
+            kwargs = {}
+            if code in ( ImageCompression.C4, ImageCompression.M4 ):
+                kwargs['data_offset'] = self.offset
+
+            image = self.factory.decode( code, self.get_buffer(), self.subheader, **kwargs )
+            if reduce > 0:
+                image = image[::(1 << reduce), ::(1 << reduce)]
+            return image
         
         
\ No newline at end of file
@@ -10,7 +10,6 @@
 #
 
 # Python Libraries
-from collections import deque
 from enum import Enum
 import logging
 
@@ -18,6 +17,12 @@ import logging
 from tmns.nitf.tre   import ( TRE_Base,
                               TRE_Factory )
 from tmns.nitf.field_types import FieldType
+from tmns.nitf.mapping     import Header_Mapping
+from tmns.nitf.parse_plan  import ( Field_Run,
+                                    Projection,
+                                    parse_variable )
+from tmns.nitf.utils       import ( Buffer_Reader,
+                                    Field_Index )
 
 class Field(Enum):
     '''
@@ -103,19 +108,52 @@ class Field(Enum):
                  Field.IMAG,    Field.UDIDL,   Field.UDID,    Field.IXSHDL,  Field.IXSHD ]
 
 
+#  Fields needed to walk the subheader and to decode the pixels, which are kept by every projection
+REQUIRED_FIELDS = frozenset( [ Field.NROWS,  Field.NCOLS,  Field.PVTYPE,  Field.ABPP,
+                               Field.NICOM,  Field.IC,     Field.COMRAT,
+                               Field.NBANDS, Field.XBANDS, Field.NLUTS_N, Field.NELUT_N,
+                               Field.IMODE,  Field.NBPR,   Field.NBPC,    Field.NPPBH,
+                               Field.NPPBV,  Field.NBPP,   Field.UDIDL,   Field.IXSHDL ] )
+
+#  TREs needed to decode the pixels, by IC, which are kept by every projection
+REQUIRED_TRES = { 'C4': frozenset( [ 'RPFIMG' ] ),
+                  'M4': frozenset( [ 'RPFIMG' ] ) }
+
+#  Precompiled parse plan.  Each run is read as a single block.
+PREFIX_RUN   = Field_Run( Field.default_list()[:(Field.default_list().index( Field.NICOM ) + 1)], REQUIRED_FIELDS )
+ICOM_RUN     = Field_Run( [ Field.ICOM_N ], REQUIRED_FIELDS )
+IC_RUN       = Field_Run( [ Field.IC ],     REQUIRED_FIELDS )
+COMRAT_RUN   = Field_Run( [ Field.COMRAT ], REQUIRED_FIELDS )
+NBANDS_RUN   = Field_Run( [ Field.NBANDS ], REQUIRED_FIELDS )
+XBANDS_RUN   = Field_Run( [ Field.XBANDS ], REQUIRED_FIELDS )
+BAND_RUN     = Field_Run( [ Field.IREPBAND_N, Field.ISUBCAT_N, Field.IFC_N, Field.IMFLT_N, Field.NLUTS_N ], REQUIRED_FIELDS )
+NELUT_RUN    = Field_Run( [ Field.NELUT_N ], REQUIRED_FIELDS )
+BLOCKING_RUN = Field_Run( Field.default_list()[Field.default_list().index( Field.ISYNC ):(Field.default_list().index( Field.UDIDL ) + 1)], REQUIRED_FIELDS )
+IXSHDL_RUN   = Field_Run( [ Field.IXSHDL ], REQUIRED_FIELDS )
+
+
 class Image_Subheader:
 
     def __init__( self, data, udid, ixshd ):
         self.data  = data
         self.udid  = udid
         self.ixshd = ixshd
+        self.index = Field_Index( data )
 
-    def get( self, field ):
+    def get( self, field, index = 0 ):
+        return self.index.get( field, index )
 
-        for k in self.data.keys():
-            if self.data[k]['field'] == field:
-                return self.data[k]
-        return None
+    def count( self, field ):
+        '''
+        Number of entries for a repeated field.
+        '''
+        return self.index.count( field )
+
+    def as_mapping(self):
+        '''
+        Read-only view with the keys of `as_kvp()`, whose values are looked up on access.
+        '''
+        return Header_Mapping( self, Field, ( 'udid', 'ixshd' ) )
 
     def as_kvp(self):
 
@@ -168,153 +206,115 @@ class Image_Subheader:
     
     
     @staticmethod
-    def parse_binary( file_handle, logger = None, tre_factory = None ):
+    def parse_binary( file_handle, logger = None, tre_factory = None, length = None, projection = None ):
+        '''
+        Parse the image subheader from a file handle.
+
+        If the subheader `length` (LISH_N) is known, the subheader is read in
+        one call and parsed from memory.  Otherwise it is read one run at a time.
+
+        If a `Projection` is provided, only the selected fields and TREs are kept.
+        '''
+        if length is None:
+            return Image_Subheader.parse_reader( file_handle,
+                                                 logger      = logger,
+                                                 tre_factory = tre_factory,
+                                                 projection  = projection )
+
+        buffer = file_handle.read( length )
+        if len(buffer) != length:
+            raise Exception( f'Reached end of file before end of image subheader. Bytes Read: {len(buffer)}, Bytes Requested: {length}' )
+
+        return Image_Subheader.parse_buffer( buffer,
+                                             logger      = logger,
+                                             tre_factory = tre_factory,
+                                             projection  = projection )
+
+    @staticmethod
+    def parse_buffer( buffer, logger = None, tre_factory = None, projection = None ):
 
         if logger is None:
-            logger = logging.getLogger( 'tmns.nitf.imgseg.Image_Subheader.parse_binary' )
+            logger = logging.getLogger( 'tmns.nitf.imgseg.Image_Subheader.parse_buffer' )
+
+        reader = Buffer_Reader( buffer )
+        subheader = Image_Subheader.parse_reader( reader,
+                                                  logger      = logger,
+                                                  tre_factory = tre_factory,
+                                                  projection  = projection )
+        if reader.remaining() > 0:
+            logger.warning( f'Image subheader has {reader.remaining()} unparsed bytes' )
+
+        return subheader
+
+    @staticmethod
+    def parse_reader( reader, logger = None, tre_factory = None, projection = None ):
+
+        if logger is None:
+            logger = logging.getLogger( 'tmns.nitf.imgseg.Image_Subheader.parse_reader' )
 
         if tre_factory == None:
             tre_factory = TRE_Factory.default()
 
+        if projection is None:
+            projection = Projection()
+
         data = {}
 
-        #  Read block by block
-        fields = deque(Field.default_list())
-        offset = 0
-        size_queue = deque()
-        nbands = None
-        xbands = None
-        nluts  = None
-        nelut = None
-        udid_tres = []
-        ixshd_tres = []
+        #  Fixed fields through the number of image comments
+        nicom = PREFIX_RUN.parse( reader, data, projection.mask( PREFIX_RUN ) )['data'].value()
+        icom_mask = projection.mask( ICOM_RUN )
+        for _ in range( nicom ):
+            ICOM_RUN.parse( reader, data, icom_mask )
+
+        #  Comrat doesn't work for NC and NM
+        ic_val = IC_RUN.parse( reader, data, projection.mask( IC_RUN ) )['data'].value()
+        if ic_val != 'NC' and ic_val != 'NM':
+            COMRAT_RUN.parse( reader, data, projection.mask( COMRAT_RUN ) )
+
+        # Image Band Data
+        nbands = NBANDS_RUN.parse( reader, data, projection.mask( NBANDS_RUN ) )['data'].value()
+        xbands = -1
+        if nbands == 0:
+            xbands = XBANDS_RUN.parse( reader, data, projection.mask( XBANDS_RUN ) )['data'].value()
+
+        band_mask  = projection.mask( BAND_RUN )
+        nelut_mask = projection.mask( NELUT_RUN )
+        for _ in range( max( nbands, xbands ) ):
 
-        while len(fields) > 0:
-
-            add_entry = True
-
-            #  Grab next field
-            field = fields.popleft()
-
-            #  Get field data
-            fld = Field(field).value
-
-            field_pos       = offset
-            field_length    = fld[1]
-            field_type      = fld[2]
-            field_default   = fld[3]
-            field_is_fixed  = fld[4]
-            field_name      = fld[5]
-            logger.debug( f'Processing ID {field_pos}, Name: {field}, Len: {field_length}')
-
-            if field_length == 0 and len(size_queue) > 0:
-                field_length = size_queue.popleft()
-
-            #  Read a block of data
-            field_data = file_handle.read( field_length )
-            if len(field_data) != field_length:
-                raise Exception( f'Reached end of file before field. Field: {field}, Bytes Read: {len(field_data)}, Bytes Requested: {fld[1]}' )
-            
-            #  Convert to appropriate type
-            field_type = FieldType.to_type( field_type )
-            new_entry = { 'name': Field(field).name,
-                          'field': field,
-                          'type': field_type,
-                          'data': field_type(field_data, field_length) }
-            logging.debug( f'    -> Value: [{new_entry["data"].value()}]' )
-
-            #  Number of Image Comments
-            if field == Field.NICOM:
-                nicom = new_entry['data'].value()
-                for _ in range( nicom ):
-                    fields.appendleft( Field.ICOM_N  )
-            
-            #  Comrat doesn't work for NC and NM
-            if field == Field.IC:
-
-                ic_val = new_entry['data'].value()
-                if ic_val == 'NC' or ic_val == 'NM':
-                    pass
-                else:
-                    fields.appendleft( Field.COMRAT )
-
-
-            # Image Band Data
-            if field == Field.NBANDS:
-                nbands = new_entry['data'].value()
-                if nbands == 0:
-                    fields.appendleft( Field.XBANDS )
-                else:
-                    xbands = -1
-
-            if field == Field.XBANDS:
-                xbands = new_entry['data'].value()
-
-            if ( field == Field.NBANDS and nbands != 0 ) or field == Field.XBANDS:
-                
-                val = max( nbands, xbands )
-                for idx in range( val ):
-                    fields.appendleft( Field.NLUTS_N )
-                    fields.appendleft( Field.IMFLT_N )
-                    fields.appendleft( Field.IFC_N )
-                    fields.appendleft( Field.ISUBCAT_N )
-                    fields.appendleft( Field.IREPBAND_N )
-            
             # Band LUTs
-            if field == Field.NLUTS_N:
-                nluts = new_entry['data'].value()
-                if nluts > 0:
-                    fields.appendleft( Field.NELUT_N )
-
-            if field == Field.NELUT_N:
-                nluts = data[offset-1]['data'].value()
-                nelut = new_entry['data'].value()
-
-                total = nluts * nelut
-                size_queue.appendleft( total )
-
-                fields.appendleft( Field.LUTD_N_M )
-
-            if field == Field.ISYNC:
-                nluts = None
-                nelut = None
-
-            #  User Defined Data
-            if field == Field.UDIDL:
-                udidl = new_entry['data'].value()
-
-                #  The overflow only counts if we max the user defined section
-                if udidl == 99999:
-                    fields.appendleft( Field.UDOFL )
-                size_queue.append( udidl )
-            
-            #  User Defined Image Data TREs
-            if field == Field.UDID:
-                udid_data = new_entry['data'].data[3:]
-                udid_tres  = TRE_Base.parse_binary( udid_data,
-                                                    factory = tre_factory )
-                add_entry = False
-            
-            #  Image Extended Subheader
-            if field == Field.IXSHDL:
-                ixshdl = new_entry['data'].value()
-
-                #  The overflow only counts if we max the user defined section
-                if ixshdl == 99999:
-                    fields.appendleft( Field.IXSOFL )
-                size_queue.append( ixshdl )
-            
-            # Image Extended Subheader Data
-            if field == Field.IXSHD:
-                ixshd_data = new_entry['data'].data[3:]
-                ixshd_tres = TRE_Base.parse_binary( ixshd_data,
-                                                    factory = tre_factory )
-                add_entry = False
-
-            if add_entry:
-                data[offset] = new_entry
-                offset += 1
+            nluts = BAND_RUN.parse( reader, data, band_mask )['data'].value()
+            if nluts > 0:
+                nelut = NELUT_RUN.parse( reader, data, nelut_mask )['data'].value()
+                lutd  = parse_variable( reader, Field.LUTD_N_M, nluts * nelut )
+                if projection.keep_field( Field.LUTD_N_M ):
+                    data[len(data)] = lutd
+
+        #  Fixed fields through the user defined data length
+        udidl = BLOCKING_RUN.parse( reader, data, projection.mask( BLOCKING_RUN ) )['data'].value()
+
+        #  User Defined Image Data TREs, which start with the 3 byte overflow
+        udid_tres = []
+        if udidl > 0:
+            udid = parse_variable( reader, Field.UDID, udidl )
+            if projection.keep_tres():
+                udid_tres = TRE_Base.parse_binary( udid['data'].data[3:],
+                                                   factory = tre_factory,
+                                                   tags    = projection.tres )
+
+        # Image Extended Subheader Data, which starts with the 3 byte overflow
+        ixshd_tags = projection.tres
+        if ixshd_tags is not None and ic_val in REQUIRED_TRES:
+            ixshd_tags = ixshd_tags | REQUIRED_TRES[ic_val]
+
+        ixshd_tres = []
+        ixshdl = IXSHDL_RUN.parse( reader, data, projection.mask( IXSHDL_RUN ) )['data'].value()
+        if ixshdl > 0:
+            ixshd = parse_variable( reader, Field.IXSHD, ixshdl )
+            if ixshd_tags is None or len(ixshd_tags) > 0:
+                ixshd_tres = TRE_Base.parse_binary( ixshd['data'].data[3:],
+                                                    factory = tre_factory,
+                                                    tags    = ixshd_tags )
 
         return Image_Subheader( data = data,
                                 udid  = udid_tres,
-                                ixshd = ixshd_tres )
\ No newline at end of file
+                                ixshd = ixshd_tres )
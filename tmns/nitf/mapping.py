@@ -0,0 +1,166 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Python Libraries
+from collections.abc import Mapping
+
+
+class Header_Mapping(Mapping):
+    '''
+    Read-only view of a header with the same keys and values as its `as_kvp()`.
+
+    Fields are keyed by name, and TRE fields by `<section>.<CETAG>.<FIELD>`.
+    Values are resolved on lookup, so getting one value never flattens the
+    header.  As with `as_kvp()`, the last of a repeated field or TRE wins.
+    '''
+    def __init__( self, header, field_enum, sections ):
+
+        self.header     = header
+        self.field_enum = field_enum
+        self.sections   = sections
+
+        #  Flattened TREs, so iterating a TRE's fields flattens it once
+        self.tre_kvps = {}
+
+    def tre_tags( self, tre_list ):
+        '''
+        Tags of a TRE list, as in `as_kvp()` keys, without building the TREs.
+        '''
+        if tre_list is None:
+            return []
+        if hasattr( tre_list, 'records' ):
+            return [ record[0].decode('utf8') for record in tre_list.records ]
+        return [ tre.cetag() for tre in tre_list ]
+
+    def tre_kvp( self, section, tre_list, idx ):
+
+        kvp = self.tre_kvps.get( ( section, idx ) )
+        if kvp is None:
+            kvp = tre_list[idx].as_kvp()
+            self.tre_kvps[( section, idx )] = kvp
+        return kvp
+
+    def __getitem__( self, key ):
+
+        #  Header fields
+        if '.' not in key:
+            field = self.field_enum.__members__.get( key )
+            if field is None:
+                raise KeyError( key )
+
+            count = self.header.count( field )
+            if count == 0:
+                raise KeyError( key )
+            return str( self.header.get( field, index = count - 1 )['data'] )
+
+        #  TRE fields, which are looked up from the last TRE with the tag
+        parts = key.split( '.', 2 )
+        if len(parts) != 3 or parts[0] not in self.sections:
+            raise KeyError( key )
+
+        section, cetag, name = parts
+        tre_list = getattr( self.header, section )
+        tags = self.tre_tags( tre_list )
+        for idx in range( len(tags) - 1, -1, -1 ):
+            if tags[idx] == cetag:
+                kvp = self.tre_kvp( section, tre_list, idx )
+                if name in kvp:
+                    return str( kvp[name] )
+        raise KeyError( key )
+
+    def __iter__( self ):
+
+        seen = set()
+        for entry in self.header.data.values():
+            name = entry.field.name
+            if name not in seen:
+                seen.add( name )
+                yield name
+
+        for section in self.sections:
+            tre_list = getattr( self.header, section )
+            tags = self.tre_tags( tre_list )
+            for idx in range( len(tags) ):
+                for name in self.tre_kvp( section, tre_list, idx ):
+                    key = f'{section}.{tags[idx]}.{name}'
+                    if key not in seen:
+                        seen.add( key )
+                        yield key
+
+    def __len__( self ):
+        return sum( 1 for _ in self )
+
+    def __contains__( self, key ):
+
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+
+class NITF_Mapping(Mapping):
+    '''
+    Read-only view of a NITF with the same keys and values as `NITF_Container.as_kvp()`.
+
+    Keys are `file_header.<KEY>` and `image_segment.<INDEX>.<KEY>`, where
+    `<KEY>` is a `Header_Mapping` key.  Views of each header are created on
+    first use.
+    '''
+    def __init__( self, nitf ):
+
+        self.nitf = nitf
+        self.views = {}
+
+    def view( self, idx ):
+        '''
+        Header view of the file header (`None`) or an image segment.
+        '''
+        view = self.views.get( idx )
+        if view is None:
+            if idx is None:
+                view = self.nitf.file_header.as_mapping()
+            else:
+                view = self.nitf.image_segments[idx].subheader.as_mapping()
+            self.views[idx] = view
+        return view
+
+    def __getitem__( self, key ):
+
+        if key.startswith( 'file_header.' ):
+            return self.view( None )[key[len('file_header.'):]]
+
+        if key.startswith( 'image_segment.' ):
+            parts = key.split( '.', 2 )
+            if len(parts) == 3 and parts[1].isdigit() and int( parts[1] ) < len( self.nitf.image_segments ):
+                return self.view( int( parts[1] ) )[parts[2]]
+
+        raise KeyError( key )
+
+    def __iter__( self ):
+
+        for key in self.view( None ):
+            yield f'file_header.{key}'
+
+        for idx in range( len( self.nitf.image_segments ) ):
+            for key in self.view( idx ):
+                yield f'image_segment.{idx}.{key}'
+
+    def __len__( self ):
+        return sum( 1 for _ in self )
+
+    def __contains__( self, key ):
+
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
@@ -0,0 +1,131 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Terminus Libraries
+from tmns.nitf.field_types import Field_Entry
+
+
+class Field_Run:
+    '''
+    A run of consecutive, fixed-length fields.
+
+    The offsets of each field are computed once, so the run is read with a
+    single call.  Fields are not decoded during the parse.  Each entry records
+    its location in the block and decodes itself on first access.
+    '''
+    def __init__( self, fields, required = () ):
+
+        self.fields = list(fields)
+        self.layout = []
+
+        #  Fields needed to walk the structure are kept by every projection
+        self.required = tuple( field in required for field in self.fields )
+
+        offset = 0
+        for field in self.fields:
+
+            field_length = field.value[1]
+            if field_length <= 0:
+                raise ValueError( f'Field {field.name} is variable-length and cannot be part of a run' )
+
+            self.layout.append( ( field, offset, field_length ) )
+            offset += field_length
+
+        self.size = offset
+
+    def __repr__(self):
+        return f'Field_Run( {[ field.name for field in self.fields ]}, Size: {self.size} )'
+
+    def parse( self, reader, data, mask = None ):
+        '''
+        Read the run and append an entry per field to `data`.
+
+        If a `mask` from a `Projection` is provided, only fields flagged in
+        the mask get an entry.  Returns the entry of the last field, even if
+        it was not kept, since it is usually a count needed to continue the parse.
+        '''
+        block = reader.read( self.size )
+        if len(block) != self.size:
+            raise Exception( f'Reached end of file before field. Fields: {[ field.name for field in self.fields ]}, Bytes Read: {len(block)}, Bytes Requested: {self.size}' )
+
+        counter = len(data)
+        new_entry = None
+        if mask is None:
+            for field, start, field_length in self.layout:
+
+                new_entry = Field_Entry( field, None, block, start, field_length )
+                data[counter] = new_entry
+                counter += 1
+
+        else:
+            for ( field, start, field_length ), keep in zip( self.layout, mask ):
+
+                new_entry = Field_Entry( field, None, block, start, field_length )
+                if keep:
+                    data[counter] = new_entry
+                    counter += 1
+
+        return new_entry
+
+
+class Projection:
+    '''
+    The header fields and TREs a caller needs.
+
+    `fields` may mix members of the file header and image subheader `Field`
+    enums.  The fields needed to walk the structure of the file are always
+    kept.  `tres` is a list of TRE tags.  TREs with other tags are skipped
+    without being built.  `None` keeps everything.
+    '''
+    def __init__( self, fields = None, tres = None ):
+
+        self.fields = None
+        if fields is not None:
+            self.fields = frozenset( fields )
+
+        self.tres = None
+        if tres is not None:
+            self.tres = frozenset( tag.strip() for tag in tres )
+
+        self.masks = {}
+
+    def mask( self, run ):
+        '''
+        Flags for which fields of a run to keep, or None to keep all of them.
+        '''
+        if self.fields is None:
+            return None
+
+        mask = self.masks.get( id(run) )
+        if mask is None:
+            mask = tuple( required or field in self.fields for field, required in zip( run.fields, run.required ) )
+            self.masks[id(run)] = mask
+        return mask
+
+    def keep_field( self, field ):
+        return self.fields is None or field in self.fields
+
+    def keep_tres( self ):
+        '''
+        False if no TREs were requested, so extension sections can be skipped entirely.
+        '''
+        return self.tres is None or len(self.tres) > 0
+
+
+def parse_variable( reader, field, field_length ):
+    '''
+    Read a single field whose length comes from an earlier field.
+    '''
+    field_data = reader.read( field_length )
+    if len(field_data) != field_length:
+        raise Exception( f'Reached end of file before field. Field: {field}, Bytes Read: {len(field_data)}, Bytes Requested: {field_length}' )
+
+    return Field_Entry( field, buffer = field_data, length = field_length )
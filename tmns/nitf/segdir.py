@@ -0,0 +1,119 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+
+#  Terminus Libraries
+from tmns.nitf.enums import Segment_Type
+from tmns.nitf.fhdr  import Field as FHDR_Field
+
+
+#  Count, subheader-length and data-length fields for each segment type, in file order
+SEGMENT_FIELDS = [ ( Segment_Type.IMAGE,   FHDR_Field.NUMI,    FHDR_Field.LISH_N,  FHDR_Field.LI_N ),
+                   ( Segment_Type.GRAPHIC, FHDR_Field.NUMS,    FHDR_Field.LSSH_N,  FHDR_Field.LS_N ),
+                   ( Segment_Type.TEXT,    FHDR_Field.NUMT,    FHDR_Field.LTSH_N,  FHDR_Field.LT_N ),
+                   ( Segment_Type.DES,     FHDR_Field.NUMDES,  FHDR_Field.LDSH_N,  FHDR_Field.LD_N ),
+                   ( Segment_Type.RES,     FHDR_Field.NUM_RES, FHDR_Field.LRESH_N, FHDR_Field.LRE_N ) ]
+
+
+class Segment_Entry:
+    '''
+    Location of a single segment's subheader and data within the file.
+    '''
+    def __init__( self, segment_type, index, subheader_offset, subheader_length, data_offset, data_length ):
+
+        self.segment_type     = segment_type
+        self.index            = index
+        self.subheader_offset = subheader_offset
+        self.subheader_length = subheader_length
+        self.data_offset      = data_offset
+        self.data_length      = data_length
+
+    def end( self ):
+        return self.data_offset + self.data_length
+
+    def __repr__(self):
+        return ( f'Segment_Entry( {self.segment_type.name}, Index: {self.index}, '
+                 f'Subheader: {self.subheader_offset} +{self.subheader_length}, '
+                 f'Data: {self.data_offset} +{self.data_length} )' )
+
+
+class Segment_Directory:
+    '''
+    Absolute offsets and lengths of every segment in a NITF, in file order.
+    '''
+    def __init__( self, header_length, entries ):
+
+        self.header_length = header_length
+        self.entries       = entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def segments( self, segment_type = None ):
+
+        if segment_type is None:
+            return list(self.entries)
+        return [ entry for entry in self.entries if entry.segment_type == segment_type ]
+
+    def get( self, segment_type, index = 0 ):
+
+        for entry in self.entries:
+            if entry.segment_type == segment_type and entry.index == index:
+                return entry
+        return None
+
+    def file_length( self ):
+        '''
+        Expected length of the file, which should agree with FL.
+        '''
+        if len(self.entries) == 0:
+            return self.header_length
+        return self.entries[-1].end()
+
+    def __str__(self):
+
+        output  = f'Segment Directory: (total: {len(self.entries)}, header length: {self.header_length})\n'
+        for entry in self.entries:
+            output += f'   - {entry}\n'
+        return output
+
+    @staticmethod
+    def from_file_header( fhdr ):
+        '''
+        Build the directory from the segment lengths in the file header.
+        '''
+        offset = fhdr.get( FHDR_Field.HL )['data'].value()
+        header_length = offset
+
+        entries = []
+        for segment_type, count_field, subheader_field, data_field in SEGMENT_FIELDS:
+
+            count_entry = fhdr.get( count_field )
+            if count_entry is None:
+                continue
+
+            for idx in range( count_entry['data'].value() ):
+
+                subheader_length = fhdr.get( subheader_field, index = idx )['data'].value()
+                data_length      = fhdr.get( data_field,      index = idx )['data'].value()
+
+                entries.append( Segment_Entry( segment_type     = segment_type,
+                                               index            = idx,
+                                               subheader_offset = offset,
+                                               subheader_length = subheader_length,
+                                               data_offset      = offset + subheader_length,
+                                               data_length      = data_length ) )
+                offset += subheader_length + data_length
+
+        return Segment_Directory( header_length = header_length,
+                                  entries       = entries )
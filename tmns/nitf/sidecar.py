@@ -0,0 +1,260 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Sidecar index files (`.nitfidx`), which let a NITF be re-opened without walking its structure.
+
+All integers are little-endian.  The file is laid out as
+
+    Preamble        magic, version, flags, source size and mtime, header
+                    length, segment count, image count
+    Segment table   per segment: type, index, subheader offset and length,
+                    data offset and length
+    Image table     per image segment: band planes, block rows, block
+                    columns, the offset of its block table (0 if none), and
+                    the pad value of empty blocks
+    Header bytes    the raw file header, then each image subheader
+    Block tables    per image segment, uint64 block offsets relative to the
+                    start of the image data, 8-byte aligned.  Empty blocks
+                    of masked images are `EMPTY_BLOCK`, and offsets include
+                    the mask table.
+'''
+
+#  Python Libraries
+import os
+import struct
+import threading
+
+import numpy as np
+
+#  Terminus Libraries
+from tmns.nitf.enums        import Segment_Type
+from tmns.nitf.fhdr         import File_Header
+from tmns.nitf.imsubhdr     import Image_Subheader
+from tmns.nitf.segdir       import ( Segment_Directory,
+                                     Segment_Entry )
+
+
+SIDECAR_EXTENSION = '.nitfidx'
+
+MAGIC   = b'NITFIDX\x00'
+VERSION = 2
+
+PREAMBLE = struct.Struct( '<8sHHQqQII' )
+SEGMENT  = struct.Struct( '<BxxxIQQQQ' )
+IMAGE    = struct.Struct( '<IIIxxxxQQ' )
+
+
+def sidecar_path( pathname ):
+    return pathname + SIDECAR_EXTENSION
+
+
+class Sidecar:
+    '''
+    Segment table, raw header bytes and block offset tables of a NITF.
+    '''
+    def __init__( self, source_size, source_mtime_ns, directory, header_bytes, subheader_bytes, block_tables, pad_values = None ):
+
+        self.source_size     = source_size
+        self.source_mtime_ns = source_mtime_ns
+        self.directory       = directory
+        self.header_bytes    = header_bytes
+        self.subheader_bytes = subheader_bytes
+        self.block_tables    = block_tables
+        self.pad_values      = pad_values
+
+        if self.pad_values is None:
+            self.pad_values = [ 0 ] * len(block_tables)
+
+    def __repr__(self):
+        return ( f'Sidecar( Source Size: {self.source_size}, Segments: {len(self.directory)}, '
+                 f'Images: {len(self.subheader_bytes)} )' )
+
+    def is_current( self, stat ):
+        '''
+        True if the sidecar was built from the file as it is now.
+        '''
+        return self.source_size == stat.st_size and self.source_mtime_ns == stat.st_mtime_ns
+
+    def headers( self, logger = None, tre_factory = None, projection = None ):
+        '''
+        Parse the stored header bytes, returning `( file_header, image_subheaders, segment_directory )`.
+        '''
+        fhdr = File_Header.parse_buffer( self.header_bytes,
+                                         logger      = logger,
+                                         tre_factory = tre_factory,
+                                         projection  = projection )
+
+        subheaders = [ Image_Subheader.parse_buffer( buffer,
+                                                     logger      = logger,
+                                                     tre_factory = tre_factory,
+                                                     projection  = projection ) for buffer in self.subheader_bytes ]
+
+        return ( fhdr, subheaders, self.directory )
+
+    @staticmethod
+    def from_container( pathname, nitf, stat = None ):
+        '''
+        Build a sidecar for a loaded NITF.  Only the header byte ranges, and
+        the mask tables of masked images, are re-read from the file.
+        '''
+        if stat is None:
+            stat = os.stat( pathname )
+
+        directory = nitf.segment_directory
+        with open( pathname, 'rb' ) as fin:
+
+            header_bytes = fin.read( directory.header_length )
+
+            subheader_bytes = []
+            for entry in directory.segments( Segment_Type.IMAGE ):
+                fin.seek( entry.subheader_offset )
+                subheader_bytes.append( fin.read( entry.subheader_length ) )
+
+        block_tables = []
+        pad_values   = []
+        for segment in nitf.image_segments:
+            block_tables.append( segment.get_block_offsets() )
+            pad_values.append( segment.get_pad_value() )
+
+        return Sidecar( source_size     = stat.st_size,
+                        source_mtime_ns = stat.st_mtime_ns,
+                        directory       = directory,
+                        header_bytes    = header_bytes,
+                        subheader_bytes = subheader_bytes,
+                        block_tables    = block_tables,
+                        pad_values      = pad_values )
+
+    def to_bytes( self ):
+
+        entries = list( self.directory )
+        output  = bytearray( PREAMBLE.pack( MAGIC,
+                                            VERSION,
+                                            0,
+                                            self.source_size,
+                                            self.source_mtime_ns,
+                                            self.directory.header_length,
+                                            len(entries),
+                                            len(self.subheader_bytes) ) )
+
+        for entry in entries:
+            output += SEGMENT.pack( entry.segment_type.value,
+                                    entry.index,
+                                    entry.subheader_offset,
+                                    entry.subheader_length,
+                                    entry.data_offset,
+                                    entry.data_length )
+
+        #  Block tables follow the header bytes, so their offsets are known up front
+        table_offset = len(output) + IMAGE.size * len(self.block_tables) + len(self.header_bytes)
+        table_offset += sum( len(buffer) for buffer in self.subheader_bytes )
+
+        tables = bytearray()
+        for table, pad_value in zip( self.block_tables, self.pad_values ):
+
+            if table is None:
+                output += IMAGE.pack( 0, 0, 0, 0, pad_value )
+                continue
+
+            padding = -(table_offset + len(tables)) % 8
+            tables += bytes( padding )
+            output += IMAGE.pack( *table.shape, table_offset + len(tables), pad_value )
+            tables += table.astype( '<u8' ).tobytes()
+
+        output += self.header_bytes
+        for buffer in self.subheader_bytes:
+            output += buffer
+        output += tables
+
+        return bytes( output )
+
+    @staticmethod
+    def from_bytes( buffer ):
+
+        if len(buffer) < PREAMBLE.size:
+            raise ValueError( f'Sidecar is too small. Size: {len(buffer)}' )
+
+        magic, version, _, source_size, source_mtime_ns, header_length, nsegments, nimages = PREAMBLE.unpack_from( buffer, 0 )
+        if magic != MAGIC:
+            raise ValueError( f'Not a NITF sidecar. Magic: {magic}' )
+        if version != VERSION:
+            raise ValueError( f'Unsupported sidecar version: {version}. Expected: {VERSION}' )
+
+        offset = PREAMBLE.size
+        entries = []
+        for _ in range( nsegments ):
+            seg_type, index, sh_offset, sh_length, data_offset, data_length = SEGMENT.unpack_from( buffer, offset )
+            entries.append( Segment_Entry( segment_type     = Segment_Type( seg_type ),
+                                           index            = index,
+                                           subheader_offset = sh_offset,
+                                           subheader_length = sh_length,
+                                           data_offset      = data_offset,
+                                           data_length      = data_length ) )
+            offset += SEGMENT.size
+
+        images = []
+        for _ in range( nimages ):
+            images.append( IMAGE.unpack_from( buffer, offset ) )
+            offset += IMAGE.size
+
+        header_bytes = bytes( buffer[offset:(offset + header_length)] )
+        offset += header_length
+
+        subheader_bytes = []
+        for entry in entries:
+            if entry.segment_type == Segment_Type.IMAGE:
+                subheader_bytes.append( bytes( buffer[offset:(offset + entry.subheader_length)] ) )
+                offset += entry.subheader_length
+
+        block_tables = []
+        pad_values   = []
+        for planes, rows, cols, table_offset, pad_value in images:
+            pad_values.append( pad_value )
+            if table_offset == 0:
+                block_tables.append( None )
+                continue
+            count = planes * rows * cols
+            table = np.frombuffer( buffer, dtype = '<u8', count = count, offset = table_offset )
+            block_tables.append( table.astype( np.uint64 ).reshape( planes, rows, cols ) )
+
+        if len(header_bytes) != header_length or len(subheader_bytes) != nimages:
+            raise ValueError( 'Sidecar is truncated' )
+
+        return Sidecar( source_size     = source_size,
+                        source_mtime_ns = source_mtime_ns,
+                        directory       = Segment_Directory( header_length = header_length,
+                                                             entries       = entries ),
+                        header_bytes    = header_bytes,
+                        subheader_bytes = subheader_bytes,
+                        block_tables    = block_tables,
+                        pad_values      = pad_values )
+
+    def write( self, pathname ):
+        '''
+        Write the sidecar, replacing any existing one atomically.
+        '''
+        #  Unique per thread, so concurrent writers never share a temp file
+        temp_path = f'{pathname}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open( temp_path, 'wb' ) as fout:
+                fout.write( self.to_bytes() )
+            os.replace( temp_path, pathname )
+        except BaseException:
+            if os.path.exists( temp_path ):
+                os.remove( temp_path )
+            raise
+
+    @staticmethod
+    def read( pathname ):
+        '''
+        Read a sidecar with a single read.
+        '''
+        with open( pathname, 'rb' ) as fin:
+            return Sidecar.from_bytes( fin.read() )
@@ -136,22 +136,11 @@ class Field(Enum):
 class BANDSB( TRE_Base ):
 
     def __init__( self, data ):
-        self.data = data
+        super().__init__( data )
 
     def __str__(self):
         return self.to_log_string()
     
-    def get( self, field, index = 0 ):
-
-        counter = 0
-        for k in self.data.keys():
-            if self.data[k]['field'] == field:
-                if counter == index:
-                    return self.data[k]
-                else:
-                    counter += 1
-        return None
-    
     def cetag(self):
         return self.get( Field.CETAG )['data'].value()
     
@@ -10,11 +10,14 @@
 #
 
 #  Python Libraries
+from collections.abc import Sequence
 from enum import Enum
 import logging
 
 #  Terminus Libraries
-from tmns.nitf.field_types import FieldType
+from tmns.nitf.field_types import ( Field_Entry,
+                                    FieldType )
+from tmns.nitf.utils       import Field_Index
 
 class Field(Enum):
     CETAG  = (  0,  6, FieldType.BCS_A,  None,  'Unique Extension Type Identifier' )
@@ -26,10 +29,63 @@ class Field(Enum):
         return [ Field.CETAG, Field.CEL, Field.CEDATA ]
     
                 
+class TRE_List(Sequence):
+    '''
+    The TREs of an extension section.
+
+    Only the tag and length of each TRE are read while parsing the header.
+    The factory builds a TRE the first time it is accessed.
+
+    `offsets` holds where each TRE starts in the extension data, after the
+    overflow, which still holds when TREs were skipped while parsing.  By
+    default the records are taken to be the whole section, back to back.
+    '''
+    def __init__( self, records, factory, offsets = None ):
+
+        self.records = records
+        self.factory = factory
+        self.tres    = [ None ] * len(records)
+
+        if offsets is None:
+            offsets = []
+            offset  = 0
+            for cetag, cel, cedata in records:
+                offsets.append( offset )
+                offset += len(cetag) + len(cel) + len(cedata)
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__( self, idx ):
+
+        if isinstance( idx, slice ):
+            return [ self[x] for x in range( *idx.indices( len(self) ) ) ]
+
+        tre = self.tres[idx]
+        if tre is None:
+            cetag, cel, cedata = self.records[idx]
+            tre = self.factory.build( cetag  = cetag,
+                                      cel    = cel,
+                                      cedata = cedata )
+            self.tres[idx] = tre
+        return tre
+
+    def tags(self):
+        '''
+        TRE tags, without building the TREs.
+        '''
+        return [ record[0].decode('utf8').strip() for record in self.records ]
+
+    def __repr__(self):
+        return f'TRE_List( {self.tags()} )'
+
+
 class TRE_Base:
 
     def __init__( self, data ):
-        self.data = data
+        self.data  = data
+        self.index = Field_Index( data )
 
     def __str__(self):
         '''
@@ -38,15 +94,13 @@ class TRE_Base:
         self.to_log_string()   
 
     def get( self, field, index = 0 ):
+        return self.index.get( field, index )
 
-        counter = 0
-        for k in self.data.keys():
-            if self.data[k]['field'] == field:
-                if counter == index:
-                    return self.data[k]
-                else:
-                    counter += 1
-        return None
+    def count( self, field ):
+        '''
+        Number of entries for a repeated field.
+        '''
+        return self.index.count( field )
     
     def cetag(self):
         return self.get( Field.CETAG )['data'].value()
@@ -78,10 +132,7 @@ class TRE_Base:
 
         tp = FieldType.to_type( field_type )
 
-        new_entry = { 'name':  field.name,
-                      'field': field,
-                      'type':  field_type,
-                      'data':  tp(buffer[0:field_length], field_length) }
+        new_entry = Field_Entry( field, tp(buffer[0:field_length], field_length) )
         
         return new_entry, buffer[field_length:]
     
@@ -97,31 +148,26 @@ class TRE_Base:
         #  Setup CETAG
         field_length = Field(Field.CETAG).value[1]
         field_type   = FieldType.to_type( Field(Field.CETAG).value[2] )
-        data[0] = { 'name':  Field(Field.CETAG).name,
-                    'field': Field.CETAG,
-                    'type':  field_type,
-                    'data':  field_type(cetag, field_length) }
+        data[0] = Field_Entry( Field.CETAG, field_type(cetag, field_length) )
         
         #  Setup CEL
         field_length = Field(Field.CEL).value[1]
         field_type   = FieldType.to_type( Field(Field.CEL).value[2] )
-        data[1] = { 'name':  Field(Field.CEL).name,
-                    'field': Field.CEL,
-                    'type':  field_type,
-                    'data':  field_type(cel, field_length) }
+        data[1] = Field_Entry( Field.CEL, field_type(cel, field_length) )
         
         #  Setup CETAG
         field_length = Field(Field.CEDATA).value[1]
         field_type = FieldType.to_type( Field(Field.CEDATA).value[2] )
-        data[2] = { 'name':  Field(Field.CEDATA).name,
-                    'field': Field.CEDATA,
-                    'type':  field_type,
-                    'data':  field_type(cedata, field_length) }
+        data[2] = Field_Entry( Field.CEDATA, field_type(cedata, field_length) )
 
         return TRE_Base( data )
 
     @staticmethod
-    def parse_binary( buffer, logger = None, factory = None ):
+    def parse_binary( buffer, logger = None, factory = None, tags = None ):
+        '''
+        Split an extension section into TREs.  If `tags` is provided, TREs
+        with other tags are skipped.
+        '''
 
         if logger is None:
             logger = logging.getLogger( 'tmns.nitf.fhdr.FileHeader.parse_binary' )
@@ -129,12 +175,14 @@ class TRE_Base:
         if factory is None:
             factory = TRE_Factory.default()
 
-        tre_list = []
+        records = []
+        offsets = []
 
         #  Start iterating over the blocks
         idx = 0
         while idx < len(buffer):
 
+            start = idx
             cetag = buffer[idx:(idx + Field.CETAG.value[1])]
             idx += Field.CETAG.value[1]
 
@@ -145,8 +193,10 @@ class TRE_Base:
             cedata = buffer[idx:(idx + cel_value)]
             idx += cel_value
 
-            tre_list.append( factory.build( cetag  = cetag,
-                                            cel    = cel,
-                                            cedata = cedata ) )
+            if tags is not None and cetag.decode('utf8').strip() not in tags:
+                continue
+
+            records.append( ( cetag, cel, cedata ) )
+            offsets.append( start )
 
-        return tre_list
\ No newline at end of file
+        return TRE_List( records, factory, offsets )
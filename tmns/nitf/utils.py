@@ -12,6 +12,50 @@
 #  Pretty ASCII Table API
 from prettytable import PrettyTable
 
+class Field_Index:
+    '''
+    Map from each field to the keys of its entries in a parsed header or TRE, in order.
+
+    The map is built on the first lookup, so headers which are never queried
+    do not pay for it.
+    '''
+    __slots__ = ( 'data', 'positions' )
+
+    def __init__( self, data ):
+
+        self.data      = data
+        self.positions = None
+
+    def build( self ):
+
+        positions = {}
+        for k, entry in self.data.items():
+            keys = positions.get( entry.field )
+            if keys is None:
+                positions[entry.field] = [ k ]
+            else:
+                keys.append( k )
+        self.positions = positions
+
+    def get( self, field, position = 0 ):
+        '''
+        Get the `position`-th entry for `field`, or None if there is not one.
+        '''
+        if self.positions is None:
+            self.build()
+
+        keys = self.positions.get( field )
+        if keys is None or position >= len(keys):
+            return None
+        return self.data[keys[position]]
+
+    def count( self, field ):
+
+        if self.positions is None:
+            self.build()
+        return len( self.positions.get( field, () ) )
+
+
 class BitSet:
 
     def __init__( self, num_bits, initial_value: int = None ):
@@ -49,3 +93,40 @@ class BitSet:
             return f'{self.value}, Bits: {self.bits}'
         
 
+
+
+class Buffer_Reader:
+    '''
+    Cursor over an in-memory buffer which provides the `read`, `seek` and `tell`
+    calls the header parsers use on file handles.
+    '''
+    def __init__( self, buffer, offset: int = 0 ):
+
+        self.view   = memoryview( buffer )
+        self.offset = offset
+
+    def read( self, size: int = -1 ):
+
+        if size is None or size < 0:
+            end = len(self.view)
+        else:
+            end = min( self.offset + size, len(self.view) )
+
+        output = self.view[self.offset:end].tobytes()
+        self.offset = max( self.offset, end )
+        return output
+
+    def seek( self, offset: int, whence: int = 0 ):
+
+        if whence == 1:
+            offset += self.offset
+        elif whence == 2:
+            offset += len(self.view)
+        self.offset = offset
+        return self.offset
+
+    def tell( self ):
+        return self.offset
+
+    def remaining( self ):
+        return max( len(self.view) - self.offset, 0 )